@@ -19,6 +19,11 @@ class LRUCache:
     Methods:
     - get(key): Get value (mark as recently used)
     - put(key, value): Put key-value (evict LRU if at capacity)
+
+    Solution: the cache implementations live in one place, 4_hash_tables:
+    - module6_lru_cache.LRUCache_Solution (this problem)
+    - module11_cache_policies.make_cache('lru' | '2q' | 'arc' | 'w-tinylfu',
+      capacity) for the same get/put API with scan-resistant eviction
     """
 
     def __init__(self, capacity):
@@ -0,0 +1,619 @@
+"""
+Module 11: Cache Eviction Policies - Interactive Practice
+=========================================================
+
+One get/put API, several eviction policies:
+- LRU       (module6_lru_cache.LRUCache_Solution)
+- 2Q        (probation FIFO + ghost keys + main LRU)
+- ARC       (Adaptive Replacement Cache, self-tuning recency/frequency split)
+- W-TinyLFU (small LRU window + frequency-filtered segmented LRU)
+
+All caches: get(key) → value or -1, put(key, value), len(cache).
+Pick one by name with make_cache('arc', capacity).
+
+Why not just LRU: a single scan over N > capacity cold keys pushes
+every hot key out, and the cache is empty of useful data right after.
+"""
+
+from array import array
+from collections import OrderedDict
+
+from module6_lru_cache import LRUCache_Solution
+
+# =============================================================================
+# PART 1: WHY LRU FAILS ON SCANS
+# =============================================================================
+
+"""
+CONCEPT: Recency vs Frequency
+=============================
+
+Capacity 4, hot keys A B C D used constantly, then a scan 1..6:
+
+    LRU after scan:  [6 5 4 3]      ← every hot key evicted by one-time keys
+    Ideal:           [A B C D]      ← scan keys were never going to be reused
+
+Fixes all share one idea: a new key must PROVE it is worth keeping
+before it can push out keys with a history.
+
+    2Q:        new keys enter a small FIFO (A1in); only a key seen again
+               after leaving it (remembered in the ghost list A1out)
+               reaches the main LRU (Am)
+    ARC:       T1 (seen once) and T2 (seen twice+), plus ghost lists B1/B2
+               of recently evicted keys; a ghost hit in B1 grows T1's
+               share p, a ghost hit in B2 shrinks it
+    W-TinyLFU: every access is counted in a count-min sketch; a key leaving
+               the 1% LRU window only enters the main cache if its
+               estimated frequency beats the main cache's eviction victim
+
+Ghost entries hold keys only (no values), so history is cheap.
+"""
+
+
+# =============================================================================
+# PART 2: 2Q
+# =============================================================================
+
+class TwoQueueCache:
+    """
+    2Q cache (Johnson & Shasha, full version)
+
+    - A1in: FIFO of first-time keys, about 25% of capacity
+    - A1out: ghost FIFO of keys evicted from A1in, about 50% of capacity
+    - Am: LRU of keys seen again while in A1out
+
+    Example:
+    --------
+    cache = TwoQueueCache(100)
+    cache.put(1, 'a')    # enters A1in
+    cache.get(1)         # 'a' (a hit in A1in does not promote)
+
+    TODO: Implement get, put and the eviction (reclaim) step
+    """
+
+    def __init__(self, capacity):
+        pass
+
+    def get(self, key):
+        pass
+
+    def put(self, key, value):
+        pass
+
+
+# TEACHER'S SOLUTION:
+class TwoQueueCache_Solution:
+    """2Q with OrderedDicts as the FIFO / LRU lists"""
+
+    def __init__(self, capacity, in_ratio=0.25, out_ratio=0.5):
+        self.capacity = capacity
+        self.in_capacity = max(1, int(capacity * in_ratio))
+        self.out_capacity = max(1, int(capacity * out_ratio))
+        self.a1in = OrderedDict()    # key -> value, oldest first
+        self.a1out = OrderedDict()   # key -> None (ghosts)
+        self.am = OrderedDict()      # key -> value, LRU first
+
+    def get(self, key):
+        if key in self.am:
+            self.am.move_to_end(key)
+            return self.am[key]
+        # A1in hits stay put: correlated re-reads right after a miss
+        # should not count as proof of popularity
+        return self.a1in.get(key, -1)
+
+    def put(self, key, value):
+        if key in self.am:
+            self.am[key] = value
+            self.am.move_to_end(key)
+        elif key in self.a1in:
+            self.a1in[key] = value
+        elif key in self.a1out:
+            del self.a1out[key]
+            self._reclaim()
+            self.am[key] = value
+        else:
+            self._reclaim()
+            self.a1in[key] = value
+
+    def _reclaim(self):
+        """Free one slot if the cache is full"""
+        if len(self.a1in) + len(self.am) < self.capacity:
+            return
+        if len(self.a1in) > self.in_capacity or not self.am:
+            old_key, _ = self.a1in.popitem(last=False)
+            self.a1out[old_key] = None
+            if len(self.a1out) > self.out_capacity:
+                self.a1out.popitem(last=False)
+        else:
+            self.am.popitem(last=False)
+
+    def __len__(self):
+        return len(self.a1in) + len(self.am)
+
+
+# =============================================================================
+# PART 3: ARC (ADAPTIVE REPLACEMENT CACHE)
+# =============================================================================
+
+class ARCCache:
+    """
+    ARC (Megiddo & Modha)
+
+    - T1: keys seen once recently, T2: keys seen at least twice
+    - B1, B2: ghosts of keys evicted from T1, T2
+    - p: target size of T1, adapted on every ghost hit
+
+    Example:
+    --------
+    cache = ARCCache(100)
+    cache.put(1, 'a')    # T1
+    cache.get(1)         # 'a', moves 1 to T2
+
+    TODO: Implement get, put and replace()
+    """
+
+    def __init__(self, capacity):
+        pass
+
+    def get(self, key):
+        pass
+
+    def put(self, key, value):
+        pass
+
+
+# TEACHER'S SOLUTION:
+class ARCCache_Solution:
+    """ARC; the four lists are OrderedDicts, LRU end first"""
+
+    def __init__(self, capacity):
+        self.capacity = capacity
+        self.p = 0.0                 # Target size of T1
+        self.t1 = OrderedDict()      # key -> value
+        self.t2 = OrderedDict()      # key -> value
+        self.b1 = OrderedDict()      # key -> None
+        self.b2 = OrderedDict()      # key -> None
+
+    def get(self, key):
+        if key in self.t1:
+            self.t2[key] = self.t1.pop(key)  # Second access: promote
+            return self.t2[key]
+        if key in self.t2:
+            self.t2.move_to_end(key)
+            return self.t2[key]
+        return -1
+
+    def _replace(self, key):
+        """Evict one resident key into its ghost list"""
+        if len(self.t1) + len(self.t2) < self.capacity:
+            return
+        if self.t1 and (len(self.t1) > self.p or (key in self.b2 and len(self.t1) == self.p)):
+            old_key, _ = self.t1.popitem(last=False)
+            self.b1[old_key] = None
+        else:
+            old_key, _ = self.t2.popitem(last=False)
+            self.b2[old_key] = None
+
+    def put(self, key, value):
+        c = self.capacity
+        if key in self.t1:
+            del self.t1[key]
+            self.t2[key] = value
+        elif key in self.t2:
+            self.t2[key] = value
+            self.t2.move_to_end(key)
+        elif key in self.b1:
+            # Recency ghost hit: T1 was too small
+            self.p = min(c, self.p + max(len(self.b2) / len(self.b1), 1))
+            self._replace(key)
+            del self.b1[key]
+            self.t2[key] = value
+        elif key in self.b2:
+            # Frequency ghost hit: T2 was too small
+            self.p = max(0.0, self.p - max(len(self.b1) / len(self.b2), 1))
+            self._replace(key)
+            del self.b2[key]
+            self.t2[key] = value
+        else:
+            l1 = len(self.t1) + len(self.b1)
+            if l1 == c:
+                if len(self.t1) < c:
+                    self.b1.popitem(last=False)
+                    self._replace(key)
+                else:
+                    self.t1.popitem(last=False)
+            elif l1 < c:
+                total = l1 + len(self.t2) + len(self.b2)
+                if total >= c:
+                    if total == 2 * c:
+                        self.b2.popitem(last=False)
+                    self._replace(key)
+            self.t1[key] = value
+
+    def __len__(self):
+        return len(self.t1) + len(self.t2)
+
+
+# =============================================================================
+# PART 4: W-TINYLFU WITH A COUNT-MIN SKETCH
+# =============================================================================
+
+"""
+CONCEPT: Count-Min Sketch
+=========================
+
+Approximate frequency counts in fixed memory: depth rows of width
+counters, one hash per row.
+
+    increment(key): counter[row][h_row(key)] += 1 for every row
+    estimate(key):  min over rows of counter[row][h_row(key)]
+
+Collisions only ever ADD counts, so the minimum is the best guess and
+never an underestimate.
+
+- Counters saturate at 15 (4 bits is enough to compare popularity)
+- Aging: after sample_size increments every counter is halved, so
+  yesterday's hot keys fade (one bytes.translate call)
+
+Memory: depth * width bytes, e.g. 4 x 4096 = 16KB for a 1000-entry cache,
+whatever the number of distinct keys seen.
+"""
+
+_FIBONACCI = 0x9E3779B97F4A7C15
+_MASK64 = (1 << 64) - 1
+_HALVE = bytes(i >> 1 for i in range(256))
+_NO_KEY = object()
+
+
+class CountMinSketch:
+    """
+    Saturating 8-bit count-min sketch with periodic halving
+
+    Example:
+        sketch = CountMinSketch(width=1024)
+        sketch.increment('a'); sketch.increment('a')
+        sketch.estimate('a')     # 2 (or more, never less)
+    """
+
+    MAX_COUNT = 15
+
+    def __init__(self, width, depth=4, sample_size=None):
+        self.width = 1 << max(4, (width - 1).bit_length())
+        self.mask = self.width - 1
+        self.depth = depth
+        self.table = bytearray(self.depth * self.width)
+        self.sample_size = sample_size if sample_size is not None else 10 * self.width
+        self.additions = 0
+        self.row_starts = range(0, self.depth * self.width, self.width)
+
+    def _slots(self, key):
+        # Double hashing: row r uses h1 + r * h2, both halves of one
+        # Fibonacci-mixed 64-bit hash (h2 odd, so rows differ)
+        h = (hash(key) * _FIBONACCI) & _MASK64
+        h1, h2, mask = h >> 32, h | 1, self.mask
+        slots = []
+        for start in self.row_starts:
+            slots.append(start + (h1 & mask))
+            h1 += h2
+        return slots
+
+    def estimate(self, key):
+        table = self.table
+        return min([table[i] for i in self._slots(key)])
+
+    def increment(self, key):
+        table = self.table
+        for i in self._slots(key):
+            if table[i] < self.MAX_COUNT:
+                table[i] += 1
+        self.additions += 1
+        if self.additions >= self.sample_size:
+            self.table = bytearray(self.table.translate(_HALVE))
+            self.additions //= 2
+
+    def nbytes(self):
+        return len(self.table)
+
+
+class WTinyLFUCache:
+    """
+    W-TinyLFU (Einziger, Friedman & Manes; the Caffeine policy)
+
+    - Window: LRU with ~1% of capacity, absorbs bursts of new keys
+    - Main: segmented LRU (probation 20%, protected 80%)
+    - Admission: a key pushed out of the window replaces the probation
+      victim only if the sketch says it is more popular
+
+    TODO: Implement get, put and admission
+    """
+
+    def __init__(self, capacity):
+        pass
+
+    def get(self, key):
+        pass
+
+    def put(self, key, value):
+        pass
+
+
+# TEACHER'S SOLUTION:
+class WTinyLFUCache_Solution:
+    """W-TinyLFU over OrderedDicts and a CountMinSketch"""
+
+    def __init__(self, capacity, window_ratio=0.01, protected_ratio=0.8):
+        self.capacity = capacity
+        self.window_capacity = max(1, int(capacity * window_ratio))
+        self.main_capacity = capacity - self.window_capacity
+        self.protected_capacity = int(self.main_capacity * protected_ratio)
+        self.window = OrderedDict()
+        self.probation = OrderedDict()
+        self.protected = OrderedDict()
+        self.sketch = CountMinSketch(width=4 * max(capacity, 16))
+        self.missed_key = _NO_KEY   # Counted by the last get, which missed
+
+    def _touch(self, key):
+        """Move a resident key up its queue; returns False if absent"""
+        if key in self.window:
+            self.window.move_to_end(key)
+        elif key in self.protected:
+            self.protected.move_to_end(key)
+        elif key in self.probation:
+            # Second chance earned: promote, demoting protected's LRU if full
+            self.protected[key] = self.probation.pop(key)
+            if len(self.protected) > self.protected_capacity:
+                demoted, value = self.protected.popitem(last=False)
+                self.probation[demoted] = value
+        else:
+            return False
+        return True
+
+    def get(self, key):
+        self.sketch.increment(key)
+        if not self._touch(key):
+            self.missed_key = key
+            return -1
+        self.missed_key = _NO_KEY
+        for segment in (self.window, self.protected, self.probation):
+            if key in segment:
+                return segment[key]
+
+    def put(self, key, value):
+        # Count once per access: a cache-aside put right after its get
+        # missed is the same access, already counted
+        if key != self.missed_key:
+            self.sketch.increment(key)
+        self.missed_key = _NO_KEY
+        for segment in (self.window, self.probation, self.protected):
+            if key in segment:
+                segment[key] = value
+                self._touch(key)
+                return
+
+        self.window[key] = value
+        if len(self.window) > self.window_capacity:
+            self._admit(*self.window.popitem(last=False))
+
+    def _admit(self, candidate, value):
+        """Window overflow: candidate enters main only if it beats the victim"""
+        if len(self.probation) + len(self.protected) < self.main_capacity:
+            self.probation[candidate] = value
+            return
+        victims = self.probation or self.protected
+        if not victims:
+            return  # No main cache at all (capacity 1)
+        victim = next(iter(victims))
+        if self.sketch.estimate(candidate) > self.sketch.estimate(victim):
+            del victims[victim]
+            self.probation[candidate] = value
+
+    def __len__(self):
+        return len(self.window) + len(self.probation) + len(self.protected)
+
+
+# =============================================================================
+# PART 5: PLUGGABLE POLICIES AND TRACE REPLAY
+# =============================================================================
+
+CACHE_POLICIES = {
+    'lru': LRUCache_Solution,
+    '2q': TwoQueueCache_Solution,
+    'arc': ARCCache_Solution,
+    'w-tinylfu': WTinyLFUCache_Solution,
+}
+
+
+def make_cache(policy, capacity):
+    """
+    Build a cache by policy name
+
+    Example:
+        cache = make_cache('w-tinylfu', 10000)
+        cache.put(key, value); cache.get(key)
+    """
+    try:
+        return CACHE_POLICIES[policy](capacity)
+    except KeyError:
+        raise ValueError(f"unknown policy {policy!r}, expected one of {sorted(CACHE_POLICIES)}") from None
+
+
+def zipf_trace(n, keys, alpha=0.99, seed=0):
+    """n accesses over keys 0..keys-1, P(rank k) ∝ 1 / (k+1)^alpha"""
+    import random
+    from itertools import accumulate
+
+    rng = random.Random(seed)
+    cumulative = list(accumulate(1.0 / (k + 1) ** alpha for k in range(keys)))
+    # Shuffle rank -> key so popularity is not correlated with key order
+    ids = list(range(keys))
+    rng.shuffle(ids)
+    return array('q', (ids[k] for k in rng.choices(range(keys), cum_weights=cumulative, k=n)))
+
+
+def scan_trace(n, keys, scan_length, scan_every, alpha=0.99, seed=0):
+    """
+    Zipfian trace interrupted by full scans over a cold key range
+
+    Every scan_every accesses, scan keys keys..keys+scan_length-1 are read
+    in order (the periodic full-table scan); they never repeat in between.
+    """
+    base = zipf_trace(n, keys, alpha, seed)
+    trace = array('q')
+    scan = range(keys, keys + scan_length)
+    for start in range(0, n, scan_every):
+        trace.extend(base[start:start + scan_every])
+        trace.extend(scan)
+    return trace
+
+
+def replay(cache, trace):
+    """Cache-aside replay: get, and put on a miss. Returns hit count."""
+    hits = 0
+    get, put = cache.get, cache.put
+    for key in trace:
+        if get(key) == -1:
+            put(key, key)
+        else:
+            hits += 1
+    return hits
+
+
+def benchmark_cache_policies(capacity=1000, n=200000, keys=50000, policies=None, seed=0):
+    """
+    Hit ratio and ops/sec of each policy on a Zipfian and a scan-mixed trace
+
+    Returns {(trace_name, policy): (hit_ratio, ops_per_sec)}
+    """
+    import time
+
+    traces = {
+        'zipf': zipf_trace(n, keys, seed=seed),
+        'zipf+scan': scan_trace(n, keys, scan_length=3 * capacity, scan_every=10 * capacity, seed=seed),
+    }
+    results = {}
+    for trace_name, trace in traces.items():
+        print(f"\n{trace_name} ({len(trace):,} accesses, capacity {capacity:,}):")
+        for policy in policies or CACHE_POLICIES:
+            cache = make_cache(policy, capacity)
+            began = time.perf_counter()
+            hits = replay(cache, trace)
+            elapsed = time.perf_counter() - began
+            assert len(cache) <= capacity
+            results[trace_name, policy] = (hits / len(trace), len(trace) / elapsed)
+            print(f"  {policy:10s} hit ratio {hits / len(trace):6.1%}   {len(trace) / elapsed:10,.0f} ops/s")
+    return results
+
+
+# =============================================================================
+# PART 6: TESTING
+# =============================================================================
+
+def test_cache_policies():
+    """Test every policy against the shared get/put contract"""
+    import random
+
+    print("=" * 60)
+    print("CACHE POLICIES TEST SUITE")
+    print("=" * 60)
+
+    # Test 1: Contract - values round-trip, capacity is never exceeded
+    print("\nTEST 1: Shared get/put Contract")
+    print("-" * 60)
+    rng = random.Random(11)
+    for policy in CACHE_POLICIES:
+        for capacity in (1, 2, 5, 64):
+            cache = make_cache(policy, capacity)
+            latest = {}
+            for _ in range(3000):
+                key = rng.randrange(3 * capacity + 2)
+                if rng.random() < 0.4:
+                    latest[key] = rng.randrange(1000)
+                    cache.put(key, latest[key])
+                else:
+                    value = cache.get(key)
+                    assert value == -1 or value == latest[key], (policy, capacity, key)
+                assert len(cache) <= capacity, (policy, capacity)
+        cache = make_cache(policy, 4)
+        cache.put('a', 1)
+        cache.put('a', 2)
+        assert cache.get('a') == 2 and len(cache) == 1
+        print(f"{policy:10s} ok")
+    try:
+        make_cache('fifo', 10)
+        assert False, "unknown policy must be rejected"
+    except ValueError:
+        pass
+
+    # Test 2: ARC adapts p on ghost hits
+    print("\nTEST 2: ARC Adaptation")
+    print("-" * 60)
+    arc = ARCCache_Solution(2)
+    arc.put(1, 1)
+    arc.put(2, 2)
+    arc.get(2)                   # T1 = [1], T2 = [2]
+    arc.put(3, 3)                # 1 evicted from T1 into ghost list B1
+    assert 1 in arc.b1 and arc.p == 0
+    arc.put(1, 1)                # Ghost hit: T1 deserved more room
+    assert arc.p > 0 and arc.get(1) == 1
+    print(f"after B1 ghost hit: p = {arc.p}")
+
+    # W-TinyLFU counts each access once, hit or miss
+    tiny = WTinyLFUCache_Solution(50)
+    trace = zipf_trace(2000, 300, seed=3)
+    replay(tiny, trace)
+    assert tiny.sketch.additions == len(trace)
+    tiny.put('direct', 1)        # A put without a preceding get is an access
+    assert tiny.sketch.additions == len(trace) + 1
+
+    # Test 3: Count-min sketch never underestimates, and ages
+    print("\nTEST 3: Count-Min Sketch")
+    print("-" * 60)
+    sketch = CountMinSketch(width=64, sample_size=10 ** 9)
+    truth = {}
+    for _ in range(2000):
+        key = rng.randrange(200)
+        truth[key] = truth.get(key, 0) + 1
+        sketch.increment(key)
+    assert all(sketch.estimate(k) >= min(c, CountMinSketch.MAX_COUNT) for k, c in truth.items())
+    before = sketch.estimate(0)
+    sketch.sample_size = sketch.additions + 1
+    sketch.increment(0)
+    assert sketch.estimate(0) <= (min(before + 1, CountMinSketch.MAX_COUNT)) // 2 + 1
+    print(f"{sketch.nbytes()} bytes for {len(truth)} distinct keys")
+
+    # Test 4: A scan does not flush the hot set
+    print("\nTEST 4: Scan Resistance")
+    print("-" * 60)
+    hot = list(range(50))
+    survivors = {}
+    for policy in CACHE_POLICIES:
+        cache = make_cache(policy, 100)
+        cold = iter(range(10000, 20000))
+        for _ in range(20):
+            # Hot keys plus a trickle of one-off keys, so the cache churns
+            for key in hot + [next(cold) for _ in range(40)]:
+                if cache.get(key) == -1:
+                    cache.put(key, key)
+        for key in range(1000, 1500):   # One-time scan
+            if cache.get(key) == -1:
+                cache.put(key, key)
+        survivors[policy] = sum(cache.get(key) != -1 for key in hot)
+        print(f"{policy:10s} keeps {survivors[policy]}/50 hot keys after the scan")
+    assert survivors['lru'] == 0
+    assert survivors['2q'] == survivors['arc'] == survivors['w-tinylfu'] == 50
+
+    # Test 5: Trace replay
+    print("\nTEST 5: Trace Replay")
+    print("-" * 60)
+    results = benchmark_cache_policies(capacity=500, n=50000, keys=20000)
+    for trace_name in ('zipf', 'zipf+scan'):
+        lru = results[trace_name, 'lru'][0]
+        for policy in ('2q', 'arc', 'w-tinylfu'):
+            assert results[trace_name, policy][0] > lru, (trace_name, policy)
+
+    print("\n" + "=" * 60)
+
+
+if __name__ == "__main__":
+    print("Module 11: Cache Eviction Policies")
+    print("\nRun test_cache_policies() or benchmark_cache_policies()")
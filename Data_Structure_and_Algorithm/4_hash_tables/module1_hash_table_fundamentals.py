@@ -9,10 +9,14 @@ In this module, we'll master:
 2. Collision handling techniques
 3. Designing HashSet and HashMap
 4. Understanding time/space complexity
+5. Open addressing with flat arrays for millions of keys
+6. Incremental (Redis-style) rehashing for flat tail latency
 
 Hash tables are your secret weapon for O(1) lookups!
 """
 
+from array import array
+
 # =============================================================================
 # PART 1: HASH TABLE CONCEPTS
 # =============================================================================
@@ -467,7 +471,479 @@ def collections_examples():
     return freq, groups, counter
 
 # =============================================================================
-# PART 6: TESTING
+# PART 6: OPEN ADDRESSING WITH FLAT ARRAYS
+# =============================================================================
+
+"""
+CONCEPT: Open Addressing (Linear Probing)
+==========================================
+
+MyHashMapSolution uses 1000 fixed buckets of (key, value) tuples:
+- Never resizes → at 1M keys every bucket holds ~1000 tuples and each
+  get/put is a 1000-step Python scan
+- Every entry is a tuple object (~64 bytes) plus a list slot
+
+Open addressing stores entries IN the table itself:
+
+    keys:   array('q')   8 bytes per slot
+    values: array('q')   8 bytes per slot
+    used:   bytearray    1 byte per slot (so ANY int64 can be a key)
+
+put/get: start at slot = hash(key), walk slot+1, slot+2, ... until the
+key or an empty slot is found (linear probing).
+
+    capacity 8, keys 3, 11, 19 all hash to slot 3:
+    slot:  0  1  2  3   4   5   6  7
+    key:   .  .  .  3  11  19   .  .
+                    └── probe run ──┘
+
+Hash: Fibonacci hashing - multiply by 2^64/φ and keep the top bits.
+Sequential keys (1, 2, 3, ...) spread over the whole table instead of
+forming one long run.
+
+Resizing: capacity is a power of two (slot = hash & mask). When
+size / capacity > 0.7 → double and reinsert everything. Amortized O(1).
+
+Deletion WITHOUT tombstones (backward shift):
+Just emptying a slot would cut probe runs in half (later keys become
+unreachable). Tombstones fix that but pile up and slow every lookup.
+Instead, after emptying slot i, walk forward through the run and pull
+back any entry whose home slot is not between i and its current slot:
+
+    delete 3:  .  .  .  _  11  19  .      hole at 3
+               11's home is 3 → move back   .  .  .  11  _  19  .
+               19's home is 3 → move back   .  .  .  11  19  _  .
+
+The table always looks as if the deleted key was never inserted.
+
+Time: O(1) expected for put/get/remove (load factor ≤ 0.7)
+Space: 17 bytes per slot → ~25 bytes per key at load 0.7
+"""
+
+_FIBONACCI = 0x9E3779B97F4A7C15
+_MASK64 = (1 << 64) - 1
+
+
+class OpenAddressingHashMap:
+    """
+    Hash map for int keys/values using linear probing over flat arrays
+
+    Same API as MyHashMap (get returns -1 if missing).
+
+    Example:
+    hashMap = OpenAddressingHashMap()
+    hashMap.put(1, 1)
+    hashMap.get(1)     # 1
+    hashMap.remove(1)
+    hashMap.get(1)     # -1
+    """
+
+    def __init__(self, capacity=8):
+        """
+        TODO: keys/values = array('q'), used = bytearray, capacity a power of 2
+        """
+        pass
+
+    def _slot(self, key):
+        """TODO: Fibonacci hash → top bits → home slot"""
+        pass
+
+    def put(self, key, value):
+        """TODO: Probe until key or empty slot; grow when load > 0.7"""
+        pass
+
+    def get(self, key):
+        """TODO: Probe until key (return value) or empty slot (return -1)"""
+        pass
+
+    def remove(self, key):
+        """TODO: Empty the slot, then backward-shift the rest of the run"""
+        pass
+
+# TEACHER'S SOLUTION:
+class OpenAddressingHashMapSolution:
+    """Linear probing, parallel array('q') slots, backward-shift deletion"""
+
+    MAX_LOAD = 0.7
+
+    def __init__(self, capacity=8, with_values=True):
+        bits = max(3, (capacity - 1).bit_length())
+        self._with_values = with_values
+        self._allocate(bits)
+        self.size = 0
+
+    def _allocate(self, bits):
+        self.bits = bits
+        self.capacity = 1 << bits
+        self.mask = self.capacity - 1
+        self.keys = array('q', bytes(8 * self.capacity))
+        self.values = array('q', bytes(8 * self.capacity)) if self._with_values else None
+        self.used = bytearray(self.capacity)
+
+    def _slot(self, key):
+        return ((key * _FIBONACCI) & _MASK64) >> (64 - self.bits)
+
+    def _find(self, key):
+        """Slot holding key, or the empty slot where it would go (as ~slot)"""
+        keys, used, mask = self.keys, self.used, self.mask
+        i = self._slot(key)
+        while used[i]:
+            if keys[i] == key:
+                return i
+            i = (i + 1) & mask
+        return ~i
+
+    def _resize(self, bits):
+        old_keys, old_values, old_used = self.keys, self.values, self.used
+        self._allocate(bits)
+        keys, values, used, mask = self.keys, self.values, self.used, self.mask
+        for j in range(len(old_used)):
+            if old_used[j]:
+                key = old_keys[j]
+                i = self._slot(key)
+                while used[i]:
+                    i = (i + 1) & mask
+                used[i] = 1
+                keys[i] = key
+                if values is not None:
+                    values[i] = old_values[j]
+
+    def put(self, key, value=0):
+        i = self._find(key)
+        if i < 0:
+            if (self.size + 1) > self.MAX_LOAD * self.capacity:
+                self._resize(self.bits + 1)
+                i = self._find(key)
+            i = ~i
+            self.used[i] = 1
+            self.keys[i] = key
+            self.size += 1
+        if self.values is not None:
+            self.values[i] = value
+
+    def get(self, key):
+        i = self._find(key)
+        return self.values[i] if i >= 0 else -1
+
+    def remove(self, key):
+        i = self._find(key)
+        if i < 0:
+            return
+        keys, values, used, mask = self.keys, self.values, self.used, self.mask
+
+        # Backward shift: refill the hole from later entries of the same run
+        j = i
+        while True:
+            j = (j + 1) & mask
+            if not used[j]:
+                break
+            home = self._slot(keys[j])
+            # keys[j] may move to i only if i lies on its probe path home..j
+            if (j - home) & mask >= (j - i) & mask:
+                keys[i] = keys[j]
+                if values is not None:
+                    values[i] = values[j]
+                i = j
+        used[i] = 0
+        self.size -= 1
+
+    def __len__(self):
+        return self.size
+
+    def __contains__(self, key):
+        return self._find(key) >= 0
+
+    def items(self):
+        for i in range(self.capacity):
+            if self.used[i]:
+                yield self.keys[i], (self.values[i] if self.values is not None else None)
+
+
+class OpenAddressingHashSetSolution(OpenAddressingHashMapSolution):
+    """Same table without the values array (LC 705 API)"""
+
+    def __init__(self, capacity=8):
+        super().__init__(capacity, with_values=False)
+
+    def add(self, key):
+        self.put(key)
+
+    def contains(self, key):
+        return key in self
+
+
+def benchmark_hash_maps(sizes=(100_000, 1_000_000), chaining_limit=200_000, lookups=200_000, seed=0):
+    """
+    Time put / get / remove for dict, open addressing and chaining
+
+    Each run inserts n random int keys, looks up `lookups` of them (half
+    present, half absent) and removes `lookups` of them. Chaining is skipped
+    above chaining_limit keys - its fixed 1000 buckets make each op O(n).
+    Sizes up to 50M work but need minutes and ~1.5 GB per 50M-slot table.
+
+    Returns:
+        {n: {impl: {'put', 'get', 'remove'} ns per op}}
+    """
+    import random
+    import time
+
+    rng = random.Random(seed)
+    results = {}
+    for n in sizes:
+        keys = [rng.getrandbits(62) for _ in range(n)]
+        probes = [keys[rng.randrange(n)] if i % 2 else rng.getrandbits(62) for i in range(lookups)]
+        doomed = keys[:lookups]
+
+        impls = {'dict': dict, 'open_addressing': OpenAddressingHashMapSolution}
+        if n <= chaining_limit:
+            impls['chaining'] = MyHashMapSolution
+        results[n] = {}
+        for name, factory in impls.items():
+            table = factory()
+            if name == 'dict':
+                put, get, remove = table.__setitem__, (lambda k, d=table: d.get(k, -1)), table.pop
+            else:
+                put, get, remove = table.put, table.get, table.remove
+
+            began = time.perf_counter()
+            for k in keys:
+                put(k, k & 0xFFFF)
+            put_ns = (time.perf_counter() - began) / n * 1e9
+
+            began = time.perf_counter()
+            found = sum(get(k) != -1 for k in probes)
+            get_ns = (time.perf_counter() - began) / lookups * 1e9
+
+            began = time.perf_counter()
+            for k in doomed:
+                remove(k) if name != 'dict' else remove(k, None)
+            remove_ns = (time.perf_counter() - began) / lookups * 1e9
+
+            results[n][name] = {'put': put_ns, 'get': get_ns, 'remove': remove_ns, 'found': found}
+            print(f"n={n:>10,} {name:16s} put {put_ns:8.0f} ns  get {get_ns:8.0f} ns  "
+                  f"remove {remove_ns:8.0f} ns")
+        assert len({row['found'] for row in results[n].values()}) == 1
+    return results
+
+# =============================================================================
+# PART 7: INCREMENTAL REHASHING
+# =============================================================================
+
+"""
+CONCEPT: Resize Without a Pause
+================================
+
+A growing chained map doubles its bucket array when size > buckets and
+moves EVERY entry to the new array in one go. Amortized O(1) - but the
+unlucky put that triggers it takes O(n): at 10M keys that is seconds,
+and every caller waits.
+
+Redis dict rehashing spreads the move over later operations:
+
+1. On growth, allocate the new table but keep the old one live
+   rehash_index = 0
+2. Every put/get/remove first moves a few buckets:
+       old[rehash_index] → new, rehash_index += 1
+3. While rehashing:
+   - get/remove look in BOTH tables (old first, then new)
+   - put of a new key goes straight into the new table
+4. When rehash_index reaches the end of the old table, drop it
+
+    old: [b0 b1 b2 b3]          rehash_index = 2
+           ↓  ↓  (moved)
+    new: [.. .. .. .. .. .. .. ..]
+
+Each operation does O(rehash_step) extra work → worst-case latency stays
+flat while the map grows from thousands to tens of millions of keys.
+Memory: both tables coexist during a rehash (1.5x the bucket array).
+"""
+
+
+class IncrementalHashMap:
+    """
+    Chained hash map that grows by moving a few buckets per operation
+
+    Example:
+    hashMap = IncrementalHashMap(rehash_step=4)
+    for k in range(10**6):
+        hashMap.put(k, k)   # no single put ever rehashes everything
+    """
+
+    def __init__(self, incremental=True, rehash_step=4):
+        """
+        TODO: table = buckets, old_table = None, rehash_index = -1
+        """
+        pass
+
+    def _rehash_step(self):
+        """TODO: Move rehash_step non-empty buckets from old_table to table"""
+        pass
+
+    def put(self, key, value):
+        """TODO: Step, then update in either table or insert into table"""
+        pass
+
+    def get(self, key):
+        """TODO: Step, then search old_table (if any) and table"""
+        pass
+
+    def remove(self, key):
+        """TODO: Step, then delete from whichever table holds key"""
+        pass
+
+# TEACHER'S SOLUTION:
+class IncrementalHashMapSolution:
+    """Chaining with Redis-style incremental rehashing (or all at once)"""
+
+    EMPTY_VISITS = 10  # Redis also bounds empty buckets skipped per step
+
+    def __init__(self, incremental=True, rehash_step=4, initial_buckets=8):
+        self.incremental = incremental
+        self.rehash_step = rehash_step
+        # Buckets are None until used: allocating the doubled table is then
+        # one C-level fill, not millions of empty lists
+        self.table = [None] * initial_buckets
+        self.old_table = None
+        self.rehash_index = 0
+        self.size = 0
+
+    @property
+    def rehashing(self):
+        return self.old_table is not None
+
+    @staticmethod
+    def _append(table, key, pair):
+        i = hash(key) & (len(table) - 1)
+        if table[i] is None:
+            table[i] = [pair]
+        else:
+            table[i].append(pair)
+
+    def _rehash_step(self, steps):
+        old, table = self.old_table, self.table
+        empty_budget = steps * self.EMPTY_VISITS
+        while steps and self.rehash_index < len(old):
+            bucket = old[self.rehash_index]
+            old[self.rehash_index] = None
+            self.rehash_index += 1
+            if bucket:
+                for pair in bucket:
+                    self._append(table, pair[0], pair)
+                steps -= 1
+            else:
+                empty_budget -= 1
+                if not empty_budget:
+                    break
+        if self.rehash_index == len(old):
+            self.old_table = None
+
+    def _grow(self):
+        if self.rehashing:
+            # Growth outran the migration: finish it first (rare with step >= 2)
+            self._rehash_step(len(self.old_table))
+        self.old_table, self.table = self.table, [None] * (2 * len(self.table))
+        self.rehash_index = 0
+        if not self.incremental:
+            self._rehash_step(len(self.old_table))  # Stop-the-world: move everything now
+
+    def _locate(self, key):
+        """(bucket, position) holding key, or (None, -1)"""
+        h = hash(key)
+        tables = (self.old_table, self.table) if self.rehashing else (self.table,)
+        for table in tables:
+            bucket = table[h & (len(table) - 1)]
+            if bucket:
+                for i, (k, _) in enumerate(bucket):
+                    if k == key:
+                        return bucket, i
+        return None, -1
+
+    def put(self, key, value):
+        if self.rehashing:
+            self._rehash_step(self.rehash_step)
+
+        bucket, i = self._locate(key)
+        if bucket is not None:
+            bucket[i] = (key, value)
+            return
+
+        # New keys always go to the newest table
+        self._append(self.table, key, (key, value))
+        self.size += 1
+        if self.size > len(self.table):
+            self._grow()
+
+    def get(self, key):
+        if self.rehashing:
+            self._rehash_step(self.rehash_step)
+        bucket, i = self._locate(key)
+        return bucket[i][1] if bucket is not None else -1
+
+    def remove(self, key):
+        if self.rehashing:
+            self._rehash_step(self.rehash_step)
+        bucket, i = self._locate(key)
+        if bucket is not None:
+            del bucket[i]
+            self.size -= 1
+
+    def __len__(self):
+        return self.size
+
+
+def _latency_summary(samples_ns):
+    """p50 / p99 / p99.9 / max of per-op latencies (ns)"""
+    ordered = sorted(samples_ns)
+    pick = lambda q: ordered[min(len(ordered) - 1, int(q * len(ordered)))]
+    return {'p50': pick(0.5), 'p99': pick(0.99), 'p999': pick(0.999), 'max': ordered[-1]}
+
+
+def benchmark_rehash_latency(n=1_000_000, rehash_step=4, seed=0):
+    """
+    Per-put latency histogram while growing from 0 to n keys
+
+    Compares stop-the-world resizing with incremental rehashing. Buckets are
+    powers of two in microseconds; the max column is what callers feel.
+    The cyclic GC is paused while timing (as timeit does) so its pauses do
+    not hide the resize pauses.
+
+    Returns:
+        {'stop_the_world': {'p50', 'p99', 'p999', 'max'}, 'incremental': {...}}
+    """
+    import gc
+    import random
+    import time
+
+    rng = random.Random(seed)
+    keys = [rng.getrandbits(62) for _ in range(n)]
+    clock = time.perf_counter_ns
+
+    results = {}
+    for name, incremental in (('stop_the_world', False), ('incremental', True)):
+        table = IncrementalHashMapSolution(incremental=incremental, rehash_step=rehash_step)
+        samples = array('q', bytes(8 * n))
+        gc_was_enabled = gc.isenabled()
+        gc.disable()
+        try:
+            for i, key in enumerate(keys):
+                began = clock()
+                table.put(key, i)
+                samples[i] = clock() - began
+        finally:
+            if gc_was_enabled:
+                gc.enable()
+        assert len(table) == n
+
+        histogram = Counter(max(0, (latency // 1000).bit_length()) for latency in samples)
+        results[name] = _latency_summary(samples)
+        print(f"{name} (n={n:,}): " + ", ".join(f"{k} {v / 1000:.1f} us" for k, v in results[name].items()))
+        for bucket in sorted(histogram):
+            upper = (1 << bucket) if bucket else 1
+            print(f"  < {upper:>8} us  {histogram[bucket]:>10,}")
+    return results
+
+# =============================================================================
+# PART 8: TESTING
 # =============================================================================
 
 def test_hash_table_fundamentals():
@@ -514,6 +990,78 @@ def test_hash_table_fundamentals():
         groups[i % 2].append(i)
     print(f"Groups: {dict(groups)}")
 
+    # Test open addressing against dict
+    print("\nTEST 5: Open Addressing (randomized vs dict)")
+    import random
+    rng = random.Random(1)
+    table, reference = OpenAddressingHashMapSolution(), {}
+    for _ in range(30000):
+        key = rng.randint(-500, 500) * rng.choice((1, 1 << 40))
+        op = rng.random()
+        if op < 0.5:
+            table.put(key, key * 3)
+            reference[key] = key * 3
+        elif op < 0.8:
+            table.remove(key)
+            reference.pop(key, None)
+        else:
+            assert table.get(key) == reference.get(key, -1)
+    assert len(table) == len(reference) and dict(table.items()) == reference
+    print(f"{len(table)} keys in {table.capacity} slots after 30k random ops")
+
+    hash_set = OpenAddressingHashSetSolution()
+    for key in range(0, 3000, 3):
+        hash_set.add(key)
+    for key in range(0, 3000, 6):
+        hash_set.remove(key)
+    assert all(hash_set.contains(k) == (k % 3 == 0 and k % 6 != 0) for k in range(3000))
+    assert hash_set.values is None
+    benchmark_hash_maps(sizes=(20000,), lookups=5000)
+
+    # Test incremental rehashing against dict
+    print("\nTEST 6: Incremental Rehashing")
+    for incremental in (True, False):
+        table, reference = IncrementalHashMapSolution(incremental=incremental, rehash_step=1), {}
+        seen_rehash = False
+        for _ in range(20000):
+            key = rng.randrange(5000)
+            op = rng.random()
+            if op < 0.6:
+                table.put(key, -key)
+                reference[key] = -key
+            elif op < 0.75:
+                table.remove(key)
+                reference.pop(key, None)
+            else:
+                assert table.get(key) == reference.get(key, -1)
+            seen_rehash |= table.rehashing
+        assert len(table) == len(reference)
+        assert all(table.get(k) == v for k, v in reference.items())
+        assert seen_rehash == incremental  # stop-the-world never leaves both tables live
+    benchmark_rehash_latency(n=100_000)  # Latency histogram is a report, not a check
+
+    class BucketCounter(IncrementalHashMapSolution):
+        """Counts old-table buckets visited by each rehash step"""
+        visited = 0
+
+        def _rehash_step(self, steps):
+            start = self.rehash_index
+            super()._rehash_step(steps)
+            self.visited += self.rehash_index - start
+
+    worst = {}
+    for incremental in (True, False):
+        table = BucketCounter(incremental=incremental, rehash_step=4)
+        worst[incremental] = 0
+        for i in range(100_000):
+            table.visited = 0
+            table.put(rng.getrandbits(62), i)
+            worst[incremental] = max(worst[incremental], table.visited)
+    # Bounded work per put: rehash_step moves plus EMPTY_VISITS skips per move
+    assert worst[True] <= 4 * (1 + IncrementalHashMapSolution.EMPTY_VISITS)
+    assert worst[False] >= 65536  # Stop-the-world moves the whole old table at once
+    print(f"Max buckets visited by one put: incremental {worst[True]}, stop-the-world {worst[False]:,}")
+
     print("\n" + "=" * 50)
 
 if __name__ == "__main__":
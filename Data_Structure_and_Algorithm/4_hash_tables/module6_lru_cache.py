@@ -8,8 +8,19 @@ Key Problems:
 
 LRU = Least Recently Used
 When cache is full, evict the least recently used item.
+
+Concurrency:
+- Sharded LRU: N independent shards, one lock each (lock striping)
+
+Production extras (LRUCache_Solution):
+- Per-entry TTL: lazy expiry on get + a timer wheel advanced by get/put
+- Byte budget: entries carry a weight, eviction frees until it fits
 """
 
+import sys
+import threading
+import time
+
 # =============================================================================
 # PART 1: HELPER CLASS - DOUBLY LINKED LIST NODE
 # =============================================================================
@@ -27,6 +38,8 @@ class Node:
         self.value = value
         self.prev = None
         self.next = None
+        self.weight = 1           # Share of the capacity this entry uses
+        self.expires_at = None    # Clock time after which it is stale
 
 
 # =============================================================================
@@ -201,12 +214,71 @@ class LRUCache:
 # PART 3: TEACHER'S SOLUTION
 # =============================================================================
 
+"""
+CONCEPT: Expiry and Byte Budgets
+================================
+
+TTL (time to live): put(key, value, ttl=30) → stale after 30 seconds.
+
+1. Lazy expiry: get() checks node.expires_at and drops a stale entry
+   instead of returning it. Correct, but an entry nobody reads again
+   would sit in the cache until LRU pushes it out.
+2. Timer wheel: a ring of slots, one per `resolution` seconds of the
+   clock. An entry with a TTL goes in slot int(expires_at / resolution)
+   % slots. Every get/put first sweeps the slots whose time has fully
+   passed since the last sweep - no background thread.
+
+    slots (resolution 1s, 8 slots), now = 13.4:
+    [0] [1] [2] [3] [4] [5] [6] [7]
+             ↑ 10..11s done  ↑ 13s: current, swept once it ends
+    Entries more than one lap away stay in their slot until their lap.
+
+Byte budget: capacity counts weight, not entries.
+
+    cache = LRUCache_Solution(64 * 2**20, weigher=value_nbytes)
+    put(key, blob)  → weight = len(blob); evict from the tail while the
+                      total weight is over 64MB
+
+- Count mode is the same thing with every weight = 1
+- An entry heavier than the whole budget is not cached at all (it would
+  flush everything and still not fit); put() drops it, and any old value
+  for the key, and counts a rejection instead of raising
+"""
+
+
+def value_nbytes(key, value):
+    """Weigher for byte budgets: len() of bytes/str, else sys.getsizeof"""
+    if isinstance(value, (bytes, bytearray, memoryview, str)):
+        return len(value)
+    return sys.getsizeof(value)
+
+
 class LRUCache_Solution:
-    """Complete working LRU Cache implementation"""
+    """
+    Complete working LRU Cache implementation
 
-    def __init__(self, capacity):
+    Optional extras (off by default, LC 146 behaviour unchanged):
+    - weigher(key, value) → weight: capacity becomes a weight budget
+    - default_ttl / put(..., ttl=): entries expire after ttl seconds
+    - clock: time source in seconds (time.monotonic)
+
+    Example:
+        cache = LRUCache_Solution(2**30, weigher=value_nbytes, default_ttl=300)
+        cache.put('report', pdf_bytes)            # weight len(pdf_bytes)
+        cache.put('token', token, ttl=60)
+    """
+
+    def __init__(self, capacity, weigher=None, default_ttl=None, clock=time.monotonic,
+                 wheel_slots=64, wheel_resolution=1.0):
         self.capacity = capacity
         self.cache = {}  # key -> Node
+        self.weigher = weigher
+        self.default_ttl = default_ttl
+        self.clock = clock
+        self.total_weight = 0
+        self.evictions = 0
+        self.expirations = 0
+        self.rejections = 0  # Puts heavier than the whole capacity
 
         # Dummy nodes to simplify operations
         self.head = Node(0, 0)  # Most recently used
@@ -216,32 +288,113 @@ class LRUCache_Solution:
         self.head.next = self.tail
         self.tail.prev = self.head
 
+        # Timer wheel: slot -> set of nodes expiring in that slot's ticks
+        self.wheel = [set() for _ in range(wheel_slots)]
+        self.wheel_resolution = wheel_resolution
+        self.wheel_tick = int(clock() / wheel_resolution)  # First tick not yet swept
+        self.ttl_entries = 0
+
     def get(self, key):
-        if key not in self.cache:
-            return -1
+        if self.ttl_entries:
+            node = self._lookup(key)
+            return node.value if node is not None else -1
 
-        node = self.cache[key]
+        # No TTLs in the cache: plain LC 146 path
+        node = self.cache.get(key)
+        if node is None:
+            return -1
         self._move_to_head(node)
         return node.value
 
-    def put(self, key, value):
-        if key in self.cache:
+    def put(self, key, value, ttl=None, weight=None):
+        now = self._advance() if self.ttl_entries else None
+        if weight is None:
+            weight = self.weigher(key, value) if self.weigher else 1
+        if ttl is None:
+            ttl = self.default_ttl
+
+        node = self.cache.get(key)
+        if weight > self.capacity:
+            # Can never fit: drop any old value rather than flush the cache
+            if node is not None:
+                self._unlink(node)
+            self.rejections += 1
+            return
+
+        if node is not None:
             # Update existing key
-            node = self.cache[key]
+            self._unschedule(node)
             node.value = value
+            self.total_weight += weight - node.weight
+            node.weight = weight
             self._move_to_head(node)
         else:
-            # Add new key
-            if len(self.cache) == self.capacity:
-                # Evict least recently used (from tail)
-                lru_node = self.tail.prev
-                self._remove_node(lru_node)
-                del self.cache[lru_node.key]
-
             # Add new node to head
-            new_node = Node(key, value)
-            self.cache[key] = new_node
-            self._add_to_head(new_node)
+            node = Node(key, value)
+            node.weight = weight
+            self.cache[key] = node
+            self._add_to_head(node)
+            self.total_weight += weight
+
+        if ttl is not None:
+            node.expires_at = (now if now is not None else self.clock()) + ttl
+            self._schedule(node)
+
+        # Evict least recently used (from tail) until within budget;
+        # the new node is at the head and fits, so it is never evicted
+        while self.total_weight > self.capacity:
+            self._unlink(self.tail.prev)
+            self.evictions += 1
+
+    def _lookup(self, key):
+        """Node for a live key (moved to head), None if missing or stale"""
+        now = self._advance() if self.ttl_entries else None
+        node = self.cache.get(key)
+        if node is None:
+            return None
+        if node.expires_at is not None and node.expires_at <= (now if now is not None else self.clock()):
+            self._unlink(node)  # Lazy expiry
+            self.expirations += 1
+            return None
+        self._move_to_head(node)
+        return node
+
+    def _unlink(self, node):
+        """Remove node from the list, the map, the wheel and the budget"""
+        self._remove_node(node)
+        del self.cache[node.key]
+        self._unschedule(node)
+        self.total_weight -= node.weight
+
+    def _schedule(self, node):
+        slot = int(node.expires_at / self.wheel_resolution) % len(self.wheel)
+        self.wheel[slot].add(node)
+        self.ttl_entries += 1
+
+    def _unschedule(self, node):
+        if node.expires_at is not None:
+            slot = int(node.expires_at / self.wheel_resolution) % len(self.wheel)
+            self.wheel[slot].discard(node)
+            node.expires_at = None
+            self.ttl_entries -= 1
+
+    def _advance(self):
+        """Sweep wheel slots whose ticks have fully passed; returns now"""
+        now = self.clock()
+        tick = int(now / self.wheel_resolution)
+        # More than a lap behind: each slot only needs one sweep
+        start = max(self.wheel_tick, tick - len(self.wheel))
+        for t in range(start, tick):
+            slot = self.wheel[t % len(self.wheel)]
+            expired = [node for node in slot if node.expires_at <= now]
+            for node in expired:
+                self._unlink(node)
+                self.expirations += 1
+        self.wheel_tick = max(self.wheel_tick, tick)
+        return now
+
+    def __len__(self):
+        return len(self.cache)
 
     def _move_to_head(self, node):
         """Move node to head position"""
@@ -264,7 +417,210 @@ class LRUCache_Solution:
 
 
 # =============================================================================
-# PART 4: TESTING
+# PART 4: THREAD-SAFE SHARDED LRU (LOCK STRIPING)
+# =============================================================================
+
+"""
+CONCEPT: Why Even get() Needs a Lock
+====================================
+
+get() is a write: it relinks the node to the head of the list.
+Two threads interleaving inside _move_to_head can lose a node:
+
+    Thread A: _remove_node(x)          Thread B: _remove_node(y)
+              (x.prev is y)                      (y.next is x)
+    A links y -> x.next, B links y.prev -> x  →  x is back in the list
+                                                 (or the list is cut)
+
+One global lock fixes it but serializes every operation, including
+the slow part of a read-through cache (loading a missing value).
+
+Lock striping: hash the key to one of N shards. Each shard is a plain
+LRUCache_Solution with its own lock and capacity / N entries.
+
+    key → hash(key) % N → shard i → with shard.lock: get / put
+
+- Operations on different shards never wait for each other
+- Eviction is per shard: LRU order is approximate across shards (fine
+  when keys hash evenly and each shard holds hundreds of entries)
+- Counters live in each shard (updated under its lock) and are summed
+  on demand, so stats() takes no global lock
+
+In CPython with the GIL, pure get/put does not run in parallel anyway;
+striping pays off when work under the lock releases the GIL (loading a
+missing value from disk or the network), and on free-threaded builds.
+"""
+
+
+class _LockedShard(LRUCache_Solution):
+    """One stripe: an LRU cache, its lock and its hit/miss counters"""
+
+    def __init__(self, capacity, **options):
+        super().__init__(capacity, **options)
+        self.lock = threading.Lock()
+        self.hits = 0
+        self.misses = 0
+
+
+class ShardedLRUCache:
+    """
+    Thread-safe LRU cache split into independently locked shards
+
+    Example:
+    --------
+    cache = ShardedLRUCache(10000, num_shards=16)
+    cache.put("user:1", profile)          # from any thread
+    cache.get("user:1")                   # profile, or -1
+    cache.get_or_load("user:2", fetch)    # fetch("user:2") on a miss
+    cache.stats()                         # {'hits': ..., 'misses': ..., ...}
+
+    TODO: Implement
+    - Split capacity across num_shards LRUCache_Solution shards
+    - Pick a shard with hash(key) % num_shards
+    - Hold only that shard's lock in get/put
+    - Count hits, misses and evictions per shard; sum them in stats()
+    """
+
+    def __init__(self, capacity, num_shards=16):
+        pass
+
+    def get(self, key):
+        pass
+
+    def put(self, key, value):
+        pass
+
+    def stats(self):
+        pass
+
+
+# TEACHER'S SOLUTION:
+class ShardedLRUCache_Solution:
+    """Lock-striped LRU: each shard is an LRUCache_Solution with its own lock"""
+
+    def __init__(self, capacity, num_shards=16, **options):
+        """
+        options (weigher, default_ttl, clock, ...) go to every shard
+
+        With a weigher, capacity is a total byte budget split evenly: each
+        shard holds at most capacity // num_shards (+1). An entry heavier
+        than its shard's budget is dropped like one heavier than a plain
+        LRUCache_Solution's capacity, even if it is lighter than the total;
+        stats()['rejections'] counts these.
+        """
+        if capacity < num_shards:
+            raise ValueError("capacity must be at least num_shards")
+        self.capacity = capacity
+        self.num_shards = num_shards
+        # Spread the remainder so shard capacities sum to capacity
+        base, extra = divmod(capacity, num_shards)
+        self.shards = [_LockedShard(base + (i < extra), **options) for i in range(num_shards)]
+
+    def _shard(self, key):
+        return self.shards[hash(key) % self.num_shards]
+
+    def get(self, key):
+        shard = self._shard(key)
+        with shard.lock:
+            node = shard._lookup(key)
+            if node is None:
+                shard.misses += 1
+                return -1
+            shard.hits += 1
+            return node.value
+
+    def put(self, key, value, ttl=None, weight=None):
+        shard = self._shard(key)
+        with shard.lock:
+            shard.put(key, value, ttl, weight)
+
+    def get_or_load(self, key, loader):
+        """
+        Read-through get: on a miss call loader(key), cache and return it
+
+        The shard lock is held while loading, so concurrent misses on the
+        same key load it once. Only keys in the same shard wait.
+        """
+        shard = self._shard(key)
+        with shard.lock:
+            node = shard._lookup(key)
+            if node is not None:
+                shard.hits += 1
+                return node.value
+            shard.misses += 1
+            value = loader(key)
+            shard.put(key, value)
+            return value
+
+    def __len__(self):
+        return sum(len(shard.cache) for shard in self.shards)
+
+    def stats(self):
+        """Aggregate counters (each shard read under its own lock)"""
+        totals = {'hits': 0, 'misses': 0, 'evictions': 0, 'expirations': 0, 'rejections': 0,
+                  'size': 0, 'weight': 0}
+        for shard in self.shards:
+            with shard.lock:
+                totals['hits'] += shard.hits
+                totals['misses'] += shard.misses
+                totals['evictions'] += shard.evictions
+                totals['expirations'] += shard.expirations
+                totals['rejections'] += shard.rejections
+                totals['size'] += len(shard.cache)
+                totals['weight'] += shard.total_weight
+        lookups = totals['hits'] + totals['misses']
+        totals['hit_ratio'] = totals['hits'] / lookups if lookups else 0.0
+        return totals
+
+
+def benchmark_sharded_lru(shard_counts=(1, 2, 4, 8, 16), threads=8, ops_per_thread=2000,
+                          keys=4000, capacity=1024, load_seconds=0.0002, seed=0):
+    """
+    Throughput of get_or_load from several threads, by shard count
+
+    Each miss sleeps load_seconds (a stand-in for a database or network
+    read, which releases the GIL) while holding its shard lock.
+    num_shards=1 is the single-global-lock baseline.
+
+    Returns {num_shards: (ops_per_sec, hit_ratio)}
+    """
+    import random
+    import time
+
+    rng = random.Random(seed)
+    # Skewed key popularity so the cache has a hot set worth keeping
+    traces = [[int(keys * rng.random() ** 2) for _ in range(ops_per_thread)]
+              for _ in range(threads)]
+
+    def loader(key):
+        time.sleep(load_seconds)
+        return key * 2
+
+    results = {}
+    for num_shards in shard_counts:
+        cache = ShardedLRUCache_Solution(capacity, num_shards)
+
+        def worker(trace):
+            for key in trace:
+                cache.get_or_load(key, loader)
+
+        pool = [threading.Thread(target=worker, args=(trace,)) for trace in traces]
+        began = time.perf_counter()
+        for thread in pool:
+            thread.start()
+        for thread in pool:
+            thread.join()
+        elapsed = time.perf_counter() - began
+
+        stats = cache.stats()
+        results[num_shards] = (threads * ops_per_thread / elapsed, stats['hit_ratio'])
+        print(f"shards={num_shards:3d}: {results[num_shards][0]:10,.0f} ops/s, "
+              f"hit ratio {stats['hit_ratio']:.2f}")
+    return results
+
+
+# =============================================================================
+# PART 5: TESTING
 # =============================================================================
 
 def test_lru_cache():
@@ -331,6 +687,141 @@ def test_lru_cache():
     result = cache.get(1)
     print(f"get(1) → {result} (expected: 10)")
 
+    # Test 4: Sharded cache, single thread, and counters
+    print("\nTEST 4: Sharded LRU Basics")
+    print("-" * 60)
+    cache = ShardedLRUCache_Solution(8, num_shards=4)
+    assert [shard.capacity for shard in cache.shards] == [2, 2, 2, 2]
+    assert [shard.capacity for shard in ShardedLRUCache_Solution(10, 4).shards] == [3, 3, 2, 2]
+    for key in range(8):
+        cache.put(key, key * 10)  # Small ints hash to themselves: 2 per shard
+    assert len(cache) == 8 and cache.get(5) == 50
+    cache.put(9, 90)              # Shard 1 is full: evicts its LRU key (1)
+    assert cache.get(1) == -1 and cache.get(9) == 90 and cache.get(5) == 50
+    assert cache.get_or_load(1, lambda key: key * 100) == 100
+    stats = cache.stats()
+    assert (stats['hits'], stats['misses'], stats['evictions']) == (3, 2, 2)
+    print(f"stats: {stats}")
+    try:
+        ShardedLRUCache_Solution(2, num_shards=4)
+        assert False, "capacity below shard count must be rejected"
+    except ValueError:
+        pass
+
+    # Test 5: Many threads hammering a few shards
+    print("\nTEST 5: Concurrent Access")
+    print("-" * 60)
+    import random
+    cache = ShardedLRUCache_Solution(64, num_shards=4)
+    threads, ops = 8, 5000
+    failures = []  # An assert inside a thread would only reach threading.excepthook
+
+    def hammer(seed):
+        rng = random.Random(seed)
+        try:
+            for _ in range(ops):
+                key = rng.randrange(200)
+                if rng.random() < 0.5:
+                    cache.put(key, key)
+                else:
+                    value = cache.get(key)
+                    if value not in (-1, key):
+                        failures.append((key, value))
+        except Exception as error:
+            failures.append(error)
+
+    pool = [threading.Thread(target=hammer, args=(seed,)) for seed in range(threads)]
+    for thread in pool:
+        thread.start()
+    for thread in pool:
+        thread.join()
+    assert not failures, failures[:5]
+
+    for shard in cache.shards:
+        # Walk the list both ways: a lost relink would break one of them
+        forward, node = [], shard.head.next
+        while node is not shard.tail:
+            forward.append(node.key)
+            node = node.next
+        backward, node = [], shard.tail.prev
+        while node is not shard.head:
+            backward.append(node.key)
+            node = node.prev
+        assert forward == backward[::-1] and sorted(forward) == sorted(shard.cache)
+        assert len(shard.cache) <= shard.capacity
+    stats = cache.stats()
+    assert stats['hits'] + stats['misses'] == sum(shard.hits + shard.misses for shard in cache.shards)
+    assert stats['size'] == len(cache) <= 64
+    print(f"{threads} threads x {ops} ops: lists intact, stats {stats}")
+
+    # Test 6: Throughput by shard count
+    print("\nTEST 6: Sharded Throughput (8 threads, read-through loads)")
+    print("-" * 60)
+    results = benchmark_sharded_lru(shard_counts=(1, 16), ops_per_thread=500)
+    print(f"16 shards vs 1: {results[16][0] / results[1][0]:.1f}x throughput")  # Report only
+
+    # Test 7: TTL - lazy expiry and the timer wheel
+    print("\nTEST 7: TTL Expiry")
+    print("-" * 60)
+    now = [100.0]
+    cache = LRUCache_Solution(10, default_ttl=5, clock=lambda: now[0], wheel_slots=8)
+    cache.put('a', 1)                 # expires at 105
+    cache.put('b', 2, ttl=30)         # 130: more than one lap of the wheel
+    cache.put('c', 3, ttl=2)          # 102
+    now[0] = 103.5
+    assert cache.get('c') == -1 and cache.expirations == 1   # Lazy: stale on read
+    assert cache.get('a') == 1
+    now[0] = 107.0
+    cache.put('d', 4, ttl=None)       # default_ttl applies: 112
+    assert 'a' not in cache.cache     # Wheel swept 'a' without a get
+    assert cache.expirations == 2 and len(cache) == 2
+    cache.put('b', 20, ttl=1)         # Overwrite reschedules: 108
+    now[0] = 140.0
+    cache.get('zzz')                  # Any operation advances the wheel
+    assert len(cache) == 0 and cache.ttl_entries == 0
+    assert all(not slot for slot in cache.wheel)
+    forever = LRUCache_Solution(2, clock=lambda: now[0])
+    forever.put('x', 1)
+    now[0] = 1e9
+    assert forever.get('x') == 1      # No TTL: never expires
+    print(f"expirations: {cache.expirations} (1 lazy, 3 by the wheel)")
+
+    # Test 8: Byte budget with mixed value sizes
+    print("\nTEST 8: Byte Budget")
+    print("-" * 60)
+    budget = 64 * 2 ** 20
+    cache = LRUCache_Solution(budget, weigher=value_nbytes)
+    rng = random.Random(8)
+    peak = 0
+    for i in range(400):
+        size = int(100 * (10 ** 5) ** rng.random())   # 100 B .. 10 MB, log-uniform
+        cache.put(i, b'x' * size)
+        peak = max(peak, cache.total_weight)
+        assert cache.total_weight == sum(len(node.value) for node in cache.cache.values())
+    assert peak <= budget
+    print(f"{len(cache)} entries, {cache.total_weight / 2**20:.1f} MB of {budget / 2**20:.0f} MB, "
+          f"{cache.evictions} evictions")
+    cache.put('huge', b'x' * (budget + 1))
+    assert 'huge' not in cache.cache and cache.total_weight <= budget
+    assert cache.rejections == 1
+    cache.put(0, b'small', weight=budget // 2)        # Explicit weight wins
+    assert cache.cache[0].weight == budget // 2 and cache.total_weight <= budget
+    cache.put(0, b'x' * (budget + 1))                 # Too big now: old value dropped
+    assert 0 not in cache.cache and cache.rejections == 2
+
+    sharded = ShardedLRUCache_Solution(4000, num_shards=4, weigher=value_nbytes)
+    for i in range(100):
+        sharded.put(i, 'v' * 100)
+    stats = sharded.stats()
+    assert stats['weight'] <= 4000 and stats['size'] == 40 and stats['evictions'] == 60
+    print(f"sharded byte budget: {stats['size']} entries, {stats['weight']} bytes")
+    sharded.put('big', 'v' * 1500)        # < 4000 total, > 1000 per shard: dropped
+    stats = sharded.stats()
+    assert sharded.get('big') == -1 and stats['size'] == 40 and stats['rejections'] == 1
+    assert sharded.get_or_load('big', lambda key: 'v' * 1500) == 'v' * 1500
+    assert sharded.get('big') == -1       # Loaded but not cached, same contract as put
+    assert sharded.stats()['rejections'] == 2
+
     print("\n" + "=" * 60)
 
 
@@ -342,3 +833,5 @@ if __name__ == "__main__":
     print("- Hash map for O(1) lookup")
     print("- Doubly linked list for O(1) ordering")
     print("- Dummy nodes to simplify operations")
+    print("- Lock striping for thread-safe sharded caches")
+    print("- TTL (lazy + timer wheel) and byte-budget eviction")
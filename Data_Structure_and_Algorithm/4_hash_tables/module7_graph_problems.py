@@ -6,17 +6,356 @@ Key Problems:
 - LC 133: Clone Graph
 - LC 207: Course Schedule
 - LC 997: Find the Town Judge
+
+Large graphs:
+- Iterative clone (no recursion limit)
+- __slots__ nodes, and a compact array form that keeps a clone in about
+  a quarter of the memory of Node objects
 """
 
+from array import array
+from collections import deque
+
+# =============================================================================
+# PART 1: GRAPH NODES
+# =============================================================================
+
+class Node:
+    """
+    Graph node as defined by LC 133
+
+    Every instance carries a __dict__ for its attributes and a growable
+    list of neighbors.
+    """
+    def __init__(self, val=0, neighbors=None):
+        self.val = val
+        self.neighbors = neighbors if neighbors is not None else []
+
+
+class SlotNode:
+    """
+    Compact graph node for large, read-mostly graphs
+
+    - __slots__: attributes live in fixed slots, no per-instance __dict__
+    - neighbors is an exact-size tuple instead of an over-allocated list
+      (replace the whole tuple to change edges)
+
+    About a third fewer bytes than a Node with the same edges.
+    """
+    __slots__ = ('val', 'neighbors')
+
+    def __init__(self, val=0, neighbors=()):
+        self.val = val
+        self.neighbors = neighbors
+
+
+# =============================================================================
+# PART 2: CLONE GRAPH (LC 133)
+# =============================================================================
+
 def cloneGraph(node):
     """LC 133: Clone Graph"""
     # TODO: Hash map for old -> new node mapping
     pass
 
+# TEACHER'S SOLUTION:
+def cloneGraph_solution(node):
+    """
+    BFS with an old -> new hash map
+
+    Iterative on purpose: a recursive DFS clone needs one Python frame per
+    node on the current path and raises RecursionError on long chains.
+
+    Time: O(V + E)
+    Space: O(V) for the map and the queue
+    """
+    if node is None:
+        return None
+
+    clones = {node: Node(node.val)}
+    queue = deque([node])
+
+    while queue:
+        current = queue.popleft()
+        copy_neighbors = clones[current].neighbors
+        for neighbor in current.neighbors:
+            if neighbor not in clones:
+                clones[neighbor] = Node(neighbor.val)
+                queue.append(neighbor)
+            copy_neighbors.append(clones[neighbor])
+
+    return clones[node]
+
+
+# =============================================================================
+# PART 3: COMPACT ARRAY FORM AND BULK CLONE
+# =============================================================================
+
+"""
+CONCEPT: Graph <-> Flat Arrays
+===============================
+
+Number the nodes 0..V-1 in BFS order from the start node, then store:
+
+    vals:    vals[i] = value of node i      (array('q') if all ints)
+    offsets: length V+1, neighbors of i are targets[offsets[i]:offsets[i+1]]
+    targets: length E, neighbor indices     (array('q'))
+
+Example: 1 - 2, 1 - 4, 2 - 3, 3 - 4 (LC 133's [[2,4],[1,3],[2,4],[1,3]])
+    vals    = [1, 2, 4, 3]
+    offsets = [0, 2, 4, 6, 8]
+    targets = [1, 2, 0, 3, 0, 3, 1, 2]
+
+Uses:
+- Serialize: 8 bytes per node + 8 per edge, trivially written to disk or
+  sent to another process (no pickle of a deep object graph)
+- Bulk clone: serialize, then build all nodes in one pass and wire
+  neighbors by index - no recursion, no old -> new map kept around
+  while the clone is built
+- Compact clone: keep the arrays themselves as the copy (CompactGraph)
+  and hand out lightweight node views on demand
+
+Bytes per node (degree 3, 3.11):
+    Node + list          ~175    (object, attribute storage, list slack)
+    SlotNode + tuple     ~110
+    CompactGraph arrays   ~40    (val + offset + 3 targets, 8 bytes each)
+
+Numbering uses a node -> index dict only while serializing.
+"""
+
+
+def _flatten(node):
+    """BFS numbering from node → (vals list, offsets, targets)"""
+    vals, offsets, targets = [], array('q', [0]), array('q')
+    if node is None:
+        return vals, offsets, targets
+
+    index = {node: 0}
+    order = [node]  # BFS discovery order == index order
+    i = 0
+    while i < len(order):
+        current = order[i]
+        i += 1
+        vals.append(current.val)
+        for neighbor in current.neighbors:
+            j = index.get(neighbor)
+            if j is None:
+                j = index[neighbor] = len(order)
+                order.append(neighbor)
+            targets.append(j)
+        offsets.append(len(targets))
+
+    return vals, offsets, targets
+
+
+def serialize_graph(node):
+    """
+    Flatten the graph reachable from node into (vals, offsets, targets)
+
+    Node 0 is the start node; neighbor order is preserved.
+
+    Time: O(V + E)
+    Space: O(V + E) arrays + O(V) temporary index map
+    """
+    vals, offsets, targets = _flatten(node)
+    try:
+        vals = array('q', vals)
+    except (TypeError, OverflowError):
+        pass  # Non-integer values stay in a list
+    return vals, offsets, targets
+
+
+def deserialize_graph(vals, offsets, targets, node_type=SlotNode):
+    """
+    Rebuild nodes from the array form and return node 0 (None if empty)
+
+    node_type=SlotNode gets tuple neighbors, Node gets lists.
+    """
+    if not len(vals):
+        return None
+
+    nodes = [node_type(val) for val in vals]
+    container = tuple if issubclass(node_type, SlotNode) else list
+    for i, current in enumerate(nodes):
+        current.neighbors = container([nodes[j] for j in targets[offsets[i]:offsets[i + 1]]])
+    return nodes[0]
+
+
+def cloneGraph_bulk(node, node_type=SlotNode):
+    """
+    Clone through the array form: iterative, and SlotNode clones are compact
+
+    Example:
+        copy = cloneGraph_bulk(service_graph_root)   # 5M nodes, no recursion
+
+    Time: O(V + E)
+    Space: O(V + E) for the arrays (freed after the clone is built)
+    """
+    # _flatten keeps the original value objects, so the clone shares them
+    return deserialize_graph(*_flatten(node), node_type=node_type)
+
+
+class CompactNode:
+    """View of node `index` inside a CompactGraph (created on demand)"""
+    __slots__ = ('graph', 'index')
+
+    def __init__(self, graph, index):
+        self.graph = graph
+        self.index = index
+
+    @property
+    def val(self):
+        return self.graph.vals[self.index]
+
+    @property
+    def neighbors(self):
+        graph, i = self.graph, self.index
+        return tuple(CompactNode(graph, j) for j in graph.targets[graph.offsets[i]:graph.offsets[i + 1]])
+
+    def __eq__(self, other):
+        return isinstance(other, CompactNode) and self.graph is other.graph and self.index == other.index
+
+    def __hash__(self):
+        return hash((id(self.graph), self.index))
+
+
+class CompactGraph:
+    """
+    A graph clone that IS the array form
+
+    Example:
+        copy = CompactGraph.from_node(root)
+        copy.root().val, [n.val for n in copy.root().neighbors]
+        copy.to_nodes()        # materialize SlotNodes if needed
+
+    Space: 8 * (2V + E + 1) bytes for integer values
+    """
+
+    def __init__(self, vals, offsets, targets):
+        self.vals = vals
+        self.offsets = offsets
+        self.targets = targets
+
+    @classmethod
+    def from_node(cls, node):
+        return cls(*serialize_graph(node))
+
+    def __len__(self):
+        return len(self.vals)
+
+    def node(self, index):
+        return CompactNode(self, index)
+
+    def root(self):
+        return CompactNode(self, 0) if len(self.vals) else None
+
+    def to_nodes(self, node_type=SlotNode):
+        return deserialize_graph(self.vals, self.offsets, self.targets, node_type)
+
+    def nbytes(self):
+        total = (len(self.offsets) + len(self.targets)) * 8
+        return total + (len(self.vals) * self.vals.itemsize if isinstance(self.vals, array) else 0)
+
+
+def graph_from_adjacency(adjacency, node_type=Node):
+    """Build LC 133's 1-indexed adjacency list ([[2,4],[1,3],...]) and return node 1"""
+    offsets, targets = array('q', [0]), array('q')
+    for neighbors in adjacency:
+        targets.extend(v - 1 for v in neighbors)
+        offsets.append(len(targets))
+    return deserialize_graph(range(1, len(adjacency) + 1), offsets, targets, node_type)
+
+
 def canFinish(numCourses, prerequisites):
     """LC 207: Course Schedule"""
     # TODO: Adjacency list with hash map, detect cycle
     pass
 
+
+# =============================================================================
+# PART 4: TESTING
+# =============================================================================
+
+def test_graph_problems():
+    """Test clone implementations"""
+    import random
+    import tracemalloc
+
+    print("=" * 60)
+    print("GRAPH PROBLEMS TEST SUITE")
+    print("=" * 60)
+
+    # Test 1: LC 133 example
+    print("\nTEST 1: Clone Graph")
+    print("-" * 60)
+    adjacency = [[2, 4], [1, 3], [2, 4], [1, 3]]
+    original = graph_from_adjacency(adjacency)
+    for clone in (cloneGraph_solution(original), cloneGraph_bulk(original), cloneGraph_bulk(original, Node)):
+        assert clone is not original and clone.val == 1
+        assert serialize_graph(clone) == serialize_graph(original)
+        assert all(a is not b for a, b in zip(clone.neighbors, original.neighbors))
+    print(f"Serialized: {serialize_graph(original)}")
+    assert cloneGraph_solution(None) is None and cloneGraph_bulk(None) is None
+    assert cloneGraph_bulk(Node(7)).val == 7
+
+    # Test 2: Random graphs round-trip
+    print("\nTEST 2: Random Graphs")
+    print("-" * 60)
+    rng = random.Random(4)
+    for _ in range(50):
+        n = rng.randint(1, 40)
+        adjacency = [[] for _ in range(n)]
+        for _ in range(rng.randint(0, 3 * n)):
+            u, v = rng.randrange(n), rng.randrange(n)
+            if u != v and v + 1 not in adjacency[u]:
+                adjacency[u].append(v + 1)
+                adjacency[v].append(u + 1)
+        original = graph_from_adjacency(adjacency)
+        expected = serialize_graph(original)
+        assert serialize_graph(cloneGraph_solution(original)) == expected
+        assert serialize_graph(cloneGraph_bulk(original)) == expected
+        assert serialize_graph(deserialize_graph(*expected, node_type=Node)) == expected
+    print("All random clones match")
+
+    # Test 3: Deep chain - recursion would overflow
+    print("\nTEST 3: 200k-Node Chain")
+    print("-" * 60)
+    n = 200000
+    chain = graph_from_adjacency([[2]] + [[i - 1, i + 1] for i in range(2, n)] + [[n - 1]])
+    tail = cloneGraph_solution(chain)
+    for _ in range(n - 1):
+        tail = tail.neighbors[-1]
+    assert tail.val == n
+    assert len(serialize_graph(cloneGraph_bulk(chain))[0]) == n
+    print(f"Cloned a {n}-node chain without recursion")
+
+    # Test 4: Memory of the clone
+    print("\nTEST 4: Clone Memory (Node vs SlotNode)")
+    print("-" * 60)
+    n = 20000
+    source = graph_from_adjacency([[(i + d) % n + 1 for d in (1, 7, n - 1)] for i in range(n)])
+    footprint = {}
+    clones = (('Node', cloneGraph_solution), ('SlotNode', cloneGraph_bulk), ('Compact', CompactGraph.from_node))
+    for name, clone in clones:
+        tracemalloc.start()
+        copy = clone(source)
+        footprint[name] = tracemalloc.get_traced_memory()[0]
+        tracemalloc.stop()
+        del copy
+        print(f"{name:8s}: {footprint[name] / n:6.1f} bytes/node")
+    assert footprint['SlotNode'] < 0.75 * footprint['Node']
+    assert footprint['Compact'] < 0.5 * footprint['Node']
+
+    compact = CompactGraph.from_node(graph_from_adjacency([[2, 4], [1, 3], [2, 4], [1, 3]]))
+    root = compact.root()
+    assert root.val == 1 and [nb.val for nb in root.neighbors] == [2, 4]
+    assert serialize_graph(root) == (compact.vals, compact.offsets, compact.targets)
+    assert serialize_graph(compact.to_nodes()) == serialize_graph(root)
+    print(f"CompactGraph of 4 nodes: {compact.nbytes()} bytes")
+
+    print("\n" + "=" * 60)
+
+
 if __name__ == "__main__":
     print("Module 7: Graph Problems with Hash Map")
+    print("\nRun test_graph_problems() to test cloneGraph")
@@ -8,7 +8,8 @@ In this module, we'll master:
 1. Heaps and Priority Queues (complete binary trees)
 2. Tries (Prefix Trees) for string operations
 3. Segment Trees (Advanced - range queries)
-4. Real-world applications
+4. Indexed heaps with decrease-key (concept; code lives with Dijkstra)
+5. Real-world applications
 
 These structures power: autocomplete, task scheduling, spell checkers, and more!
 """
@@ -208,6 +209,40 @@ class MinHeapSolution:
     def peek(self):
         return self.heap[0] if self.heap else None
 
+    def size(self):
+        return len(self.heap)
+
+"""
+CONCEPT: Indexed Heap (Decrease-Key)
+=====================================
+
+heapq has no decrease-key. Dijkstra and Prim work around it with LAZY
+DELETION: push a new (priority, item) every time a priority improves and
+skip stale entries on pop. On dense graphs the heap then grows to O(E).
+
+An INDEXED heap stores each item at most once and remembers where it is:
+
+    heap:     [item ids in heap order]        array('q')
+    keys:     keys[item] = current priority   array('d')
+    position: position[item] = index in heap, -1 if absent   array('q')
+
+decrease_key(item, key):
+1. keys[item] = key
+2. heapify_up(position[item])      ← only moves toward the root
+Every swap also updates position[] of both items.
+
+Items must be integers 0..capacity-1 (vertex ids).
+Heap size is bounded by V, not E.
+
+Time: insert/extract_min/decrease_key O(log n), contains O(1)
+Space: O(capacity)
+
+Implementation: IndexedMinHeap in 9_graph_fundamentals/module7_shortest_path.py,
+next to Dijkstra (and imported by Prim in module 8), which are its only users.
+It is MinHeapSolution's layout and heapify_up/heapify_down with two changes:
+compare keys[item] instead of the items, and update position[] on every swap.
+"""
+
 """
 HEAP PRACTICE PROBLEMS
 """
@@ -0,0 +1,584 @@
+"""
+Module 10: Matrix as Graph - Interactive Practice
+==================================================
+
+Treat a 2D grid as a graph - and make it fast enough for huge rasters!
+
+In this module, we'll cover:
+1. Grids as implicit graphs (cells = vertices, neighbors = edges)
+2. Flat buffers instead of lists of lists
+3. Connected-component labeling with a two-pass union-find scan
+4. Multi-source BFS distance transforms as vectorized wavefronts
+5. Fast paths for numIslands, orangesRotting and shortestPathBinaryMatrix
+
+Grids are everywhere: images, maps, game boards, raster masks!
+
+The grid engine needs NumPy; without it the *_grid_solution functions
+fall back to the list-based solutions of modules 2 and 3.
+"""
+
+from typing import List, Tuple
+
+try:
+    import numpy as np
+except ImportError:  # *_grid_solution fall back to the list-based BFS/DFS
+    np = None
+
+from module6_union_find import link_labels
+
+# =============================================================================
+# PART 1: GRIDS AS FLAT BUFFERS
+# =============================================================================
+
+"""
+CONCEPT: A Grid Is a Graph You Never Build
+===========================================
+
+Cell (r, c) is a vertex; its neighbors are the 4 (or 8) adjacent cells.
+There is no adjacency list - neighbors are computed from coordinates.
+
+numIslands_solution (module 2) and orangesRotting_solution (module 3)
+work on List[List[str]] one cell at a time:
+- every cell is a Python object (~50+ bytes)
+- recursion / deque operations per cell
+A 20k x 20k mask is 400M cells → hours, and recursion overflows.
+
+Flat buffer instead:
+- np.uint8 array (or a bytearray viewed with np.frombuffer): 1 byte/cell
+- cell (r, c) ↔ flat index r * width + c
+- Pad the grid with a border of blocked cells, then the neighbors of
+  flat index i are simply i ± 1 and i ± width → no bounds checks
+
+    width = W + 2 (padded)
+    neighbors (4-conn): i - 1, i + 1, i - width, i + width
+    diagonals (8-conn): i ± width ± 1
+
+Whole frontiers are then moved with array arithmetic, not Python loops.
+"""
+
+
+def as_grid(grid, shape: Tuple[int, int] = None, true_value=None) -> 'np.ndarray':
+    """
+    View any grid representation as a 2D numpy array (no copy when possible)
+
+    Args:
+        grid: np.ndarray, bytes/bytearray/memoryview (needs shape),
+              or List[List[...]] (e.g. the "0"/"1" strings of LC 200)
+        shape: (rows, cols) for flat byte buffers
+        true_value: if given, return the boolean mask grid == true_value
+
+    Returns:
+        np.ndarray - 2D array
+    """
+    _require_numpy()
+    if isinstance(grid, (bytes, bytearray, memoryview)):
+        if shape is None:
+            raise ValueError("shape is required for flat byte buffers")
+        array = np.frombuffer(grid, dtype=np.uint8).reshape(shape)
+    else:
+        array = np.asarray(grid)
+    if true_value is not None:
+        return array == true_value
+    return array
+
+
+def _require_numpy() -> None:
+    if np is None:
+        raise ImportError("the grid engine needs NumPy (the *_grid_solution functions work without it)")
+
+
+def _as_rows(grid, shape: Tuple[int, int] = None) -> List[list]:
+    """List-of-lists copy of any grid, for the pure-Python fallbacks"""
+    if isinstance(grid, (bytes, bytearray, memoryview)):
+        if shape is None:
+            raise ValueError("shape is required for flat byte buffers")
+        rows, cols = shape
+        flat = bytes(grid)
+        return [list(flat[r * cols:(r + 1) * cols]) for r in range(rows)]
+    return [list(row) for row in grid]
+
+
+def _padded(mask: 'np.ndarray') -> 'np.ndarray':
+    """Boolean mask with a one-cell False border on every side"""
+    rows, cols = mask.shape
+    padded = np.zeros((rows + 2, cols + 2), dtype=bool)
+    padded[1:-1, 1:-1] = mask
+    return padded
+
+
+def _neighbor_offsets(width: int, connectivity: int) -> 'np.ndarray':
+    """Flat-index offsets of the 4 or 8 neighbors in a grid of this width"""
+    offsets = [-1, 1, -width, width]
+    if connectivity == 8:
+        offsets += [-width - 1, -width + 1, width - 1, width + 1]
+    return np.array(offsets, dtype=np.int64)
+
+
+# =============================================================================
+# PART 2: CONNECTED-COMPONENT LABELING (TWO-PASS UNION-FIND)
+# =============================================================================
+
+"""
+CONCEPT: Two-Pass Labeling on Runs
+===================================
+
+Classic two-pass connected-component labeling:
+  Pass 1: scan row by row, give each cell a provisional label and record
+          "these labels touch" in a union-find
+  Pass 2: replace each provisional label by its union-find root
+
+Doing it per CELL is still 400M Python steps. Do it per RUN instead:
+a run is a maximal horizontal stretch of land in one row.
+
+Pass 1 (all vectorized):
+1. Runs: diff of each padded row → run starts (0→1) and ends (1→0)
+2. A run in row r+1 touches a run in row r when their column ranges
+   overlap (widened by 1 on each side for 8-connectivity)
+   Runs are sorted, so for each lower run the touching upper runs form
+   a contiguous range → two np.searchsorted calls find it for ALL runs
+3. link_labels(touching pairs)   (module 6): union-find on a NumPy
+   parent array - hook roots under the smaller root, pointer-jump
+
+Pass 2:
+4. Every set is labeled by its first run → compact labels 1..k
+5. Paint: +label at run start, -label at run end, cumulative sum
+
+Row bands keep memory flat on huge rasters: label a few million cells
+at a time, then union labels of runs that touch across each band
+border (only the two border rows are compared). Peak memory is the
+mask, the int32 label image and one band's scratch arrays.
+
+Example:
+    1 1 0 0        runs: row0 [0,2)   row1 [1,2)   row2 [3,4)
+    0 1 0 0        row1 run overlaps row0 run → union
+    0 0 0 1        labels: 1 1 0 0 / 0 1 0 0 / 0 0 0 2   → 2 islands
+
+Time: O(cells) array work + O(runs) union-find
+Space: O(cells) bytes + O(runs in one band)
+"""
+
+_BAND_CELLS = 1 << 22  # Cells labeled per row band (bounds the per-run arrays)
+
+
+def _runs(mask: 'np.ndarray'):
+    """Start/end keys of every horizontal run; key = row * (cols + 1) + col"""
+    rows, cols = mask.shape
+    # One zero column per row so runs never continue into the next row
+    flat = np.zeros((rows, cols + 1), dtype=np.int8)
+    flat[:, :cols] = mask
+    flat = flat.ravel()
+    edges = np.diff(np.concatenate(([0], flat)))
+    starts = np.flatnonzero(edges == 1)
+    ends = np.flatnonzero(edges == -1)
+    return starts, ends, cols + 1
+
+
+def _touching_runs(starts: 'np.ndarray', ends: 'np.ndarray', stride: int, connectivity: int) -> 'np.ndarray':
+    """(upper_run, lower_run) pairs of runs in consecutive rows that touch"""
+    # Project every run onto the row above it
+    slack = 1 if connectivity == 8 else 0
+    row_start = (starts // stride) * stride
+    lo = starts - stride - slack
+    hi = ends - stride + slack
+    # Clip to the row above so diagonal slack never wraps around a row
+    lo = np.maximum(lo, row_start - stride)
+    hi = np.minimum(hi, row_start - 1)
+
+    first = np.searchsorted(ends, lo, side='right')   # upper runs ending after lo
+    last = np.searchsorted(starts, hi, side='left')   # upper runs starting before hi
+    counts = np.maximum(last - first, 0)
+    has_row_above = starts >= stride
+    counts[~has_row_above] = 0
+
+    lower = np.repeat(np.arange(len(starts)), counts)
+    # first[b], first[b] + 1, ..., last[b] - 1 for every lower run b
+    step = np.arange(counts.sum()) - np.repeat(np.cumsum(counts) - counts, counts)
+    upper = np.repeat(first, counts) + step
+    return np.stack([upper, lower], axis=1)
+
+
+def _label_runs(starts: 'np.ndarray', ends: 'np.ndarray', stride: int, connectivity: int):
+    """Component 0..k-1 of every run, numbered in order of first run, and k"""
+    touching = _touching_runs(starts, ends, stride, connectivity)
+    roots = link_labels(np.arange(len(starts)), touching[:, 0], touching[:, 1])
+    is_root = roots == np.arange(len(starts))
+    return (np.cumsum(is_root) - 1)[roots], int(is_root.sum())
+
+
+def _paint(starts: 'np.ndarray', ends: 'np.ndarray', run_labels: 'np.ndarray',
+           rows: int, stride: int, cols: int) -> 'np.ndarray':
+    """int32 image with every run filled by its label (0 elsewhere)"""
+    paint = np.zeros(rows * stride, dtype=np.int32)
+    paint[starts] = run_labels   # A run start is never another run's end
+    paint[ends] = -run_labels
+    return np.cumsum(paint, dtype=np.int32).reshape(rows, stride)[:, :cols]
+
+
+def label_components(mask, connectivity: int = 4, return_labels: bool = True,
+                     band_rows: int = None):
+    """
+    Label connected regions of True cells
+
+    Example:
+        mask = [[1,1,0,0],[0,1,0,0],[0,0,0,1]]
+        label_components(mask) → (2, [[1,1,0,0],[0,1,0,0],[0,0,0,2]])
+
+    Args:
+        mask: 2D boolean-like array (True = land)
+        connectivity: 4 or 8
+        return_labels: also build the int32 label image (0 = background)
+        band_rows: rows labeled per band (default: about 4M cells)
+
+    Returns:
+        (count, labels) - labels is None when return_labels is False.
+        Labels are numbered in raster order of each region's first cell.
+
+    Time: O(cells). Measured on 20k x 20k (one core): a smooth mask of
+          100-cell blobs takes 4 s (8 s with labels); 50% random noise,
+          the worst case with ~100M runs and 26M islands, takes 30 s
+          (36 s with labels)
+    Space: mask + 4 bytes/cell for labels + one band's scratch arrays
+           (~300 MB for noise); peak 0.5-0.7 GB counting only, 2.0-2.3 GB
+           with the 1.6 GB label image
+    """
+    _require_numpy()
+    mask = np.asarray(mask)
+    rows, cols = mask.shape
+    if band_rows is None:
+        band_rows = max(1, _BAND_CELLS // max(cols, 1))
+    labels = np.zeros((rows, cols), dtype=np.int32) if return_labels else None
+
+    total = 0          # Components found so far; band labels start here
+    links = []         # (label, label) arrays of runs touching across a border
+    bottom = None      # Labels of the runs in the previous band's last row
+    for top in range(0, rows, band_rows):
+        band = mask[top:top + band_rows].astype(bool, copy=False)
+        height = len(band)
+        starts, ends, stride = _runs(band)
+        run_labels, k = _label_runs(starts, ends, stride, connectivity)
+        run_labels += total
+
+        if top:
+            # The border: previous band's last row over this band's first row
+            edge_starts, edge_ends, _ = _runs(mask[top - 1:top + 1].astype(bool, copy=False))
+            pairs = _touching_runs(edge_starts, edge_ends, stride, connectivity)
+            upper_runs = np.searchsorted(edge_starts, stride)
+            links.append(np.stack([bottom[pairs[:, 0]], run_labels[pairs[:, 1] - upper_runs]], axis=1))
+        bottom = run_labels[np.searchsorted(starts, (height - 1) * stride):]
+
+        if return_labels and k:
+            labels[top:top + height] = _paint(starts, ends, run_labels + 1, height, stride, cols)
+        total += k
+
+    # Pass 2 across bands: union linked labels, then compact to 1..count
+    links = np.concatenate(links) if links else np.empty((0, 2), dtype=np.int64)
+    if not len(links):
+        return total, labels
+    touched, local = np.unique(links, return_inverse=True)
+    local = local.reshape(-1, 2)
+    roots = touched[link_labels(np.arange(len(touched)), local[:, 0], local[:, 1])]
+    is_root = np.ones(total, dtype=bool)
+    is_root[touched] = roots == touched
+    relabel = np.zeros(total + 1, dtype=np.int32)
+    np.cumsum(is_root, out=relabel[1:])
+    relabel[touched + 1] = relabel[roots + 1]
+    count = int(is_root.sum())
+    if return_labels:
+        for top in range(0, rows, band_rows):
+            labels[top:top + band_rows] = relabel[labels[top:top + band_rows]]
+    return count, labels
+
+
+def numIslands_grid(grid, shape: Tuple[int, int] = None) -> int:
+    """
+    LC 200 on a flat buffer: count 4-connected islands of land
+
+    Args:
+        grid: List[List[str]] with "1"/"0", or a numpy/bytes grid of 1/0
+
+    Returns:
+        int - Number of islands (same as numIslands_solution)
+    """
+    # TODO: Convert to a boolean mask
+    # TODO: label_components(mask, return_labels=False)
+    pass
+
+
+# TEACHER'S SOLUTION:
+def numIslands_grid_solution(grid, shape: Tuple[int, int] = None) -> int:
+    """Run-based two-pass labeling"""
+    if np is None:
+        from module2_dfs import numIslands_solution
+        rows = _as_rows(grid, shape)
+        return numIslands_solution([["1" if cell in ("1", 1, True) else "0" for cell in row] for row in rows])
+    if isinstance(grid, list):
+        if not grid or not grid[0]:
+            return 0
+        mask = as_grid(grid, true_value="1") if isinstance(grid[0][0], str) else as_grid(grid) == 1
+    else:
+        mask = as_grid(grid, shape) == 1
+    count, _ = label_components(mask, connectivity=4, return_labels=False)
+    return count
+
+
+# =============================================================================
+# PART 3: MULTI-SOURCE BFS AS VECTORIZED WAVEFRONTS
+# =============================================================================
+
+"""
+CONCEPT: Distance Transform by Wavefronts
+==========================================
+
+Multi-source BFS on a grid = every source starts at distance 0, each
+step grows the wavefront by one cell in every direction.
+
+Vectorized step (frontier = array of flat indices):
+1. candidates = frontier[:, None] + neighbor_offsets     (all at once)
+2. keep candidates that are open and not yet visited
+3. np.unique → next frontier; write dist[next] = step
+
+Each cell enters exactly one frontier → O(cells) total work, but done
+in numpy chunks of a whole wavefront instead of one deque pop per cell.
+
+Applications:
+- orangesRotting: sources = rotten, open = fresh, answer = last step
+- shortestPathBinaryMatrix: source = (0,0), 8-connectivity, stop as
+  soon as the wavefront touches (n-1, n-1)
+
+Time: O(cells)
+Space: O(cells)
+"""
+
+
+def distance_transform(open_mask, sources, connectivity: int = 4, target: Tuple[int, int] = None) -> 'np.ndarray':
+    """
+    BFS distance from the nearest source to every open cell
+
+    Args:
+        open_mask: 2D boolean array - cells the wave may enter
+        sources: iterable of (row, col) start cells (distance 0)
+        connectivity: 4 or 8
+        target: optional (row, col) - stop as soon as it is reached
+
+    Returns:
+        np.ndarray int32 - distances, -1 where unreachable (or not yet
+        reached when stopping early)
+    """
+    _require_numpy()
+    open_mask = np.asarray(open_mask, dtype=bool)
+    rows, cols = open_mask.shape
+    width = cols + 2
+    passable = _padded(open_mask).ravel()
+    dist = np.full(passable.shape, -1, dtype=np.int32)
+    offsets = _neighbor_offsets(width, connectivity)
+
+    sources = np.asarray(list(sources), dtype=np.int64).reshape(-1, 2)
+    frontier = np.unique((sources[:, 0] + 1) * width + sources[:, 1] + 1)
+    dist[frontier] = 0
+    passable[frontier] = False  # Visited cells are no longer enterable
+    goal = (target[0] + 1) * width + target[1] + 1 if target is not None else -1
+
+    step = 0
+    while len(frontier):
+        if goal >= 0 and dist[goal] != -1:
+            break
+        step += 1
+        candidates = (frontier[:, None] + offsets).ravel()
+        candidates = candidates[passable[candidates]]
+        frontier = np.unique(candidates)
+        dist[frontier] = step
+        passable[frontier] = False
+
+    return dist.reshape(rows + 2, width)[1:-1, 1:-1]
+
+
+def orangesRotting_grid(grid) -> int:
+    """
+    LC 994 with a vectorized multi-source wavefront
+
+    Args:
+        grid: 2D grid (list or numpy) with 0 empty, 1 fresh, 2 rotten
+
+    Returns:
+        int - Minutes until no fresh orange remains, -1 if impossible
+    """
+    # TODO: sources = rotten cells, open cells = fresh cells
+    # TODO: distance_transform, then check every fresh cell was reached
+    pass
+
+
+# TEACHER'S SOLUTION:
+def orangesRotting_grid_solution(grid) -> int:
+    """Distance transform from all rotten oranges over fresh ones"""
+    if np is None:
+        from module3_bfs import orangesRotting_solution
+        return orangesRotting_solution(_as_rows(grid))
+    cells = as_grid(grid)
+    fresh = cells == 1
+    if not fresh.any():
+        return 0
+
+    rotten = np.argwhere(cells == 2)
+    dist = distance_transform(fresh, rotten, connectivity=4)
+    if (dist[fresh] == -1).any():
+        return -1
+    return int(dist[fresh].max())
+
+
+def shortestPathBinaryMatrix_grid(grid) -> int:
+    """
+    LC 1091 with a vectorized 8-connected wavefront
+
+    Args:
+        grid: n x n grid with 0 (walkable) and 1 (obstacle)
+
+    Returns:
+        int - Number of cells on the shortest path, -1 if unreachable
+    """
+    # TODO: Check both corners are walkable
+    # TODO: distance_transform from (0,0) with connectivity 8, target (n-1, n-1)
+    # TODO: Path length = distance + 1
+    pass
+
+
+# TEACHER'S SOLUTION:
+def shortestPathBinaryMatrix_grid_solution(grid) -> int:
+    """Early-terminating wavefront from the top-left corner"""
+    if np is None:
+        from module3_bfs import shortestPathBinaryMatrix_solution
+        return shortestPathBinaryMatrix_solution(_as_rows(grid))
+    cells = as_grid(grid)
+    if cells.size == 0:
+        return -1
+    rows, cols = cells.shape
+    walkable = cells == 0
+    if not walkable[0, 0] or not walkable[rows - 1, cols - 1]:
+        return -1
+
+    dist = distance_transform(walkable, [(0, 0)], connectivity=8, target=(rows - 1, cols - 1))
+    steps = dist[rows - 1, cols - 1]
+    return int(steps) + 1 if steps != -1 else -1
+
+
+# =============================================================================
+# PART 4: TESTING
+# =============================================================================
+
+def test_matrix_as_graph():
+    """Test grid engine against the list-based solutions"""
+    import copy
+    import random
+    import time
+    from module2_dfs import numIslands_solution
+    from module3_bfs import orangesRotting_solution, shortestPathBinaryMatrix_solution
+
+    print("=" * 60)
+    print("MATRIX AS GRAPH TEST SUITE")
+    print("=" * 60)
+
+    # Test Connected-Component Labeling
+    print("\nTEST 1: Two-Pass Connected-Component Labeling")
+    mask = [[1, 1, 0, 0], [0, 1, 0, 0], [0, 0, 0, 1]]
+    count, labels = label_components(mask)
+    print(f"Labels:\n{labels}")
+    assert count == 2
+    assert labels.tolist() == [[1, 1, 0, 0], [0, 1, 0, 0], [0, 0, 0, 2]]
+    assert label_components([[1, 0], [0, 1]], connectivity=8)[0] == 1
+    assert label_components([[1, 0], [0, 1]], connectivity=4)[0] == 2
+    print("✓ Labeling test passed")
+
+    # Test Number of Islands
+    print("\nTEST 2: Number of Islands (grid engine vs DFS)")
+    grid = [
+        ["1", "1", "0", "0", "0"],
+        ["1", "1", "0", "0", "0"],
+        ["0", "0", "1", "0", "0"],
+        ["0", "0", "0", "1", "1"]
+    ]
+    assert numIslands_grid_solution(grid) == 3
+    assert numIslands_grid_solution([]) == numIslands_grid_solution([[]]) == 0
+    buffer = bytearray(b"\x01\x00\x01\x00\x00\x01")
+    assert numIslands_grid_solution(buffer, shape=(2, 3)) == 2
+    rng = random.Random(4)
+    for trial in range(100):
+        rows, cols = rng.randint(1, 12), rng.randint(1, 12)
+        density = rng.random()
+        grid = [["1" if rng.random() < density else "0" for _ in range(cols)] for _ in range(rows)]
+        expected = numIslands_solution(copy.deepcopy(grid))
+        assert numIslands_grid_solution(grid) == expected, grid
+        count, labels = label_components(as_grid(grid, true_value="1"), connectivity=8)
+        assert (labels > 0).sum() == sum(row.count("1") for row in grid)
+    print("✓ Number of islands test passed")
+
+    # 8-connectivity against a plain BFS reference
+    def bfs_components(grid, connectivity):
+        steps = [(-1, 0), (1, 0), (0, -1), (0, 1)]
+        if connectivity == 8:
+            steps += [(-1, -1), (-1, 1), (1, -1), (1, 1)]
+        rows, cols = len(grid), len(grid[0])
+        labels = [[0] * cols for _ in range(rows)]
+        count = 0
+        for r in range(rows):
+            for c in range(cols):
+                if grid[r][c] and not labels[r][c]:
+                    count += 1
+                    labels[r][c] = count
+                    stack = [(r, c)]
+                    while stack:
+                        i, j = stack.pop()
+                        for di, dj in steps:
+                            a, b = i + di, j + dj
+                            if 0 <= a < rows and 0 <= b < cols and grid[a][b] and not labels[a][b]:
+                                labels[a][b] = count
+                                stack.append((a, b))
+        return count, labels
+
+    for trial in range(200):
+        rows, cols = rng.randint(1, 15), rng.randint(1, 15)
+        density = rng.random()
+        grid = [[int(rng.random() < density) for _ in range(cols)] for _ in range(rows)]
+        for connectivity in (4, 8):
+            expected_count, expected = bfs_components(grid, connectivity)
+            # Tiny bands force regions to be stitched across many borders
+            for band_rows in (None, 1, 2, 3):
+                count, labels = label_components(grid, connectivity=connectivity, band_rows=band_rows)
+                assert count == expected_count, (connectivity, band_rows, grid)
+                # Same partition, numbered in raster order: identical to the BFS labels
+                assert labels.tolist() == expected, (connectivity, band_rows, grid)
+    print("✓ 8-connectivity test passed")
+
+    # Test Rotting Oranges
+    print("\nTEST 3: Rotting Oranges (wavefront vs deque BFS)")
+    assert orangesRotting_grid_solution([[2, 1, 1], [1, 1, 0], [0, 1, 1]]) == 4
+    assert orangesRotting_grid_solution([[2, 1, 1], [0, 1, 1], [1, 0, 1]]) == -1
+    for trial in range(100):
+        rows, cols = rng.randint(1, 10), rng.randint(1, 10)
+        grid = [[rng.choice((0, 1, 1, 2)) for _ in range(cols)] for _ in range(rows)]
+        assert orangesRotting_grid_solution(grid) == orangesRotting_solution(copy.deepcopy(grid)), grid
+    print("✓ Rotting oranges test passed")
+
+    # Test Shortest Path in Binary Matrix
+    print("\nTEST 4: Shortest Path in Binary Matrix (8-connected wavefront)")
+    assert shortestPathBinaryMatrix_grid_solution([[0, 1], [1, 0]]) == 2
+    assert shortestPathBinaryMatrix_grid_solution([[0]]) == 1
+    for trial in range(100):
+        n = rng.randint(1, 10)
+        grid = [[1 if rng.random() < 0.3 else 0 for _ in range(n)] for _ in range(n)]
+        assert shortestPathBinaryMatrix_grid_solution(grid) == shortestPathBinaryMatrix_solution(grid), grid
+    print("✓ Binary matrix path test passed")
+
+    # Larger raster
+    print("\nTEST 5: 2000 x 2000 Raster")
+    raster = np.random.default_rng(0).random((2000, 2000)) < 0.5
+    began = time.perf_counter()
+    count, _ = label_components(raster, return_labels=False)
+    print(f"{count} islands labeled in {time.perf_counter() - began:.2f} s")
+    print("✓ Large raster test passed")
+
+    print("\n" + "=" * 60)
+
+
+if __name__ == "__main__":
+    print("Welcome to Module 10: Matrix as Graph!")
+    print("Turn grids into graphs - and scale them to huge rasters!")
+    print("\nComplete the TODOs, then run test_matrix_as_graph()")
@@ -10,12 +10,17 @@ In this module, we'll cover:
 3. DFS applications: paths, cycles, connectivity
 4. Visited tracking strategies
 5. Backtracking with DFS
+6. Explicit-stack DFS engine with event hooks (no recursion limit)
+7. Lazy path enumeration and path counting on large DAGs
 
 DFS is essential for: cycles, components, topological sort, and backtracking!
 """
 
-from typing import List, Dict, Set
+from typing import List, Dict, Set, Callable, Iterable, Optional
 from collections import defaultdict, deque
+from array import array
+
+from module1_graph_basics import CSRGraph
 
 # =============================================================================
 # PART 1: DFS FUNDAMENTALS
@@ -98,17 +103,19 @@ def dfs_recursive_helper(graph: Dict[int, List[int]], node: int, visited: Set[in
 
 # TEACHER'S SOLUTION:
 def dfs_recursive_solution(graph: Dict[int, List[int]], start: int) -> Set[int]:
-    """Recursive DFS implementation"""
-    visited = set()
-
-    def dfs(node):
-        if node in visited:
-            return
-        visited.add(node)
-        for neighbor in graph[node]:
-            dfs(neighbor)
+    """
+    Recursive DFS, run on the explicit-stack engine (PART 4)
 
-    dfs(start)
+    The recursive version is:
+        def dfs(node):
+            if node in visited: return
+            visited.add(node)
+            for neighbor in graph[node]: dfs(neighbor)
+    It raises RecursionError on paths longer than ~1000 nodes; the engine
+    visits in exactly the same order with no recursion.
+    """
+    visited = set()
+    dfs_events(graph, [start], on_enter=lambda node, parent: visited.add(node))
     return visited
 
 
@@ -163,7 +170,127 @@ def dfs_iterative_solution(graph: Dict[int, List[int]], start: int) -> Set[int]:
 
 
 # =============================================================================
-# PART 4: NUMBER OF ISLANDS (LC 200)
+# PART 4: EXPLICIT-STACK DFS ENGINE
+# =============================================================================
+
+"""
+CONCEPT: Recursion-Free DFS With Event Hooks
+============================================
+
+Recursive DFS uses one Python frame per node on the current path. Paths
+longer than ~1000 nodes raise RecursionError, and raising the limit just
+overflows the C stack on million-node graphs.
+
+The fix: keep the recursion stack ourselves. Each stack frame is
+(node, parent, position in node's neighbor list) - exactly what the
+recursive call would remember. For a CSRGraph the frames live in three
+array('q') stacks (24 bytes per frame), colors in a bytearray.
+
+Edge classification (3 colors, like module 4):
+- WHITE neighbor → tree edge: push it              → on_enter(child, node)
+- GRAY neighbor  → back edge (on current path)     → on_back_edge(node, nb)
+- BLACK neighbor → forward/cross edge (directed)   → on_cross_edge(node, nb)
+- Neighbors exhausted → pop                        → on_exit(node, parent)
+For undirected graphs every edge to a visited non-parent is a back edge.
+
+Any hook may return True to stop the whole search (e.g. "cycle found").
+Cycle detection, topological sort and SCC algorithms are all just
+different hooks on the same engine.
+
+Time: O(V + E)
+Space: O(V) - color array + stack, no Python frames
+"""
+
+WHITE, GRAY, BLACK = 0, 1, 2
+_EXHAUSTED = object()  # next() sentinel for adjacency-list iterators
+
+
+def dfs_events(graph, roots: Iterable[int], n: int = None, undirected: bool = False,
+               on_enter: Callable = None, on_exit: Callable = None,
+               on_back_edge: Callable = None, on_cross_edge: Callable = None) -> bool:
+    """
+    Iterative DFS from each still-unvisited root, firing event hooks
+
+    Args:
+        graph: Adjacency list or CSRGraph
+        roots: Start vertices, tried in order (e.g. range(n) for a full sweep)
+        n: Number of vertices 0..n-1 - enables a bytearray color table
+           (taken from the graph for a CSRGraph)
+        undirected: Treat edges to the parent as the tree edge, not a cycle
+        on_enter(node, parent), on_exit(node, parent): parent is None for roots
+        on_back_edge(node, neighbor), on_cross_edge(node, neighbor)
+
+    Returns:
+        bool - True if a hook stopped the search early
+
+    Time: O(V + E)
+    Space: O(V)
+    """
+    csr = isinstance(graph, CSRGraph)
+    if csr:
+        n = graph.n
+        offsets, targets = graph.offsets, graph.targets
+    color = bytearray(n) if n is not None else defaultdict(int)
+
+    for root in roots:
+        if color[root] != WHITE:
+            continue
+        color[root] = GRAY
+        if on_enter and on_enter(root, None):
+            return True
+
+        # Frame stacks: node, parent, and where we are in node's neighbors
+        if csr:
+            nodes, parents, cursor = array('q', [root]), array('q', [-1]), array('q', [offsets[root]])
+        else:
+            nodes, parents, cursor = [root], [None], [iter(graph[root])]
+
+        while nodes:
+            node = nodes[-1]
+            if csr:
+                position = cursor[-1]
+                exhausted = position == offsets[node + 1]
+                if not exhausted:
+                    neighbor = targets[position]
+                    cursor[-1] = position + 1
+            else:
+                neighbor = next(cursor[-1], _EXHAUSTED)
+                exhausted = neighbor is _EXHAUSTED
+
+            if exhausted:
+                nodes.pop()
+                parent = parents.pop()
+                cursor.pop()
+                color[node] = BLACK
+                if csr and parent == -1:
+                    parent = None
+                if on_exit and on_exit(node, parent):
+                    return True
+                continue
+
+            state = color[neighbor]
+            if state == WHITE:
+                color[neighbor] = GRAY
+                if on_enter and on_enter(neighbor, node):
+                    return True
+                nodes.append(neighbor)
+                parents.append(node)
+                cursor.append(offsets[neighbor] if csr else iter(graph[neighbor]))
+            elif undirected:
+                parent = parents[-1]
+                if neighbor != parent and on_back_edge and on_back_edge(node, neighbor):
+                    return True
+            elif state == GRAY:
+                if on_back_edge and on_back_edge(node, neighbor):
+                    return True
+            elif on_cross_edge and on_cross_edge(node, neighbor):
+                return True
+
+    return False
+
+
+# =============================================================================
+# PART 5: NUMBER OF ISLANDS (LC 200)
 # =============================================================================
 
 """
@@ -255,7 +382,7 @@ def numIslands_solution(grid: List[List[str]]) -> int:
 
 
 # =============================================================================
-# PART 5: ALL PATHS FROM SOURCE TO TARGET (LC 797)
+# PART 6: ALL PATHS FROM SOURCE TO TARGET (LC 797)
 # =============================================================================
 
 """
@@ -309,28 +436,190 @@ def allPathsSourceTarget(graph: List[List[int]]) -> List[List[int]]:
 
 # TEACHER'S SOLUTION:
 def allPathsSourceTarget_solution(graph: List[List[int]]) -> List[List[int]]:
-    """Find all paths using DFS with backtracking"""
+    """Find all paths by draining the lazy enumerator (see PART 7)"""
+    return list(iter_paths(graph))
+
+
+# =============================================================================
+# PART 7: PATH ENUMERATION ON LARGE DAGS
+# =============================================================================
+
+"""
+CONCEPT: Count First, Then Enumerate Lazily
+============================================
+
+Backtracking DFS has two problems on DAGs with heavy fan-in:
+- It re-walks every shared suffix from scratch, INCLUDING suffixes that
+  never reach the target (dead ends are re-explored once per prefix)
+- It collects every path in one list → memory grows with the output
+
+Layered DAG, 2 nodes per layer, every node → both nodes of next layer:
+    30 layers → 2^30 ≈ 1 billion paths. You cannot hold them; you can
+    count them and stream them.
+
+Step 1 - Path counting DP (memoized on the DAG, one post-order pass):
+    count[target] = 1
+    count[u]      = sum(count[v] for v in graph[u])
+Every suffix is computed ONCE and shared by every prefix that reaches it.
+Time: O(V + E), independent of the number of paths.
+
+Step 2 - Lazy enumeration:
+    live[u] = [v for v in graph[u] if count[v] > 0]   (memoized per node)
+Walk only live edges with an explicit stack and yield each path when the
+target is reached. Every step extends a path that is guaranteed to
+finish → O(path length) per yielded path, no dead-end work, O(V) memory.
+
+count_paths(graph)           → 4
+for path in iter_paths(graph): ...  streams [0,1,3], [0,2,3], ...
+itertools.islice(iter_paths(graph), 1000) → first 1000 paths only
+
+Both stop at the target (its out-edges are never followed, as in the
+backtracking version). A cycle is only an error if it can reach the
+target - then there are infinitely many walks. Cycles in dead ends or
+beyond the target are ignored; their vertices simply count 0.
+"""
+
+
+class _StopAtTarget:
+    """Adjacency view that gives the target no out-edges, so sweeps end there"""
+
+    def __init__(self, graph, target: int):
+        self.neighbors = graph.neighbors if isinstance(graph, CSRGraph) else graph.__getitem__
+        self.target = target
+        self.n = len(graph)
+
+    def __len__(self) -> int:
+        return self.n
+
+    def __getitem__(self, u: int):
+        return () if u == self.target else self.neighbors(u)
+
+
+def _reaches_target(view: _StopAtTarget, visited: List[int]) -> bytearray:
+    """Flag every visited vertex with a path to view.target (reverse BFS)"""
+    reverse = defaultdict(list)
+    for u in visited:
+        for v in view[u]:
+            reverse[v].append(u)
+
+    reaches = bytearray(len(view))
+    reaches[view.target] = 1
+    queue = deque([view.target])
+    while queue:
+        v = queue.popleft()
+        for u in reverse[v]:
+            if not reaches[u]:
+                reaches[u] = 1
+                queue.append(u)
+    return reaches
+
+
+def path_counts(graph, source: int = 0, target: Optional[int] = None) -> List[int]:
+    """
+    Number of paths from every vertex reachable from source to target
+
+    Args:
+        graph: DAG adjacency list (List[List[int]] or CSRGraph), nodes 0..n-1
+        source: Start vertex of the sweep
+        target: Destination (default n-1, as in LC 797)
+
+    Returns:
+        counts[u] = number of u → target paths (0 if unreachable / not visited)
+
+    Raises:
+        ValueError: if a cycle reachable from source can also reach target
+    """
     n = len(graph)
-    results = []
+    target = n - 1 if target is None else target
+    view = _StopAtTarget(graph, target)
+    counts = [0] * n
+    visited, back_edges = [], []
 
-    def dfs(node, path):
-        # Reached target
-        if node == n - 1:
-            results.append(path[:])  # Add copy of path
-            return
+    def on_enter(node, parent):
+        visited.append(node)
+
+    def on_exit(node, parent):
+        counts[node] = 1 if node == target else sum(counts[v] for v in view[node])
 
-        # Explore neighbors
-        for neighbor in graph[node]:
-            path.append(neighbor)
-            dfs(neighbor, path)
-            path.pop()  # Backtrack
+    def on_back_edge(node, neighbor):
+        back_edges.append((node, neighbor))
 
-    dfs(0, [0])
-    return results
+    dfs_events(view, [source], n=n, on_enter=on_enter, on_exit=on_exit,
+               on_back_edge=on_back_edge)
+
+    # A back edge closes a cycle through neighbor; it only matters if that
+    # cycle can reach the target, otherwise every vertex on it counts 0
+    if back_edges:
+        reaches = _reaches_target(view, visited)
+        for node, neighbor in back_edges:
+            if reaches[neighbor]:
+                raise ValueError(f"cycle through {node} → {neighbor} reaches {target}: "
+                                 "infinitely many paths")
+    return counts
+
+
+def count_paths(graph, source: int = 0, target: Optional[int] = None) -> int:
+    """
+    Count source → target paths in a DAG without materializing any
+
+    Example:
+        graph = [[1,2],[3],[3],[]]
+        Returns: 2
+
+    Time: O(V + E)
+    Space: O(V)
+    """
+    return path_counts(graph, source, target)[source]
+
+
+def iter_paths(graph, source: int = 0, target: Optional[int] = None):
+    """
+    Yield every source → target path of a DAG, one list at a time
+
+    Same order as backtracking DFS (neighbors in adjacency order), but only
+    edges that can still reach the target are ever followed.
+
+    Example:
+        list(iter_paths([[1,2],[3],[3],[]])) → [[0,1,3], [0,2,3]]
+
+    Time: O(V + E) setup + O(path length) per path
+    Space: O(V) besides the yielded paths
+    """
+    n = len(graph)
+    target = n - 1 if target is None else target
+    counts = path_counts(graph, source, target)
+    if not counts[source]:
+        return
+    if source == target:
+        yield [source]
+        return
+
+    live = [None] * n  # Memoized successors that still reach the target
+
+    def successors(u):
+        if live[u] is None:
+            live[u] = [v for v in graph[u] if counts[v]]
+        return live[u]
+
+    path = [source]
+    stack = [iter(successors(source))]
+    while stack:
+        v = next(stack[-1], _EXHAUSTED)
+        if v is _EXHAUSTED:
+            stack.pop()
+            path.pop()
+            continue
+
+        path.append(v)
+        if v == target:
+            yield path[:]
+            path.pop()
+        else:
+            stack.append(iter(successors(v)))
 
 
 # =============================================================================
-# PART 6: TESTING
+# PART 8: TESTING
 # =============================================================================
 
 def test_dfs():
@@ -378,8 +667,84 @@ def test_dfs():
     assert len(result) == 2
     assert [0, 1, 3] in result
     assert [0, 2, 3] in result
+    assert allPathsSourceTarget_solution([[]]) == [[0]]
     print("✓ All paths test passed")
 
+    # Test DFS on CSR graph
+    print("\nTEST 5: DFS on CSRGraph")
+    csr = CSRGraph.from_edges(4, [[0, 1], [0, 2], [1, 3], [2, 3]], directed=True)
+    assert dfs_recursive_solution(csr, 0) == {0, 1, 2, 3}
+    assert dfs_iterative_solution(csr, 0) == {0, 1, 2, 3}
+    assert allPathsSourceTarget_solution(csr) == result
+    print("✓ CSR DFS test passed")
+
+    # Test explicit-stack engine on a path far deeper than the recursion limit
+    print("\nTEST 6: Explicit-Stack DFS Engine")
+    n = 200000
+    chain = {i: [i + 1] for i in range(n - 1)}
+    chain[n - 1] = []
+    assert len(dfs_recursive_solution(chain, 0)) == n
+    csr_chain = CSRGraph.from_edges(n, [(i, i + 1) for i in range(n - 1)], directed=True)
+    finish = []
+    dfs_events(csr_chain, [0], on_exit=lambda node, parent: finish.append(node))
+    assert finish[0] == n - 1 and finish[-1] == 0
+    back_edges = []
+    dfs_events({0: [1], 1: [2], 2: [0]}, [0], on_back_edge=lambda u, v: back_edges.append((u, v)))
+    assert back_edges == [(2, 0)]
+    print(f"Visited a {n}-node path without recursion")
+    print("✓ DFS engine test passed")
+
+    # Test lazy path enumeration against plain backtracking
+    print("\nTEST 7: Path Counting and Lazy Enumeration")
+    import itertools
+    import random
+
+    def backtrack(graph):
+        paths, target = [], len(graph) - 1
+
+        def dfs(node, path):
+            if node == target:
+                paths.append(path[:])
+                return
+            for neighbor in graph[node]:
+                path.append(neighbor)
+                dfs(neighbor, path)
+                path.pop()
+
+        dfs(0, [0])
+        return paths
+
+    rng = random.Random(5)
+    for trial in range(100):
+        n = rng.randint(1, 12)
+        dag = [sorted(rng.sample(range(u + 1, n), rng.randint(0, n - u - 1))) for u in range(n)]
+        expected = backtrack(dag)
+        assert list(iter_paths(dag)) == expected, trial
+        assert count_paths(dag) == len(expected)
+
+    layers = 30  # 2 nodes per layer, complete between layers → 2^30 paths
+    layered = [[1, 2]] + [[2 * i + 1, 2 * i + 2] for i in range(1, layers) for _ in range(2)]
+    layered += [[2 * layers + 1]] * 2 + [[]]
+    assert count_paths(layered) == 2 ** layers
+    first = list(itertools.islice(iter_paths(layered), 1000))
+    assert len(first) == 1000 and all(len(path) == layers + 2 for path in first)
+    print(f"Layered DAG: {count_paths(layered)} paths counted, first {len(first)} streamed")
+    try:
+        count_paths([[1], [0, 2], []])
+        assert False, "cycle not detected"
+    except ValueError:
+        pass
+    # Cycles beyond the target or in dead ends do not affect the count
+    dead_end = [[1, 3], [2], [1], []]  # 1 ↔ 2 never reaches 3
+    assert count_paths(dead_end) == 1
+    assert list(iter_paths(dead_end)) == [[0, 3]]
+    past_target = [[1, 2], [2], [3], [2]]  # 2 ↔ 3 only after the target
+    assert count_paths(past_target, target=2) == 2
+    assert list(iter_paths(past_target, target=2)) == [[0, 1, 2], [0, 2]]
+    csr = CSRGraph.from_adjacency_list(dict(enumerate(past_target)), 4)
+    assert count_paths(csr, target=2) == 2
+    print("✓ Path enumeration test passed")
+
     print("\n" + "=" * 60)
 
 
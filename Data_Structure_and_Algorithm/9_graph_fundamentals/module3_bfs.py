@@ -10,12 +10,20 @@ In this module, we'll cover:
 3. BFS applications: level-order, multi-source, minimum steps
 4. Bidirectional BFS (advanced)
 5. 0-1 BFS for weighted graphs
+6. Parallel multi-source / all-pairs BFS across processes
+7. Direction-optimizing BFS with bitmap frontiers
 
 BFS is essential for: shortest path, level-order, minimum steps!
 """
 
-from typing import List, Dict, Set, Tuple
+from typing import List, Dict, Set, Tuple, Iterator
 from collections import defaultdict, deque
+from array import array
+from concurrent.futures import ProcessPoolExecutor, as_completed
+from multiprocessing import shared_memory
+import os
+
+from module1_graph_basics import CSRGraph
 
 # =============================================================================
 # PART 1: BFS FUNDAMENTALS
@@ -357,7 +365,322 @@ def shortestPathBinaryMatrix_solution(grid: List[List[int]]) -> int:
 
 
 # =============================================================================
-# PART 6: TESTING
+# PART 6: PARALLEL MULTI-SOURCE BFS
+# =============================================================================
+
+"""
+CONCEPT: Batch BFS Across Processes
+====================================
+
+All-pairs (or k-source) hop distances = one independent BFS per source.
+Independent work → split the sources across a process pool.
+
+The catch: shipping the graph to every task by pickling costs O(V + E)
+per task and multiplies memory by the number of workers.
+
+Instead:
+1. Convert the graph to CSR (module 1) and copy offsets/targets ONCE into
+   a multiprocessing SharedMemory block
+2. Each worker attaches to the block when it starts and wraps it in a
+   CSRGraph of memoryviews - no copy, no pickling
+3. Tasks are just chunks of source ids; each returns compact distance
+   rows (array('q'), -1 = unreachable)
+4. Rows are yielded as chunks finish (as_completed), so the caller can
+   stream them to disk instead of holding a V x V matrix
+
+Time: O(k * (V + E)) total, divided across workers
+Space: O(V + E) shared + O(V) per in-flight row
+"""
+
+# Per-worker handle to the shared graph (set by _attach_shared_graph)
+_shared_block = None
+_shared_graph = None
+
+
+def _share_graph(graph: CSRGraph) -> shared_memory.SharedMemory:
+    """Copy offsets and targets into one shared memory block"""
+    offsets_bytes = 8 * (graph.n + 1)
+    targets_bytes = 8 * graph.num_edges
+    block = shared_memory.SharedMemory(create=True, size=max(1, offsets_bytes + targets_bytes))
+    block.buf[:offsets_bytes] = memoryview(graph.offsets).cast('B')
+    block.buf[offsets_bytes:offsets_bytes + targets_bytes] = memoryview(graph.targets).cast('B')
+    return block
+
+
+def _attach_shared_graph(name: str, n: int, m: int):
+    """Worker initializer: view the shared block as a CSRGraph"""
+    global _shared_block, _shared_graph
+    _shared_block = shared_memory.SharedMemory(name=name)
+    raw = _shared_block.buf
+    offsets = raw[:8 * (n + 1)].cast('q')
+    targets = raw[8 * (n + 1):8 * (n + 1 + m)].cast('q')
+    _shared_graph = CSRGraph(n, offsets, targets)
+
+
+def _bfs_distance_row(graph: CSRGraph, source: int) -> array:
+    """Hop distance from source to every vertex, -1 if unreachable"""
+    offsets, targets = graph.offsets, graph.targets
+    dist = array('q', [-1]) * graph.n
+    dist[source] = 0
+    frontier = [source]
+    level = 0
+
+    while frontier:
+        level += 1
+        next_frontier = []
+        for node in frontier:
+            for i in range(offsets[node], offsets[node + 1]):
+                neighbor = targets[i]
+                if dist[neighbor] == -1:
+                    dist[neighbor] = level
+                    next_frontier.append(neighbor)
+        frontier = next_frontier
+
+    return dist
+
+
+def _bfs_rows_task(sources: List[int]) -> List[Tuple[int, array]]:
+    """Pool task: one distance row per source, computed on the shared graph"""
+    return [(source, _bfs_distance_row(_shared_graph, source)) for source in sources]
+
+
+def multi_source_bfs(graph, sources: List[int], n: int = None, workers: int = None,
+                     chunk_size: int = 8) -> Iterator[Tuple[int, array]]:
+    """
+    Stream BFS distance rows for many sources, computed in parallel
+
+    Example:
+        graph = {0: [1, 2], 1: [3], 2: [3], 3: []}
+        dict(multi_source_bfs(graph, [0, 3]))
+        → {0: array('q', [0, 1, 1, 2]), 3: array('q', [-1, -1, -1, 0])}
+
+    Args:
+        graph: Adjacency list over vertices 0..n-1, or an unweighted CSRGraph
+        sources: Start vertices
+        n: Number of vertices (required for adjacency lists)
+        workers: Process count (default os.cpu_count(); 1 = run in-process)
+        chunk_size: Sources per task - larger chunks, less scheduling overhead
+
+    Yields:
+        (source, distances) in completion order; distances[v] = -1 if unreachable
+
+    Time: O(len(sources) * (V + E) / workers)
+    """
+    if not isinstance(graph, CSRGraph):
+        if n is None:
+            raise ValueError("n is required when graph is an adjacency list")
+        graph = CSRGraph.from_adjacency_list(graph, n)
+
+    workers = workers or os.cpu_count() or 1
+    if workers == 1:
+        for source in sources:
+            yield source, _bfs_distance_row(graph, source)
+        return
+
+    block = _share_graph(graph)
+    try:
+        with ProcessPoolExecutor(
+            max_workers=workers,
+            initializer=_attach_shared_graph,
+            initargs=(block.name, graph.n, graph.num_edges),
+        ) as pool:
+            chunks = [sources[i:i + chunk_size] for i in range(0, len(sources), chunk_size)]
+            futures = [pool.submit(_bfs_rows_task, chunk) for chunk in chunks]
+            for future in as_completed(futures):
+                yield from future.result()
+    finally:
+        block.close()
+        block.unlink()
+
+
+def all_pairs_bfs(graph, n: int, workers: int = None) -> List[array]:
+    """
+    All-pairs hop distance matrix: result[s][v], -1 if unreachable
+
+    Args:
+        graph: Adjacency list over vertices 0..n-1, or CSRGraph
+        n: Number of vertices
+        workers: Process count
+
+    Returns:
+        List of n distance rows (array('q'))
+    """
+    # TODO: Run multi_source_bfs over every vertex
+    # TODO: Place each streamed row at its source index
+    pass
+
+
+# TEACHER'S SOLUTION:
+def all_pairs_bfs_solution(graph, n: int, workers: int = None) -> List[array]:
+    """All-pairs BFS on a process pool with a shared-memory graph"""
+    matrix = [None] * n
+    for source, row in multi_source_bfs(graph, list(range(n)), n=n, workers=workers):
+        matrix[source] = row
+    return matrix
+
+
+def benchmark_multi_source_bfs(n: int = 20000, avg_degree: int = 8, sources: int = 64, seed: int = 0):
+    """Time k-source BFS with 1, 2, 4, ... workers up to os.cpu_count()"""
+    import random
+    import time
+
+    rng = random.Random(seed)
+    edges = [(rng.randrange(n), rng.randrange(n)) for _ in range(n * avg_degree // 2)]
+    graph = CSRGraph.from_edges(n, edges)
+    source_ids = rng.sample(range(n), sources)
+
+    results = {}
+    workers = 1
+    while workers <= (os.cpu_count() or 1):
+        began = time.perf_counter()
+        for _ in multi_source_bfs(graph, source_ids, workers=workers):
+            pass
+        results[workers] = time.perf_counter() - began
+        print(f"  {workers:3d} workers: {results[workers]:.2f} s  "
+              f"(speedup {results[1] / results[workers]:.1f}x)")
+        workers *= 2
+    return results
+
+
+# =============================================================================
+# PART 7: DIRECTION-OPTIMIZING BFS (BITMAP FRONTIERS)
+# =============================================================================
+
+"""
+CONCEPT: Level-Synchronous, Direction-Optimizing BFS
+=====================================================
+
+bfs_solution pays a hash insert + lookup per visited node (set) and a
+deque push/pop per node. With vertex ids 0..n-1 we can do better:
+
+1. BITMAPS instead of hash sets
+   - visited = bytearray(n): visited[v] is one byte, test/set is an index
+   - bytearray.find(0, i) jumps over runs of visited vertices in C
+
+2. LEVEL-SYNCHRONOUS frontiers
+   - Process the whole current level, build the next one, swap
+
+3. TOP-DOWN vs BOTTOM-UP (Beamer et al.)
+   - Top-down: every frontier vertex scans its out-edges
+       cost ≈ edges out of the frontier (m_f)
+   - Bottom-up: every UNVISITED vertex scans its in-edges and stops at
+     the FIRST parent found in the frontier bitmap
+       cost ≈ edges into unvisited vertices, but with early exit
+   - On low-diameter social graphs the middle levels contain most of the
+     graph → bottom-up checks a handful of edges per vertex instead of
+     all of them
+
+   Switch rules (alpha = 14, beta = 24):
+       top-down → bottom-up when m_f > m_u / alpha   (m_u = unexplored edges)
+       bottom-up → top-down when |frontier| < n / beta
+
+Time: O(V + E) worst case, far fewer edge checks on small-world graphs
+Space: O(V) bytes for the bitmaps
+"""
+
+
+def bfs_direction_optimizing(graph, start: int, n: int = None) -> Set[int]:
+    """
+    BFS that switches between top-down and bottom-up steps
+
+    Example:
+        graph = {0: [1, 2], 1: [3], 2: [3], 3: []}
+        bfs_direction_optimizing(graph, 0, 4) → {0, 1, 2, 3}
+
+    Args:
+        graph: Adjacency list over 0..n-1 (plain ids or (v, w) pairs), or CSRGraph
+        start: Starting vertex
+        n: Number of vertices (default: largest vertex id + 1)
+
+    Returns:
+        Set of visited vertices (same as bfs_solution)
+
+    Time: O(V + E)
+    Space: O(V)
+    """
+    # TODO: visited = bytearray(n), frontier = [start]
+    # TODO: Each level: estimate m_f (edges out of frontier) and m_u (unexplored edges)
+    # TODO: Top-down step: scan out-edges of each frontier vertex
+    # TODO: Bottom-up step: each unvisited vertex looks for a parent in the frontier bitmap
+    pass
+
+
+# TEACHER'S SOLUTION:
+def bfs_direction_optimizing_solution(graph, start: int, n: int = None, reverse: CSRGraph = None,
+                                      alpha: int = 14, beta: int = 24,
+                                      stats: Dict[str, int] = None) -> Set[int]:
+    """Direction-optimizing BFS on CSR arrays with bytearray bitmaps"""
+    if not isinstance(graph, CSRGraph):
+        # Weighted entries are (v, w) pairs - BFS only needs the neighbor ids
+        graph = {u: [v[0] if isinstance(v, (tuple, list)) else v for v in vs]
+                 for u, vs in graph.items()}
+        if n is None:
+            n = 1 + max([start] + [v for u, vs in graph.items() for v in [u, *vs]])
+        graph = CSRGraph.from_adjacency_list(graph, n)
+    n = graph.n
+    if reverse is None:
+        # In-edges for the bottom-up step (pass reverse=graph for undirected graphs)
+        reverse = CSRGraph.from_edges(n, [(v, u) for u, v in graph.edges()], directed=True)
+
+    offsets, targets = graph.offsets, graph.targets
+    in_offsets, in_targets = reverse.offsets, reverse.targets
+
+    visited = bytearray(n)
+    visited[start] = 1
+    frontier = [start]
+    edges_unexplored = graph.num_edges - graph.degree(start)
+    bottom_up = False
+    bottom_up_levels = 0
+
+    while frontier:
+        edges_frontier = sum(offsets[u + 1] - offsets[u] for u in frontier)
+
+        if not bottom_up and edges_frontier > edges_unexplored / alpha:
+            bottom_up = True
+        elif bottom_up and len(frontier) < n / beta:
+            bottom_up = False
+
+        next_frontier = []
+        if bottom_up:
+            bottom_up_levels += 1
+            in_frontier = bytearray(n)
+            for u in frontier:
+                in_frontier[u] = 1
+
+            v = visited.find(0)
+            while v != -1:
+                for i in range(in_offsets[v], in_offsets[v + 1]):
+                    if in_frontier[in_targets[i]]:
+                        # First parent found - stop scanning v's in-edges
+                        next_frontier.append(v)
+                        break
+                v = visited.find(0, v + 1)
+            for v in next_frontier:
+                visited[v] = 1
+        else:
+            for u in frontier:
+                for i in range(offsets[u], offsets[u + 1]):
+                    v = targets[i]
+                    if not visited[v]:
+                        visited[v] = 1
+                        next_frontier.append(v)
+
+        edges_unexplored -= sum(offsets[v + 1] - offsets[v] for v in next_frontier)
+        frontier = next_frontier
+
+    if stats is not None:
+        stats['bottom_up_levels'] = bottom_up_levels
+
+    result = set()
+    v = visited.find(1)
+    while v != -1:
+        result.add(v)
+        v = visited.find(1, v + 1)
+    return result
+
+
+# =============================================================================
+# PART 8: TESTING
 # =============================================================================
 
 def test_bfs():
@@ -400,6 +723,63 @@ def test_bfs():
     assert result == 2
     print("✓ Binary matrix path test passed")
 
+    # Test BFS on CSR graph
+    print("\nTEST 5: BFS on CSRGraph")
+    csr = CSRGraph.from_edges(4, [[0, 1], [0, 2], [1, 3], [2, 3]], directed=True)
+    assert bfs_solution(csr, 0) == {0, 1, 2, 3}
+    assert shortestPath_solution(csr, 0, 3) == 2
+    assert shortestPath_solution(csr, 3, 0) == -1
+    print("✓ CSR BFS test passed")
+
+    # Test BFS on a memory-mapped graph file
+    print("\nTEST 6: BFS on a Memory-Mapped Graph")
+    import os
+    import tempfile
+    path = os.path.join(tempfile.mkdtemp(), "graph.csrg")
+    csr.save(path)
+    with CSRGraph.load(path) as mapped:
+        assert bfs_solution(mapped, 1) == {1, 3}
+    os.remove(path)
+    print("✓ Memory-mapped BFS test passed")
+
+    # Test parallel multi-source BFS
+    print("\nTEST 7: Parallel All-Pairs BFS")
+    graph = {0: [1, 2], 1: [3], 2: [3], 3: []}
+    matrix = all_pairs_bfs_solution(graph, 4, workers=2)
+    print(f"Distance matrix: {[row.tolist() for row in matrix]}")
+    for s in range(4):
+        for t in range(4):
+            assert matrix[s][t] == shortestPath_solution(graph, s, t)
+    assert [row.tolist() for row in all_pairs_bfs_solution(graph, 4, workers=1)] == \
+        [row.tolist() for row in matrix]
+    print("✓ Parallel BFS test passed")
+
+    # Test direction-optimizing BFS
+    print("\nTEST 8: Direction-Optimizing BFS")
+    import random
+    rng = random.Random(3)
+    assert bfs_direction_optimizing_solution({0: [1, 2], 1: [3], 2: [3], 3: []}, 0) == {0, 1, 2, 3}
+    weighted = {0: [[1, 50], [2, 7]], 1: [(3, 9)], 2: [], 3: []}  # n from ids, not weights
+    assert bfs_direction_optimizing_solution(weighted, 0) == {0, 1, 2, 3}
+    for trial in range(30):
+        n = rng.randint(1, 200)
+        edges = [(rng.randrange(n), rng.randrange(n)) for _ in range(rng.randint(0, 6 * n))]
+        graph = defaultdict(list)
+        for u, v in edges:
+            graph[u].append(v)
+        start = rng.randrange(n)
+        assert bfs_direction_optimizing_solution(graph, start, n) == bfs_solution(graph, start)
+
+    # Small-world style graph: dense enough that the bottom-up step kicks in
+    n = 2000
+    social = CSRGraph.from_edges(n, [(rng.randrange(n), rng.randrange(n)) for _ in range(10 * n)])
+    stats = {}
+    result = bfs_direction_optimizing_solution(social, 0, reverse=social, stats=stats)
+    assert result == bfs_solution(social, 0)
+    print(f"Visited {len(result)} nodes, {stats['bottom_up_levels']} bottom-up levels")
+    assert stats['bottom_up_levels'] > 0
+    print("✓ Direction-optimizing BFS test passed")
+
     print("\n" + "=" * 60)
 
 
@@ -407,3 +787,4 @@ if __name__ == "__main__":
     print("Welcome to Module 3: Breadth-First Search!")
     print("Master BFS for shortest paths and level-order exploration!")
     print("\nComplete the TODOs, then run test_bfs()")
+    print("Run benchmark_multi_source_bfs() to see scaling across cores")
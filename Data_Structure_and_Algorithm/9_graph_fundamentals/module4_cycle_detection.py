@@ -10,12 +10,20 @@ In this module, we'll cover:
 3. Union-Find approach for undirected graphs
 4. Applications: dependency resolution, course scheduling
 5. Back edges and forward edges
+6. Strongly connected components (Tarjan and Kosaraju)
+
+All DFS here runs on the explicit-stack engine from module 2, so graphs
+with million-node paths work without RecursionError.
 
 Cycle detection is crucial for: task scheduling, dependency resolution!
 """
 
 from typing import List, Dict, Set
 from collections import defaultdict, deque
+from array import array
+
+from module1_graph_basics import CSRGraph
+from module2_dfs import dfs_events
 
 # =============================================================================
 # PART 1: CYCLE DETECTION IN UNDIRECTED GRAPHS
@@ -77,35 +85,13 @@ def hasCycle_undirected(n: int, edges: List[List[int]]) -> bool:
 # TEACHER'S SOLUTION:
 def hasCycle_undirected_solution(n: int, edges: List[List[int]]) -> bool:
     """Detect cycle in undirected graph using DFS"""
-    # Build adjacency list
-    graph = defaultdict(list)
-    for u, v in edges:
-        graph[u].append(v)
-        graph[v].append(u)
-
-    visited = set()
-
-    def dfs(node, parent):
-        visited.add(node)
-
-        for neighbor in graph[node]:
-            if neighbor not in visited:
-                # Explore unvisited neighbor
-                if dfs(neighbor, node):
-                    return True
-            elif neighbor != parent:
-                # Found back edge (cycle)
-                return True
+    # Build adjacency list (flat CSR arrays keep 10M-node graphs small)
+    graph = CSRGraph.from_edges(n, edges)
 
-        return False
-
-    # Check each component
-    for i in range(n):
-        if i not in visited:
-            if dfs(i, -1):
-                return True
-
-    return False
+    # Check each component: any visited neighbor other than the parent
+    # is a back edge → cycle. Returning True from the hook stops the DFS.
+    return dfs_events(graph, range(n), undirected=True,
+                      on_back_edge=lambda node, neighbor: True)
 
 
 # =============================================================================
@@ -166,36 +152,11 @@ def hasCycle_directed(n: int, edges: List[List[int]]) -> bool:
 # TEACHER'S SOLUTION:
 def hasCycle_directed_solution(n: int, edges: List[List[int]]) -> bool:
     """Detect cycle in directed graph using 3-color DFS"""
-    graph = defaultdict(list)
-    for u, v in edges:
-        graph[u].append(v)
-
-    # 0: WHITE (unvisited), 1: GRAY (visiting), 2: BLACK (visited)
-    color = [0] * n
-
-    def dfs(node):
-        if color[node] == 1:
-            return True  # Back edge found (cycle)
-
-        if color[node] == 2:
-            return False  # Already explored
+    graph = CSRGraph.from_edges(n, edges, directed=True)
 
-        color[node] = 1  # Mark as GRAY (visiting)
-
-        for neighbor in graph[node]:
-            if dfs(neighbor):
-                return True
-
-        color[node] = 2  # Mark as BLACK (visited)
-        return False
-
-    # Check each node
-    for i in range(n):
-        if color[i] == 0:
-            if dfs(i):
-                return True
-
-    return False
+    # The engine keeps WHITE/GRAY/BLACK colors; an edge into a GRAY node
+    # (still on the current path) is a back edge → cycle
+    return dfs_events(graph, range(n), on_back_edge=lambda node, neighbor: True)
 
 
 # =============================================================================
@@ -257,41 +218,145 @@ def canFinish(numCourses: int, prerequisites: List[List[int]]) -> bool:
 # TEACHER'S SOLUTION:
 def canFinish_solution(numCourses: int, prerequisites: List[List[int]]) -> bool:
     """Course schedule using cycle detection"""
-    # Build graph
-    graph = defaultdict(list)
-    for course, prereq in prerequisites:
-        graph[prereq].append(course)
+    # Build graph: prereq → course
+    graph = CSRGraph.from_edges(numCourses, [(prereq, course) for course, prereq in prerequisites],
+                                directed=True)
+
+    # Any back edge means a prerequisite cycle
+    return not dfs_events(graph, range(numCourses), on_back_edge=lambda node, neighbor: True)
+
+
+# =============================================================================
+# PART 4: STRONGLY CONNECTED COMPONENTS
+# =============================================================================
+
+"""
+CONCEPT: Strongly Connected Components (SCC)
+=============================================
+
+An SCC is a maximal set of vertices where every vertex reaches every
+other. A directed graph is acyclic exactly when every SCC has one vertex.
+Collapsing SCCs turns any directed graph into a DAG (the condensation).
+
+Example: 0→1→2→0, 2→3, 3→4→3
+SCCs: {0, 1, 2}, {3, 4}
+
+1. TARJAN (one DFS)
+   - index[v] = discovery order, low[v] = smallest index reachable from
+     v's subtree through at most one back/cross edge to a node still on
+     the SCC stack
+   - on enter: push v on the SCC stack
+   - on back/cross edge v→w with w on the stack: low[v] = min(low[v], index[w])
+   - on exit: if low[v] == index[v], pop the stack down to v → one SCC;
+              then low[parent] = min(low[parent], low[v])
+
+2. KOSARAJU (two DFS)
+   - Pass 1: DFS on G, record vertices by finish time
+   - Pass 2: DFS on reversed G, roots in DECREASING finish time;
+             each DFS tree is one SCC
 
-    # 0: WHITE, 1: GRAY, 2: BLACK
-    color = [0] * numCourses
+Both run on the explicit-stack engine with array-backed state.
 
-    def has_cycle(node):
-        if color[node] == 1:
-            return True
+Time: O(V + E)
+Space: O(V + E)
+"""
+
+
+def tarjan_scc(graph, n: int) -> List[List[int]]:
+    """Tarjan's SCC on an adjacency list or CSRGraph over 0..n-1"""
+    index = array('q', [-1]) * n
+    low = array('q', bytes(8 * n))
+    on_stack = bytearray(n)
+    stack, components = [], []
+    counter = 0
+
+    def enter(node, parent):
+        nonlocal counter
+        index[node] = low[node] = counter
+        counter += 1
+        stack.append(node)
+        on_stack[node] = 1
+
+    def non_tree_edge(node, neighbor):
+        if on_stack[neighbor] and index[neighbor] < low[node]:
+            low[node] = index[neighbor]
+
+    def exit_(node, parent):
+        if low[node] == index[node]:
+            component = []
+            while True:
+                member = stack.pop()
+                on_stack[member] = 0
+                component.append(member)
+                if member == node:
+                    break
+            components.append(component)
+        if parent is not None and low[node] < low[parent]:
+            low[parent] = low[node]
+
+    dfs_events(graph, range(n), n=n, on_enter=enter, on_exit=exit_,
+               on_back_edge=non_tree_edge, on_cross_edge=non_tree_edge)
+    return components
+
+
+def kosaraju_scc(graph, n: int) -> List[List[int]]:
+    """Kosaraju's SCC on an adjacency list or CSRGraph over 0..n-1"""
+    finish_order = array('q')
+    dfs_events(graph, range(n), n=n, on_exit=lambda node, parent: finish_order.append(node))
+
+    if isinstance(graph, CSRGraph):
+        reversed_edges = [(edge[1], edge[0]) for edge in graph.edges()]
+    else:
+        reversed_edges = [(v, u) for u in range(n) for v in graph.get(u, ())]
+    reverse = CSRGraph.from_edges(n, reversed_edges, directed=True)
+
+    components = []
+
+    def enter(node, parent):
+        if parent is None:
+            components.append([])
+        components[-1].append(node)
+
+    dfs_events(reverse, reversed(finish_order), on_enter=enter)
+    return components
+
+
+def stronglyConnectedComponents(n: int, edges: List[List[int]]) -> List[List[int]]:
+    """
+    Find all strongly connected components of a directed graph
 
-        if color[node] == 2:
-            return False
+    Example:
+        n = 5, edges = [[0,1],[1,2],[2,0],[2,3],[3,4],[4,3]]
+        Returns: [[3, 4], [0, 1, 2]] (any order)
 
-        color[node] = 1
+    Args:
+        n: Number of vertices
+        edges: List of [u, v] directed edges
 
-        for neighbor in graph[node]:
-            if has_cycle(neighbor):
-                return True
+    Returns:
+        List of components (each a list of vertices)
 
-        color[node] = 2
-        return False
+    Time: O(V + E)
+    Space: O(V + E)
+    """
+    # TODO: Tarjan - track index/low, an SCC stack and on_stack flags
+    # TODO: Pop a component when a node finishes with low == index
+    pass
 
-    # Check each course
-    for i in range(numCourses):
-        if color[i] == 0:
-            if has_cycle(i):
-                return False
 
-    return True
+# TEACHER'S SOLUTION:
+def stronglyConnectedComponents_solution(n: int, edges: List[List[int]], method: str = "tarjan") -> List[List[int]]:
+    """SCCs via Tarjan (default) or Kosaraju on the iterative DFS engine"""
+    graph = CSRGraph.from_edges(n, edges, directed=True)
+    if method == "tarjan":
+        return tarjan_scc(graph, n)
+    if method == "kosaraju":
+        return kosaraju_scc(graph, n)
+    raise ValueError(f"unknown method: {method!r}")
 
 
 # =============================================================================
-# PART 4: TESTING
+# PART 5: TESTING
 # =============================================================================
 
 def test_cycle_detection():
@@ -339,6 +404,37 @@ def test_cycle_detection():
         print(f"  courses={numCourses}, prereqs={prereqs} → {result} ✓")
     print("✓ Course schedule test passed")
 
+    # Test Strongly Connected Components
+    print("\nTEST 4: Strongly Connected Components")
+    edges = [[0, 1], [1, 2], [2, 0], [2, 3], [3, 4], [4, 3]]
+    for method in ("tarjan", "kosaraju"):
+        result = stronglyConnectedComponents_solution(5, edges, method)
+        print(f"  {method}: {result}")
+        assert sorted(sorted(c) for c in result) == [[0, 1, 2], [3, 4]]
+    import random
+    rng = random.Random(2)
+    for trial in range(30):
+        n = rng.randint(1, 40)
+        edges = [[rng.randrange(n), rng.randrange(n)] for _ in range(rng.randint(0, 3 * n))]
+        tarjan = sorted(sorted(c) for c in stronglyConnectedComponents_solution(n, edges, "tarjan"))
+        kosaraju = sorted(sorted(c) for c in stronglyConnectedComponents_solution(n, edges, "kosaraju"))
+        assert tarjan == kosaraju
+        # Acyclic (ignoring self-loops) exactly when every SCC is a single vertex
+        no_loops = [e for e in edges if e[0] != e[1]]
+        assert hasCycle_directed_solution(n, no_loops) == (len(tarjan) < n)
+    print("✓ SCC test passed")
+
+    # Test deep graphs (no recursion limit)
+    print("\nTEST 5: Cycle Detection on a 200k-Node Path")
+    n = 200000
+    path = [[i, i + 1] for i in range(n - 1)]
+    assert not hasCycle_directed_solution(n, path)
+    assert hasCycle_directed_solution(n, path + [[n - 1, 0]])
+    assert not hasCycle_undirected_solution(n, path)
+    assert hasCycle_undirected_solution(n, path + [[n - 1, 0]])
+    assert len(stronglyConnectedComponents_solution(n, path + [[n - 1, 0]])) == 1
+    print("✓ Deep graph test passed")
+
     print("\n" + "=" * 60)
 
 
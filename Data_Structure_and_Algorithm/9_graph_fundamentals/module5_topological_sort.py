@@ -10,12 +10,21 @@ In this module, we'll cover:
 3. DFS-based topological sort (post-order)
 4. Applications: course scheduling, build systems
 5. Cycle detection via topological sort
+6. Incremental (dynamic) topological order - Pearce-Kelly
+7. Parallel DAG scheduling with critical-path priority
 
 Topological sort is essential for: dependency resolution, scheduling!
 """
 
-from typing import List, Dict
+from typing import List, Dict, Callable, Sequence
 from collections import defaultdict, deque
+from concurrent.futures import FIRST_COMPLETED, ProcessPoolExecutor, ThreadPoolExecutor, wait
+from functools import partial
+import heapq
+import time
+
+from module1_graph_basics import CSRGraph
+from module4_cycle_detection import hasCycle_directed_solution
 
 # =============================================================================
 # PART 1: TOPOLOGICAL SORT FUNDAMENTALS
@@ -90,7 +99,7 @@ def topologicalSort_kahn(n: int, edges: List[List[int]]) -> List[int]:
 
     Args:
         n: Number of vertices
-        edges: List of [u, v] directed edges
+        edges: List of [u, v] directed edges (or a directed CSRGraph)
 
     Returns:
         List - Topological order, or empty if cycle exists
@@ -108,13 +117,21 @@ def topologicalSort_kahn(n: int, edges: List[List[int]]) -> List[int]:
 # TEACHER'S SOLUTION:
 def topologicalSort_kahn_solution(n: int, edges: List[List[int]]) -> List[int]:
     """Kahn's algorithm for topological sort"""
-    # Build graph and compute in-degrees
-    graph = defaultdict(list)
-    in_degree = [0] * n
-
-    for u, v in edges:
-        graph[u].append(v)
-        in_degree[v] += 1
+    if isinstance(edges, CSRGraph):
+        # Already an adjacency structure: in-degrees come from one pass over targets
+        graph = {}
+        neighbors = edges.neighbors
+        in_degree = edges.in_degrees()
+    else:
+        # Build graph and compute in-degrees
+        graph = defaultdict(list)
+        in_degree = [0] * n
+
+        for u, v in edges:
+            graph[u].append(v)
+            in_degree[v] += 1
+
+        neighbors = graph.__getitem__
 
     # Add all vertices with in-degree 0 to queue
     queue = deque()
@@ -129,7 +146,7 @@ def topologicalSort_kahn_solution(n: int, edges: List[List[int]]) -> List[int]:
         result.append(node)
 
         # Reduce in-degrees of neighbors
-        for neighbor in graph[node]:
+        for neighbor in neighbors(node):
             in_degree[neighbor] -= 1
             if in_degree[neighbor] == 0:
                 queue.append(neighbor)
@@ -308,7 +325,349 @@ def findOrder_solution(numCourses: int, prerequisites: List[List[int]]) -> List[
 
 
 # =============================================================================
-# PART 5: TESTING
+# PART 5: INCREMENTAL TOPOLOGICAL ORDER (PEARCE-KELLY)
+# =============================================================================
+
+"""
+CONCEPT: Keeping a Topological Order While Edges Arrive
+========================================================
+
+A build scheduler adds and removes dependencies all the time. Re-running
+Kahn's algorithm costs O(V + E) per change, even if only two tasks moved.
+
+Pearce-Kelly keeps ord[v] (position of v in the order) and repairs only
+the AFFECTED REGION when edge u→v arrives:
+
+1. ord[u] < ord[v]  → order already valid, nothing to do
+2. Otherwise the region is positions lb = ord[v] .. ub = ord[u]:
+   - Forward DFS from v, only visiting nodes with ord ≤ ub   → delta_F
+     If it reaches u → u→v would close a cycle → REJECT the edge
+   - Backward DFS from u, only visiting nodes with ord ≥ lb  → delta_B
+3. Reassign: the positions used by delta_B ∪ delta_F, sorted, are handed
+   out to delta_B first (kept in relative order), then delta_F
+
+Example: order [a, b, c], add c→a
+    lb = ord[a] = 0, ub = ord[c] = 2
+    delta_F = {a} (a has no edges), delta_B = {c}
+    positions {0, 2} → c gets 0, a gets 2 → order [c, b, a]
+
+Removing an edge never invalidates an order → O(1).
+
+Time: O(affected region) per insertion (worst case O(V + E))
+Space: O(V + E)
+"""
+
+
+class IncrementalTopologicalOrder:
+    """
+    Dynamic DAG that always holds a valid topological order
+
+    Example:
+        topo = IncrementalTopologicalOrder(3, [[0, 1]])
+        topo.add_edge(1, 2) → True
+        topo.add_edge(2, 0) → False (would create cycle 0→1→2→0)
+        topo.order() → [0, 1, 2]
+    """
+
+    def __init__(self, n: int, edges: List[List[int]] = ()):
+        """
+        Start from an initial DAG
+
+        Raises:
+            ValueError - if the initial edges already contain a cycle
+        """
+        edges = [list(edge) for edge in edges]
+        if hasCycle_directed_solution(n, edges):
+            raise ValueError("initial edges contain a cycle")
+
+        self.n = n
+        self.out_edges = [set() for _ in range(n)]
+        self.in_edges = [set() for _ in range(n)]
+        for u, v in edges:
+            self.out_edges[u].add(v)
+            self.in_edges[v].add(u)
+
+        self.node_at = topologicalSort_kahn_solution(n, edges)
+        self.ord = [0] * n
+        for position, node in enumerate(self.node_at):
+            self.ord[node] = position
+        self.last_affected = 0
+
+    def add_edge(self, u: int, v: int) -> bool:
+        """Insert u→v; returns False (and changes nothing) if it would create a cycle"""
+        if u == v:
+            return False
+        if v in self.out_edges[u]:
+            return True
+
+        ord_ = self.ord
+        lb, ub = ord_[v], ord_[u]
+        self.last_affected = 0
+        if lb > ub:
+            self.out_edges[u].add(v)
+            self.in_edges[v].add(u)
+            return True
+
+        # Forward search from v inside the region (iterative DFS)
+        delta_f = self._search(v, self.out_edges, lambda node: ord_[node] <= ub, stop=u)
+        if delta_f is None:
+            return False
+        delta_b = self._search(u, self.in_edges, lambda node: ord_[node] >= lb)
+
+        self.out_edges[u].add(v)
+        self.in_edges[v].add(u)
+        self._reorder(delta_b, delta_f)
+        self.last_affected = len(delta_b) + len(delta_f)
+        return True
+
+    def remove_edge(self, u: int, v: int):
+        """Delete u→v; the current order stays valid"""
+        self.out_edges[u].discard(v)
+        self.in_edges[v].discard(u)
+
+    def order(self) -> List[int]:
+        """Current topological order"""
+        return list(self.node_at)
+
+    def precedes(self, u: int, v: int) -> bool:
+        """True if u is scheduled before v"""
+        return self.ord[u] < self.ord[v]
+
+    def _search(self, start, edges, inside, stop=None):
+        """Nodes reachable from start through nodes accepted by inside(); None if stop is reached"""
+        seen = {start}
+        stack = [start]
+        while stack:
+            node = stack.pop()
+            for neighbor in edges[node]:
+                if neighbor == stop:
+                    return None
+                if neighbor not in seen and inside(neighbor):
+                    seen.add(neighbor)
+                    stack.append(neighbor)
+        return seen
+
+    def _reorder(self, delta_b, delta_f):
+        """Give delta_B the lowest freed positions, then delta_F, keeping relative order"""
+        ord_ = self.ord
+        backward = sorted(delta_b, key=ord_.__getitem__)
+        forward = sorted(delta_f, key=ord_.__getitem__)
+        positions = sorted(ord_[node] for node in backward + forward)
+        for position, node in zip(positions, backward + forward):
+            ord_[node] = position
+            self.node_at[position] = node
+
+
+def addDependency(topo: IncrementalTopologicalOrder, u: int, v: int) -> bool:
+    """
+    Add dependency u→v to a live schedule, rejecting cycles
+
+    Example:
+        topo = IncrementalTopologicalOrder(3, [[0, 1], [1, 2]])
+        addDependency(topo, 2, 0) → False
+
+    Time: O(affected region)
+    """
+    # TODO: If ord[u] < ord[v], just add the edge
+    # TODO: Forward DFS from v bounded by ord[u]; reaching u means cycle
+    # TODO: Backward DFS from u bounded by ord[v]
+    # TODO: Reassign the freed positions: delta_B first, then delta_F
+    pass
+
+
+# TEACHER'S SOLUTION:
+def addDependency_solution(topo: IncrementalTopologicalOrder, u: int, v: int) -> bool:
+    """Pearce-Kelly insertion"""
+    return topo.add_edge(u, v)
+
+
+# =============================================================================
+# PART 6: PARALLEL DAG SCHEDULER
+# =============================================================================
+
+"""
+CONCEPT: Kahn's Algorithm as a Live Scheduler
+==============================================
+
+findOrder_solution gives ONE valid order, and running it serially wastes
+every core. Kahn's in-degree bookkeeping is already a scheduler:
+"in-degree 0" means "all dependencies done" → the task can start NOW.
+
+Scheduler loop:
+1. in_degree[v] = number of unfinished dependencies
+2. Ready set = tasks with in_degree 0
+3. While tasks remain:
+   - Fill idle workers from the ready set
+   - Wait for ANY running task to finish
+   - Decrement in_degree of its successors; zeros become ready
+
+Which ready task first? CRITICAL PATH priority:
+    level[v] = duration[v] + max(level[w] for successors w)
+= length of the longest chain that still has to run after v starts.
+The makespan can never be shorter than the largest level, so always start
+the ready task with the LARGEST level (max-heap on -level).
+
+Example: 0→1→2 (each 1s) and 3 (1s), 2 workers
+    levels: 0:3, 1:2, 2:1, 3:1 → start 0 and 3, makespan = 3s (serial: 4s)
+
+Time: O((V + E) log V) scheduling overhead
+Space: O(V + E)
+"""
+
+
+def critical_path_levels(n: int, edges: List[List[int]], durations: Sequence[float] = None) -> List[float]:
+    """
+    Longest remaining path (including the node itself) for every node
+
+    Raises:
+        ValueError - if the graph has a cycle
+    """
+    durations = durations if durations is not None else [1] * n
+    order = topologicalSort_kahn_solution(n, edges)
+    if len(order) != n:
+        raise ValueError("task graph contains a cycle")
+
+    successors = defaultdict(list)
+    for u, v in edges:
+        successors[u].append(v)
+
+    level = [0] * n
+    for node in reversed(order):
+        level[node] = durations[node] + max((level[w] for w in successors[node]), default=0)
+    return level
+
+
+def scheduleTasks(n: int, edges: List[List[int]], run: Callable[[int], object],
+                  workers: int = 4, durations: Sequence[float] = None,
+                  executor: str = "thread") -> Dict[str, object]:
+    """
+    Run every task of a DAG on a pool as soon as its dependencies finish
+
+    Example:
+        scheduleTasks(4, [[0, 1], [1, 2]], run=build_target, workers=2)
+        → {'order': [0, 3, 1, 2], 'makespan': ..., 'results': {...}}
+
+    Args:
+        n: Number of tasks (0 to n-1)
+        edges: [u, v] means u must finish before v starts
+        run: run(task) does the work (must be picklable for processes)
+        workers: Pool size
+        durations: Estimated cost per task for critical-path priority
+        executor: "thread" or "process"
+
+    Returns:
+        dict - 'order' (completion order), 'makespan' (seconds),
+               'results' {task: return value}
+
+    Time: O((V + E) log V) + task time
+    """
+    # TODO: Compute in-degrees and critical-path levels
+    # TODO: Push in-degree-0 tasks onto a max-heap keyed by level
+    # TODO: Keep workers busy; on each completion decrement successors' in-degree
+    pass
+
+
+# TEACHER'S SOLUTION:
+def scheduleTasks_solution(n: int, edges: List[List[int]], run: Callable[[int], object],
+                           workers: int = 4, durations: Sequence[float] = None,
+                           executor: str = "thread") -> Dict[str, object]:
+    """Kahn's algorithm driving a thread/process pool, critical path first"""
+    level = critical_path_levels(n, edges, durations)
+
+    successors = defaultdict(list)
+    in_degree = [0] * n
+    for u, v in edges:
+        successors[u].append(v)
+        in_degree[v] += 1
+
+    # Max-heap by critical-path level (ties → lower task id)
+    ready = [(-level[node], node) for node in range(n) if in_degree[node] == 0]
+    heapq.heapify(ready)
+
+    pool_class = ProcessPoolExecutor if executor == "process" else ThreadPoolExecutor
+    order, results, running = [], {}, {}
+    began = time.perf_counter()
+
+    with pool_class(max_workers=workers) as pool:
+        while ready or running:
+            # Fill every idle worker with the most critical ready task
+            while ready and len(running) < workers:
+                _, node = heapq.heappop(ready)
+                running[pool.submit(run, node)] = node
+
+            done, _ = wait(running, return_when=FIRST_COMPLETED)
+            for future in done:
+                node = running.pop(future)
+                results[node] = future.result()  # Re-raises a failed task
+                order.append(node)
+
+                for neighbor in successors[node]:
+                    in_degree[neighbor] -= 1
+                    if in_degree[neighbor] == 0:
+                        heapq.heappush(ready, (-level[neighbor], neighbor))
+
+    return {'order': order, 'makespan': time.perf_counter() - began, 'results': results}
+
+
+def _benchmark_task(durations: Sequence[float], cpu_bound: bool, node: int) -> int:
+    """
+    Synthetic job for the benchmark (top-level so process pools can pickle it)
+
+    cpu_bound=False sleeps (I/O-like, threads overlap it); True spins the CPU
+    for the same time, which only a process pool runs in parallel.
+    """
+    if cpu_bound:
+        deadline = time.perf_counter() + durations[node]
+        while time.perf_counter() < deadline:
+            pass
+    else:
+        time.sleep(durations[node])
+    return node
+
+
+def _layered_dag(layers: int, width: int, task_seconds: float, seed: int):
+    """Random layered DAG: each task depends on 1-3 tasks of the previous layer"""
+    import random
+    rng = random.Random(seed)
+    n = layers * width
+    edges = []
+    for layer in range(1, layers):
+        for i in range(width):
+            node = layer * width + i
+            for parent in rng.sample(range(width), rng.randint(1, 3)):
+                edges.append([(layer - 1) * width + parent, node])
+    durations = tuple(task_seconds * rng.uniform(0.5, 2.0) for _ in range(n))
+    return n, edges, durations
+
+
+def benchmark_scheduler(layers: int = 6, width: int = 8, task_seconds: float = 0.01,
+                        max_workers: int = 8, seed: int = 0, executor: str = "thread",
+                        cpu_bound: bool = False) -> Dict[int, float]:
+    """
+    Makespan of a layered random DAG for 1, 2, 4, ... workers vs serial sum
+
+    executor="process" with cpu_bound=True is the case threads cannot speed
+    up (the GIL); it needs as many CPU cores as workers to scale.
+    """
+    n, edges, durations = _layered_dag(layers, width, task_seconds, seed)
+    run = partial(_benchmark_task, durations, cpu_bound)
+
+    serial = sum(durations)
+    print(f"DAG: {n} tasks, {len(edges)} edges, serial time {serial:.2f} s, "
+          f"critical path {max(critical_path_levels(n, edges, durations)):.2f} s, "
+          f"{executor} pool, {'CPU' if cpu_bound else 'sleep'} tasks")
+    makespans = {}
+    workers = 1
+    while workers <= max_workers:
+        makespans[workers] = scheduleTasks_solution(n, edges, run, workers, durations, executor)['makespan']
+        print(f"  {workers:3d} workers: makespan {makespans[workers]:.2f} s "
+              f"(speedup {serial / makespans[workers]:.1f}x)")
+        workers *= 2
+    return makespans
+
+
+# =============================================================================
+# PART 7: TESTING
 # =============================================================================
 
 def test_topological_sort():
@@ -356,6 +715,73 @@ def test_topological_sort():
     assert len(result) == numCourses
     print("✓ Course schedule test passed")
 
+    # Test Kahn's on CSR graph
+    print("\nTEST 5: Kahn's Algorithm on CSRGraph")
+    edges = [[0, 1], [0, 2], [1, 3], [2, 3]]
+    csr = CSRGraph.from_edges(4, edges, directed=True)
+    result = topologicalSort_kahn_solution(4, csr)
+    print(f"Topological order: {result}")
+    assert result == topologicalSort_kahn_solution(4, edges)
+    assert topologicalSort_kahn_solution(2, CSRGraph.from_edges(2, edges_cycle, directed=True)) == []
+    print("✓ CSR Kahn's test passed")
+
+    # Test incremental topological order
+    print("\nTEST 6: Incremental Topological Order (Pearce-Kelly)")
+    topo = IncrementalTopologicalOrder(3, [[0, 1]])
+    assert addDependency_solution(topo, 1, 2)
+    assert not addDependency_solution(topo, 2, 0)
+    topo = IncrementalTopologicalOrder(3)
+    assert topo.add_edge(2, 0) and topo.add_edge(1, 0)
+    print(f"Order after adding 2→0 and 1→0: {topo.order()}")
+
+    import random
+    rng = random.Random(5)
+    for trial in range(30):
+        n = rng.randint(2, 30)
+        topo = IncrementalTopologicalOrder(n)
+        accepted = []
+        for _ in range(3 * n):
+            u, v = rng.randrange(n), rng.randrange(n)
+            would_cycle = u == v or hasCycle_directed_solution(n, accepted + [[u, v]])
+            assert topo.add_edge(u, v) == (not would_cycle)
+            if not would_cycle and [u, v] not in accepted:
+                accepted.append([u, v])
+            if accepted and rng.random() < 0.1:
+                a, b = accepted.pop(rng.randrange(len(accepted)))
+                topo.remove_edge(a, b)
+            order = topo.order()
+            assert sorted(order) == list(range(n))
+            assert all(topo.precedes(a, b) for a, b in accepted)
+    print("✓ Incremental topological order test passed")
+
+    # Test parallel DAG scheduler
+    print("\nTEST 7: Parallel DAG Scheduler")
+    assert critical_path_levels(4, [[0, 1], [1, 2]]) == [3, 2, 1, 1]
+    finished = []
+    report = scheduleTasks_solution(4, [[0, 1], [1, 2]], run=lambda task: finished.append(task) or task * 10,
+                                    workers=2)
+    print(f"Completion order: {report['order']}, makespan {report['makespan'] * 1000:.1f} ms")
+    assert report['order'].index(0) < report['order'].index(1) < report['order'].index(2)
+    assert report['results'] == {0: 0, 1: 10, 2: 20, 3: 30}
+    serial_order = scheduleTasks_solution(4, [[0, 1], [1, 2]], run=lambda task: task, workers=1)['order']
+    assert serial_order == [0, 1, 2, 3]  # Critical chain first, then the short task
+    n, edges, durations = _layered_dag(3, 4, 0.01, seed=0)
+    for executor in ("thread", "process"):
+        report = scheduleTasks_solution(n, edges, partial(_benchmark_task, durations, False),
+                                        workers=2, durations=durations, executor=executor)
+        assert report['results'] == {node: node for node in range(n)}, executor
+        position = {node: i for i, node in enumerate(report['order'])}
+        assert all(position[u] < position[v] for u, v in edges), executor
+
+    # Wall-clock bounds only: no run beats the critical path, none is absurdly slow
+    critical = max(critical_path_levels(n, edges, durations))
+    for executor in ("thread", "process"):
+        makespans = benchmark_scheduler(layers=3, width=4, task_seconds=0.01, max_workers=4,
+                                        executor=executor, cpu_bound=(executor == "process"))
+        for makespan in makespans.values():
+            assert 0.99 * critical <= makespan < sum(durations) + 5.0
+    print("✓ DAG scheduler test passed")
+
     print("\n" + "=" * 60)
 
 
@@ -363,3 +789,4 @@ if __name__ == "__main__":
     print("Welcome to Module 5: Topological Sort!")
     print("Master ordering dependencies and task scheduling!")
     print("\nComplete the TODOs, then run test_topological_sort()")
+    print("Run benchmark_scheduler() to see makespan shrink as workers grow")
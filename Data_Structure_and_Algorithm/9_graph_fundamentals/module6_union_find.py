@@ -9,12 +9,19 @@ In this module, we'll cover:
 2. Path compression and union by rank optimizations
 3. Nearly O(1) amortized time complexity
 4. Applications: connected components, cycle detection, Kruskal's MST
-5. Dynamic connectivity
+5. Dynamic connectivity (rollback + offline edge deletions)
+6. Bulk union/find with vectorized pointer jumping (NumPy)
 
 Union-Find is essential for: MST, dynamic connectivity, cycle detection!
 """
 
-from typing import List, Tuple
+from typing import List, Tuple, Dict
+from collections import defaultdict
+
+try:
+    import numpy as np
+except ImportError:  # union_many/find_many fall back to plain loops
+    np = None
 
 # =============================================================================
 # PART 1: UNION-FIND FUNDAMENTALS
@@ -48,6 +55,15 @@ Optimizations:
 
 With both optimizations: α(n) ≈ O(1) for very large n!
 
+BULK OPERATIONS: union(u, v) costs a Python call per edge. For millions of
+edges, union_many(edges) processes the whole batch as arrays instead:
+1. labels = current roots (pointer jumping: labels = labels[labels])
+2. HOOK: for every edge, point the larger root at the smaller one
+   (np.minimum.at scatters all edges at once)
+3. JUMP: labels = labels[labels] until every label is a root
+4. Repeat until every edge has equal labels on both ends
+Each round is a handful of vectorized passes over the edge arrays.
+
 Applications:
 - Connected components (number of islands)
 - Cycle detection (especially for undirected graphs)
@@ -96,10 +112,10 @@ class UnionFind:
 
         Time: O(α(n)) ≈ O(1) amortized
         """
-        # TODO: If x is not its own parent:
-        #       - Recursively find root of parent
-        #       - Apply path compression (set parent to root)
-        # TODO: Return x if it's its own parent (root)
+        # TODO: Walk up parent pointers until reaching the root
+        #       (a loop, not recursion - long chains overflow the stack)
+        # TODO: Walk the path again, pointing every node at the root
+        # TODO: Return the root
         pass
 
     def union(self, x: int, y: int):
@@ -123,6 +139,38 @@ class UnionFind:
         pass
 
 
+def link_labels(labels, u, v):
+    """
+    Merge the sets of every (u[i], v[i]) on a NumPy parent array
+
+    labels must be fully compressed (labels[x] is x's root). A root only
+    ever hooks under a smaller root, so starting from np.arange(n) every
+    set ends up labeled by its smallest member. Pure array work: nothing
+    is converted to Python ints.
+
+    Time: O((n + m) * rounds) array work, rounds is small in practice
+    """
+    while True:
+        lu, lv = labels[u], labels[v]
+        pending = lu != lv
+        if not pending.any():
+            return labels
+        u, v = u[pending], v[pending]
+        lu, lv = lu[pending], lv[pending]
+        smaller = np.minimum(lu, lv)
+
+        # Hook: every root touched by an edge points at the smaller root
+        np.minimum.at(labels, lu, smaller)
+        np.minimum.at(labels, lv, smaller)
+
+        # Jump: compress until every label is a root again
+        while True:
+            jumped = labels[labels]
+            if np.array_equal(jumped, labels):
+                break
+            labels = jumped
+
+
 # TEACHER'S SOLUTION:
 class UnionFindSolution:
     """Union-Find with path compression and union by rank"""
@@ -133,11 +181,16 @@ class UnionFindSolution:
         self.rank = [0] * n
 
     def find(self, x: int) -> int:
-        """Find root with path compression"""
-        if self.parent[x] != x:
-            # Path compression: point directly to root
-            self.parent[x] = self.find(self.parent[x])
-        return self.parent[x]
+        """Find root with path compression (iterative - safe on long chains)"""
+        parent = self.parent
+        root = x
+        while parent[root] != root:
+            root = parent[root]
+
+        # Path compression: point every node on the path directly to root
+        while parent[x] != root:
+            parent[x], x = root, parent[x]
+        return root
 
     def union(self, x: int, y: int):
         """Union by rank"""
@@ -160,6 +213,62 @@ class UnionFindSolution:
         """Check if in same set"""
         return self.find(x) == self.find(y)
 
+    def _compressed_labels(self):
+        """Parent array as NumPy, fully path-compressed by pointer jumping"""
+        labels = np.asarray(self.parent, dtype=np.int64)
+        while True:
+            jumped = labels[labels]
+            if np.array_equal(jumped, labels):
+                return labels
+            labels = jumped
+
+    def union_many(self, edges):
+        """
+        Union every (u, v) edge in one vectorized pass
+
+        Args:
+            edges: sequence of (u, v) pairs or an (m, 2) integer array
+
+        Time: O((n + m) * rounds) array work, rounds is small in practice
+        """
+        if np is None:
+            for u, v in edges:
+                self.union(u, v)
+            return
+
+        edges = np.asarray(edges, dtype=np.int64).reshape(-1, 2)
+        if len(edges) == 0:
+            return
+        labels = link_labels(self._compressed_labels(), edges[:, 0], edges[:, 1])
+        self.parent = labels.tolist()
+        # Trees are now flat: roots get rank 1 if they have children
+        roots = np.zeros(len(labels), dtype=np.int64)
+        roots[labels[labels != np.arange(len(labels))]] = 1
+        self.rank = np.maximum(roots, np.asarray(self.rank, dtype=np.int64)).tolist()
+
+    def find_many(self, nodes) -> List[int]:
+        """Roots of many nodes at once (compresses the whole forest)"""
+        if np is None:
+            return [self.find(x) for x in nodes]
+
+        labels = self._compressed_labels()
+        self.parent = labels.tolist()
+        return labels[np.asarray(nodes, dtype=np.int64)].tolist()
+
+    def component_sizes(self) -> Dict[int, int]:
+        """{root: size} for every component, in one pass"""
+        if np is None:
+            sizes = defaultdict(int)
+            for x in range(len(self.parent)):
+                sizes[self.find(x)] += 1
+            return dict(sizes)
+
+        labels = self._compressed_labels()
+        self.parent = labels.tolist()
+        counts = np.bincount(labels, minlength=len(labels))
+        roots = np.nonzero(counts)[0]
+        return dict(zip(roots.tolist(), counts[roots].tolist()))
+
 
 # =============================================================================
 # PART 3: NUMBER OF PROVINCES (LC 547)
@@ -220,14 +329,11 @@ def findCircleNum_solution(isConnected: List[List[int]]) -> int:
     n = len(isConnected)
     uf = UnionFindSolution(n)
 
-    # Union connected cities
-    for i in range(n):
-        for j in range(i + 1, n):
-            if isConnected[i][j] == 1:
-                uf.union(i, j)
+    # Union connected cities (all at once)
+    uf.union_many([(i, j) for i in range(n) for j in range(i + 1, n) if isConnected[i][j] == 1])
 
     # Count unique roots
-    return len(set(uf.find(i) for i in range(n)))
+    return len(uf.component_sizes())
 
 
 # =============================================================================
@@ -300,7 +406,211 @@ def findRedundantConnection_solution(edges: List[List[int]]) -> List[int]:
 
 
 # =============================================================================
-# PART 5: TESTING
+# PART 5: DYNAMIC CONNECTIVITY (ROLLBACK + OFFLINE DELETIONS)
+# =============================================================================
+
+"""
+CONCEPT: Union-Find With Undo
+==============================
+
+Plain Union-Find can merge sets but never split them. Deleting an edge
+would mean rebuilding from scratch.
+
+Trick 1 - ROLLBACK: drop path compression, keep union by size, and log
+every union on a stack. Undoing the last union is O(1):
+    stack entry (child_root, parent_root)
+    undo: parent[child_root] = child_root, size[parent_root] -= size[child_root]
+Without path compression find is O(log n) (union by size bounds height).
+
+Trick 2 - OFFLINE DELETIONS (segment tree over time):
+Given a batch of operations [add, remove, query, ...]:
+1. Every edge is "alive" during time intervals [added, removed)
+2. Insert each interval into a segment tree over time indices
+   (O(log T) nodes per interval)
+3. DFS the segment tree: on entering a node apply its unions, at a leaf
+   answer that time's query, on leaving roll the unions back
+
+Example:
+    add(0,1), add(1,2), query(0,2) → True
+    remove(1,2),        query(0,2) → False
+
+Time: O(T log T log n) for T operations
+Space: O(T log T + n)
+"""
+
+
+class RollbackUnionFind:
+    """Union by size, no path compression, every union can be undone"""
+
+    def __init__(self, n: int):
+        self.parent = list(range(n))
+        self.size = [1] * n
+        self.history = []  # (child_root, parent_root) or None for no-op unions
+        self.components = n
+
+    def find(self, x: int) -> int:
+        """Find root without compression, so unions stay reversible"""
+        parent = self.parent
+        while parent[x] != x:
+            x = parent[x]
+        return x
+
+    def union(self, x: int, y: int) -> bool:
+        """Merge sets; always logs an entry so rollback counts stay simple"""
+        root_x, root_y = self.find(x), self.find(y)
+        if root_x == root_y:
+            self.history.append(None)
+            return False
+
+        if self.size[root_x] < self.size[root_y]:
+            root_x, root_y = root_y, root_x
+        self.parent[root_y] = root_x
+        self.size[root_x] += self.size[root_y]
+        self.history.append((root_y, root_x))
+        self.components -= 1
+        return True
+
+    def connected(self, x: int, y: int) -> bool:
+        return self.find(x) == self.find(y)
+
+    def snapshot(self) -> int:
+        """Marker to pass to rollback()"""
+        return len(self.history)
+
+    def rollback(self, snapshot: int):
+        """Undo unions until the history is back at snapshot"""
+        while len(self.history) > snapshot:
+            entry = self.history.pop()
+            if entry is None:
+                continue
+            child, root = entry
+            self.parent[child] = child
+            self.size[root] -= self.size[child]
+            self.components += 1
+
+
+def dynamicConnectivity(n: int, operations: List[Tuple[str, int, int]]) -> List[bool]:
+    """
+    Answer connectivity queries under edge insertions AND deletions (offline)
+
+    Example:
+        ops = [("add", 0, 1), ("add", 1, 2), ("query", 0, 2),
+               ("remove", 1, 2), ("query", 0, 2)]
+        Returns: [True, False]
+
+    Args:
+        n: Number of vertices
+        operations: ("add" | "remove" | "query", u, v) in time order
+
+    Returns:
+        List[bool] - one answer per query
+
+    Time: O(T log T log n)
+    Space: O(T log T + n)
+    """
+    # TODO: Record the [start, end) time interval each edge is alive
+    # TODO: Insert intervals into a segment tree over time
+    # TODO: DFS the tree with RollbackUnionFind: union on enter, rollback on exit
+    # TODO: Answer queries at the leaves
+    pass
+
+
+# TEACHER'S SOLUTION:
+def dynamicConnectivity_solution(n: int, operations: List[Tuple[str, int, int]]) -> List[bool]:
+    """Offline dynamic connectivity: segment tree over time + rollback union-find"""
+    T = len(operations)
+    if T == 0:
+        return []
+
+    # Step 1: alive intervals; undirected edges keyed by sorted endpoints
+    open_since = defaultdict(list)  # edge → stack of start times (multi-edges allowed)
+    intervals = []
+    for t, (op, u, v) in enumerate(operations):
+        edge = (u, v) if u <= v else (v, u)
+        if op == "add":
+            open_since[edge].append(t)
+        elif op == "remove":
+            if not open_since[edge]:
+                raise ValueError(f"remove of missing edge {edge} at time {t}")
+            intervals.append((open_since[edge].pop(), t, edge))
+    for edge, starts in open_since.items():
+        for start in starts:
+            intervals.append((start, T, edge))
+
+    # Step 2: segment tree over [0, T) - node i covers a time range
+    size = 1
+    while size < T:
+        size *= 2
+    node_edges = [[] for _ in range(2 * size)]
+    for start, end, edge in intervals:
+        lo, hi = start + size, end + size
+        while lo < hi:
+            if lo & 1:
+                node_edges[lo].append(edge)
+                lo += 1
+            if hi & 1:
+                hi -= 1
+                node_edges[hi].append(edge)
+            lo //= 2
+            hi //= 2
+
+    # Step 3: iterative DFS (enter → union, leaf → answer, exit → rollback)
+    uf = RollbackUnionFind(n)
+    answers = []
+    stack = [(1, False)]
+    snapshots = {}
+    while stack:
+        node, leaving = stack.pop()
+        if leaving:
+            uf.rollback(snapshots.pop(node))
+            continue
+
+        snapshots[node] = uf.snapshot()
+        for u, v in node_edges[node]:
+            uf.union(u, v)
+        stack.append((node, True))
+
+        if node >= size:
+            t = node - size
+            if t < T and operations[t][0] == "query":
+                answers.append(uf.connected(operations[t][1], operations[t][2]))
+        else:
+            # Right child pushed first so the left (earlier) half runs first
+            stack.append((2 * node + 1, False))
+            stack.append((2 * node, False))
+
+    return answers
+
+
+def benchmark_union_many(n: int = 1000000, m: int = 2000000, seed: int = 0):
+    """Compare per-edge union() against union_many() on random edges"""
+    import random
+    import time
+
+    rng = random.Random(seed)
+    edges = [(rng.randrange(n), rng.randrange(n)) for _ in range(m)]
+
+    uf = UnionFindSolution(n)
+    began = time.perf_counter()
+    for u, v in edges:
+        uf.union(u, v)
+    loop_seconds = time.perf_counter() - began
+
+    # Bulk ingestion reads edges from an array, as it would from disk
+    edge_array = np.asarray(edges, dtype=np.int64) if np is not None else edges
+    bulk = UnionFindSolution(n)
+    began = time.perf_counter()
+    bulk.union_many(edge_array)
+    bulk_seconds = time.perf_counter() - began
+
+    assert len(uf.component_sizes()) == len(bulk.component_sizes())
+    print(f"union() loop: {loop_seconds:.2f} s   union_many(): {bulk_seconds:.2f} s   "
+          f"({loop_seconds / bulk_seconds:.1f}x)")
+    return loop_seconds, bulk_seconds
+
+
+# =============================================================================
+# PART 6: TESTING
 # =============================================================================
 
 def test_union_find():
@@ -354,6 +664,86 @@ def test_union_find():
     assert result == [2, 3]
     print("✓ Redundant connection test passed")
 
+    # Test iterative find on a degenerate chain
+    print("\nTEST 5: Iterative Find on a Long Chain")
+    n = 100000
+    uf = UnionFindSolution(n)
+    for i in range(n - 1):
+        uf.parent[i] = i + 1  # Worst case: one long path, no ranks
+    assert uf.find(0) == n - 1
+    assert uf.parent[0] == n - 1 and uf.parent[n // 2] == n - 1
+    print("✓ Iterative find test passed")
+
+    # Test rollback
+    print("\nTEST 6: Rollback Union-Find")
+    uf = RollbackUnionFind(4)
+    uf.union(0, 1)
+    mark = uf.snapshot()
+    uf.union(1, 2)
+    uf.union(0, 2)
+    assert uf.connected(0, 2) and uf.components == 2
+    uf.rollback(mark)
+    assert uf.connected(0, 1) and not uf.connected(0, 2) and uf.components == 3
+    print("✓ Rollback test passed")
+
+    # Test offline dynamic connectivity against rebuilding from scratch
+    print("\nTEST 7: Offline Dynamic Connectivity")
+    ops = [("add", 0, 1), ("add", 1, 2), ("query", 0, 2),
+           ("remove", 1, 2), ("query", 0, 2)]
+    result = dynamicConnectivity_solution(3, ops)
+    print(f"Answers: {result}")
+    assert result == [True, False]
+
+    import random
+    rng = random.Random(11)
+    for trial in range(50):
+        n = rng.randint(1, 8)
+        alive, ops = [], []
+        for _ in range(rng.randint(0, 40)):
+            roll = rng.random()
+            if roll < 0.4:
+                edge = (rng.randrange(n), rng.randrange(n))
+                alive.append(edge)
+                ops.append(("add",) + edge)
+            elif roll < 0.6 and alive:
+                edge = alive.pop(rng.randrange(len(alive)))
+                ops.append(("remove",) + edge[::-1])
+            else:
+                ops.append(("query", rng.randrange(n), rng.randrange(n)))
+        expected, current = [], []
+        for op, u, v in ops:
+            if op == "add":
+                current.append((u, v))
+            elif op == "remove":
+                current.remove((v, u))
+            else:
+                fresh = UnionFindSolution(n)
+                for a, b in current:
+                    fresh.union(a, b)
+                expected.append(fresh.connected(u, v))
+        assert dynamicConnectivity_solution(n, ops) == expected, trial
+    print("✓ Dynamic connectivity test passed")
+
+    # Test bulk union/find against one-at-a-time unions
+    print("\nTEST 8: Bulk union_many / find_many")
+    for trial in range(30):
+        n = rng.randint(1, 300)
+        edges = [(rng.randrange(n), rng.randrange(n)) for _ in range(rng.randint(0, 2 * n))]
+        single, bulk = UnionFindSolution(n), UnionFindSolution(n)
+        split = len(edges) // 2
+        for u, v in edges:
+            single.union(u, v)
+        bulk.union_many(edges[:split])
+        for u, v in edges[split:split + 3]:
+            bulk.union(u, v)  # Mixing single and bulk calls stays consistent
+        bulk.union_many(edges[split + 3:])
+        roots = bulk.find_many(range(n))
+        for x in range(n):
+            for y in (0, n - 1, rng.randrange(n)):
+                assert (roots[x] == roots[y]) == single.connected(x, y)
+        assert sorted(bulk.component_sizes().values()) == sorted(single.component_sizes().values())
+    print("✓ Bulk union/find test passed")
+
     print("\n" + "=" * 60)
 
 
@@ -361,3 +751,4 @@ if __name__ == "__main__":
     print("Welcome to Module 6: Union-Find!")
     print("Master the elegant data structure for connectivity!")
     print("\nComplete the TODOs, then run test_union_find()")
+    print("Run benchmark_union_many() to compare per-edge and bulk unions")
@@ -10,13 +10,28 @@ In this module, we'll cover:
 3. Bellman-Ford Algorithm for negative weights
 4. Negative cycle detection
 5. All-pairs shortest path (Floyd-Warshall preview)
+6. Point-to-point queries: bidirectional Dijkstra and A*
+7. Indexed (decrease-key) heap vs lazy deletion
+8. Contraction hierarchies for repeated queries on a static graph
 
 Shortest path is crucial for: maps, routing, networks, games!
 """
 
-from typing import List, Dict, Tuple
+from typing import List, Dict, Tuple, Callable, Optional
 from collections import defaultdict, deque
 import heapq
+import math
+import os
+import random
+import time
+from array import array
+
+try:
+    import numpy as np
+except ImportError:  # mode='numpy' falls back to the pure-Python loops
+    np = None
+
+from module1_graph_basics import CSRGraph
 
 # =============================================================================
 # PART 1: BFS FOR UNWEIGHTED GRAPHS (REVIEW)
@@ -141,9 +156,105 @@ After processing 0: [0, 4, 2, ∞]
 After processing 2: [0, 3, 2, 7]
 After processing 1: [0, 3, 2, 4]
 After processing 3: [0, 3, 2, 4] (done)
+
+Heap strategy:
+- LAZY (default): push a new (distance, vertex) on every improvement and
+  skip stale entries on pop → heap can hold O(E) entries
+- INDEXED (use_indexed_heap=True): IndexedMinHeap keeps each vertex
+  once and calls decrease_key → heap never exceeds O(V)
 """
 
 
+class IndexedMinHeap:
+    """
+    Binary min-heap over vertex ids 0..capacity-1 with decrease_key
+
+    The one indexed heap in the repo (Prim in module 8 imports it); the
+    structure is explained in 8_tree_fundamentals module 6. Flat arrays
+    for heap order, keys and each vertex's heap position.
+
+    Example:
+        heap = IndexedMinHeap(4)
+        heap.push_or_decrease(2, 7.0); heap.push_or_decrease(2, 3.0)
+        heap.extract_min() → (3.0, 2)
+    """
+
+    def __init__(self, capacity: int):
+        self.heap = array('q')
+        self.keys = array('d', bytes(8 * capacity))
+        self.position = array('q', [-1]) * capacity
+
+    def size(self) -> int:
+        return len(self.heap)
+
+    def contains(self, item: int) -> bool:
+        return self.position[item] != -1
+
+    def insert(self, item: int, key: float) -> None:
+        if self.position[item] != -1:
+            raise KeyError(f"{item} is already in the heap")
+        self.keys[item] = key
+        self.heap.append(item)
+        self.position[item] = len(self.heap) - 1
+        self._sift_up(len(self.heap) - 1)
+
+    def decrease_key(self, item: int, key: float) -> None:
+        if key > self.keys[item]:
+            raise ValueError(f"new key {key} is larger than current key {self.keys[item]}")
+        self.keys[item] = key
+        self._sift_up(self.position[item])
+
+    def push_or_decrease(self, item: int, key: float) -> bool:
+        """Insert item, or lower its key if present. Returns True if anything changed"""
+        if self.position[item] == -1:
+            self.insert(item, key)
+            return True
+        if key < self.keys[item]:
+            self.decrease_key(item, key)
+            return True
+        return False
+
+    def extract_min(self) -> Optional[Tuple[float, int]]:
+        """Remove and return (key, item) with the smallest key"""
+        if not self.heap:
+            return None
+        top = self.heap[0]
+        last = self.heap.pop()
+        if self.heap:
+            self.heap[0] = last
+            self.position[last] = 0
+            self._sift_down(0)
+        self.position[top] = -1
+        return self.keys[top], top
+
+    def _swap(self, i: int, j: int) -> None:
+        heap = self.heap
+        heap[i], heap[j] = heap[j], heap[i]
+        self.position[heap[i]] = i
+        self.position[heap[j]] = j
+
+    def _sift_up(self, i: int) -> None:
+        heap, keys = self.heap, self.keys
+        while i > 0:
+            parent = (i - 1) // 2
+            if keys[heap[i]] >= keys[heap[parent]]:
+                return
+            self._swap(i, parent)
+            i = parent
+
+    def _sift_down(self, i: int) -> None:
+        heap, keys, n = self.heap, self.keys, len(self.heap)
+        while True:
+            smallest = i
+            for child in (2 * i + 1, 2 * i + 2):
+                if child < n and keys[heap[child]] < keys[heap[smallest]]:
+                    smallest = child
+            if smallest == i:
+                return
+            self._swap(i, smallest)
+            i = smallest
+
+
 def dijkstra(graph: Dict[int, List[Tuple[int, int]]], start: int) -> Dict[int, int]:
     """
     Find shortest path from start to all vertices using Dijkstra's algorithm
@@ -177,15 +288,51 @@ def dijkstra(graph: Dict[int, List[Tuple[int, int]]], start: int) -> Dict[int, i
     pass
 
 
+def _dijkstra_indexed(graph, vertices, start: int, stats: Optional[Dict[str, int]] = None) -> Dict[int, int]:
+    """Dijkstra with an indexed heap: one heap slot per vertex, decrease_key on improvement"""
+    vertices = list(vertices)
+    index = {vertex: i for i, vertex in enumerate(vertices)}
+    distances = {vertex: float('inf') for vertex in vertices}
+    distances[start] = 0
+
+    heap = IndexedMinHeap(len(vertices))
+    heap.insert(index[start], 0)
+    peak = 1
+
+    while heap.size():
+        _, i = heap.extract_min()
+        current_vertex = vertices[i]
+        # Heap keys are floats; read the exact distance back from the dict
+        current_dist = distances[current_vertex]
+
+        for neighbor, weight in graph[current_vertex]:
+            distance = current_dist + weight
+
+            if distance < distances[neighbor]:
+                distances[neighbor] = distance
+                heap.push_or_decrease(index[neighbor], distance)
+        peak = max(peak, heap.size())
+
+    if stats is not None:
+        stats['peak_heap'] = peak
+    return distances
+
+
 # TEACHER'S SOLUTION:
-def dijkstra_solution(graph: Dict[int, List[Tuple[int, int]]], start: int) -> Dict[int, int]:
+def dijkstra_solution(graph: Dict[int, List[Tuple[int, int]]], start: int,
+                      use_indexed_heap: bool = False,
+                      stats: Optional[Dict[str, int]] = None) -> Dict[int, int]:
     """Dijkstra's algorithm using min-heap"""
+    if use_indexed_heap:
+        return _dijkstra_indexed(graph, graph, start, stats)
+
     # Initialize distances
     distances = {vertex: float('inf') for vertex in graph}
     distances[start] = 0
 
     # Min-heap: (distance, vertex)
     heap = [(0, start)]
+    peak = 1
 
     while heap:
         current_dist, current_vertex = heapq.heappop(heap)
@@ -201,7 +348,10 @@ def dijkstra_solution(graph: Dict[int, List[Tuple[int, int]]], start: int) -> Di
             if distance < distances[neighbor]:
                 distances[neighbor] = distance
                 heapq.heappush(heap, (distance, neighbor))
+        peak = max(peak, len(heap))
 
+    if stats is not None:
+        stats['peak_heap'] = peak
     return distances
 
 
@@ -264,13 +414,19 @@ def networkDelayTime(times: List[List[int]], n: int, k: int) -> int:
 
 
 # TEACHER'S SOLUTION:
-def networkDelayTime_solution(times: List[List[int]], n: int, k: int) -> int:
+def networkDelayTime_solution(times: List[List[int]], n: int, k: int,
+                              use_indexed_heap: bool = False) -> int:
     """Network delay time using Dijkstra"""
     # Build graph
     graph = defaultdict(list)
     for source, target, delay in times:
         graph[source].append((target, delay))
 
+    if use_indexed_heap:
+        distances = _dijkstra_indexed(graph, range(1, n + 1), k)
+        max_time = max(distances.values())
+        return max_time if max_time != float('inf') else -1
+
     # Dijkstra from source k
     distances = {i: float('inf') for i in range(1, n + 1)}
     distances[k] = 0
@@ -337,6 +493,21 @@ Why multiple relaxations?
 
 Time: O(V*E)
 Space: O(V)
+
+Faster variants (same answers):
+- Early termination: stop as soon as a full round changes nothing.
+  Most real graphs settle after a few rounds, far fewer than V-1.
+- SPFA (Shortest Path Faster Algorithm): keep a FIFO queue of vertices
+  whose distance just dropped and only relax THEIR outgoing edges.
+  Negative cycle ⇔ some shortest path needs ≥ V edges, so track the
+  hop count of every improvement and stop when it reaches V.
+- NumPy rounds: keep src/dst/weight as edge arrays and relax every edge
+  at once:  new = dist.copy(); np.minimum.at(new, dst, dist[src] + w)
+  One round is a handful of C loops instead of E Python iterations.
+  If round V still improves something → negative cycle.
+
+Arbitrage: weight each exchange edge with -log(rate). A cycle whose
+rates multiply to > 1 has negative total weight → Bellman-Ford finds it.
 """
 
 
@@ -368,17 +539,128 @@ def bellmanFord(n: int, edges: List[List[int]], start: int) -> Dict[int, int]:
 
 
 # TEACHER'S SOLUTION:
-def bellmanFord_solution(n: int, edges: List[List[int]], start: int) -> Dict[int, int]:
-    """Bellman-Ford algorithm for negative weights"""
+def _check_edges(edges, mode: str, modes: Tuple[str, ...]) -> None:
+    """Reject unknown modes and unweighted CSR graphs before doing any work"""
+    if mode not in modes:
+        raise ValueError(f"unknown mode: {mode!r}")
+    if isinstance(edges, CSRGraph) and not edges.weighted:
+        raise ValueError("edges is an unweighted CSRGraph; build it with weighted=True")
+
+
+def _weighted_adjacency(n: int, edges):
+    """Adjacency u -> [(v, weight), ...]; a weighted CSRGraph is used as-is"""
+    if isinstance(edges, CSRGraph):
+        return edges
+
+    adjacency = [[] for _ in range(n)]
+    for source, target, weight in edges:
+        adjacency[source].append((target, weight))
+    return adjacency
+
+
+def _edge_arrays(edges):
+    """(src, dst, weight) NumPy arrays; CSR buffers are wrapped without copying"""
+    if isinstance(edges, CSRGraph):
+        src = np.repeat(np.arange(edges.n, dtype=np.int64), np.diff(np.frombuffer(edges.offsets, dtype=np.int64)))
+        return src, np.frombuffer(edges.targets, dtype=np.int64), np.frombuffer(edges.weights, dtype=np.float64)
+
+    table = np.asarray(edges).reshape(-1, 3)
+    return table[:, 0].astype(np.int64), table[:, 1].astype(np.int64), table[:, 2]
+
+
+def _relax_rounds_numpy(n: int, edges, start: int, rounds: int):
+    """
+    Run up to `rounds` synchronous relaxation rounds over edge arrays
+
+    Returns (dist, converged, integral): converged is False when the last
+    round still improved a distance.
+    """
+    src, dst, weight = _edge_arrays(edges)
+    dist = np.full(n, np.inf)
+    dist[start] = 0
+
+    for _ in range(rounds):
+        relaxed = dist.copy()
+        np.minimum.at(relaxed, dst, dist[src] + weight)
+        if np.array_equal(relaxed, dist):
+            return dist, True, weight.dtype.kind in 'iu'
+        dist = relaxed
+
+    return dist, False, weight.dtype.kind in 'iu'
+
+
+def _distances_from_array(dist, integral: bool) -> Dict[int, float]:
+    """Convert a NumPy distance row back to the {vertex: distance} dict"""
+    cast = int if integral else float
+    return {i: cast(d) if d != np.inf else float('inf') for i, d in enumerate(dist.tolist())}
+
+
+def _bellman_ford_spfa(n: int, edges, start: int) -> Optional[Dict[int, float]]:
+    """Queue-based Bellman-Ford; returns None on a reachable negative cycle"""
+    adjacency = _weighted_adjacency(n, edges)
+    distances = [float('inf')] * n
+    distances[start] = 0
+    hops = [0] * n  # edges on the current best path to each vertex
+    in_queue = bytearray(n)
+
+    queue = deque([start])
+    in_queue[start] = 1
+
+    while queue:
+        u = queue.popleft()
+        in_queue[u] = 0
+        base = distances[u]
+
+        for v, weight in adjacency[u]:
+            candidate = base + weight
+            if candidate < distances[v]:
+                distances[v] = candidate
+                hops[v] = hops[u] + 1
+                if hops[v] >= n:
+                    return None  # A simple path has at most n-1 edges
+                if not in_queue[v]:
+                    in_queue[v] = 1
+                    queue.append(v)
+
+    return dict(enumerate(distances))
+
+
+def bellmanFord_solution(n: int, edges: List[List[int]], start: int, mode: str = 'classic') -> Dict[int, int]:
+    """
+    Bellman-Ford algorithm for negative weights
+
+    mode='classic' relaxes the edge list round by round (stopping early once
+    a round changes nothing), 'spfa' only re-relaxes vertices whose distance
+    dropped, and 'numpy' relaxes all edges per round with np.minimum.at
+    (without NumPy installed, 'numpy' runs the classic loop instead).
+    edges may also be a weighted CSRGraph.
+
+    Raises ValueError for an unknown mode or an unweighted CSRGraph.
+    """
+    _check_edges(edges, mode, ('classic', 'spfa', 'numpy'))
+    if mode == 'spfa':
+        return _bellman_ford_spfa(n, edges, start)
+    if mode == 'numpy' and np is not None:
+        # n rounds: the n-th one only proves convergence (or finds a cycle)
+        dist, converged, integral = _relax_rounds_numpy(n, edges, start, n)
+        return _distances_from_array(dist, integral) if converged else None
+
+    if isinstance(edges, CSRGraph):
+        edges = list(edges.edges())
+
     # Initialize distances
     distances = {i: float('inf') for i in range(n)}
     distances[start] = 0
 
     # Relax edges V-1 times
     for _ in range(n - 1):
+        changed = False
         for source, target, weight in edges:
             if distances[source] != float('inf') and distances[source] + weight < distances[target]:
                 distances[target] = distances[source] + weight
+                changed = True
+        if not changed:
+            break  # Settled early - the negative-cycle check below still passes
 
     # Check for negative cycle
     for source, target, weight in edges:
@@ -417,6 +699,11 @@ Algorithm:
 
 Time: O(K*E)
 Space: O(V)
+
+Frontier mode: a vertex can only improve in round i+1 if one of its
+in-neighbours improved in round i. So keep just the vertices that
+improved last round and relax their out-edges - no full-list copy,
+and rounds touch only the live part of the graph.
 """
 
 
@@ -431,7 +718,7 @@ def findCheapestPrice(n: int, flights: List[List[int]], src: int, dst: int, k: i
 
     Args:
         n: Number of cities
-        flights: List of [from, to, price] edges
+        flights: List of [from, to, price] edges (or a weighted CSRGraph)
         src: Source city
         dst: Destination city
         k: Maximum stops allowed
@@ -449,18 +736,39 @@ def findCheapestPrice(n: int, flights: List[List[int]], src: int, dst: int, k: i
 
 
 # TEACHER'S SOLUTION:
-def findCheapestPrice_solution(n: int, flights: List[List[int]], src: int, dst: int, k: int) -> int:
-    """Cheapest flights with k stops using Bellman-Ford variant"""
+def findCheapestPrice_solution(n: int, flights: List[List[int]], src: int, dst: int, k: int,
+                               mode: str = 'classic') -> int:
+    """
+    Cheapest flights with k stops using Bellman-Ford variant
+
+    mode='frontier' only relaxes out-edges of cities improved in the previous
+    round; mode='numpy' runs each round with np.minimum.at over edge arrays
+    (without NumPy installed, 'numpy' runs the classic loop instead).
+
+    Raises ValueError for an unknown mode or an unweighted CSRGraph.
+    """
+    _check_edges(flights, mode, ('classic', 'frontier', 'numpy'))
+    if mode == 'frontier':
+        return _cheapest_price_frontier(n, flights, src, dst, k)
+    if mode == 'numpy' and np is not None:
+        prices, _, integral = _relax_rounds_numpy(n, flights, src, k + 1)
+        if prices[dst] == np.inf:
+            return -1
+        return int(prices[dst]) if integral else float(prices[dst])
+
     # Initialize prices
     prices = [float('inf')] * n
     prices[src] = 0
 
+    # A CSRGraph (e.g. memory-mapped) is streamed edge by edge, never copied
+    csr = isinstance(flights, CSRGraph)
+
     # Relax edges k+1 times (k stops = k+1 flights)
     for _ in range(k + 1):
         # Create copy to avoid using updated values in same iteration
         new_prices = prices[:]
 
-        for source, target, price in flights:
+        for source, target, price in (flights.edges() if csr else flights):
             if prices[source] != float('inf') and prices[source] + price < new_prices[target]:
                 new_prices[target] = prices[source] + price
 
@@ -469,8 +777,605 @@ def findCheapestPrice_solution(n: int, flights: List[List[int]], src: int, dst:
     return prices[dst] if prices[dst] != float('inf') else -1
 
 
+def _cheapest_price_frontier(n: int, flights, src: int, dst: int, k: int) -> int:
+    """k-hop bounded relaxation that only expands last round's improvements"""
+    adjacency = _weighted_adjacency(n, flights)
+    prices = [float('inf')] * n
+    prices[src] = 0
+    frontier = [src]
+
+    for _ in range(k + 1):
+        if not frontier:
+            break
+
+        # Improvements are buffered so this round reads last round's prices
+        improved = {}
+        for u in frontier:
+            base = prices[u]
+            for v, price in adjacency[u]:
+                candidate = base + price
+                if candidate < prices[v] and candidate < improved.get(v, float('inf')):
+                    improved[v] = candidate
+
+        for v, price in improved.items():
+            prices[v] = price
+        frontier = list(improved)
+
+    return prices[dst] if prices[dst] != float('inf') else -1
+
+
 # =============================================================================
-# PART 6: TESTING
+# PART 6: POINT-TO-POINT SEARCH (BIDIRECTIONAL DIJKSTRA AND A*)
+# =============================================================================
+
+"""
+CONCEPT: Stop Early When You Only Need One Path
+================================================
+
+dijkstra_solution computes distances to EVERY vertex. For a routing query
+(one source, one target) that is wasted work: Dijkstra may stop the moment
+the target is popped, because its distance is then final.
+
+Two ways to settle far fewer nodes:
+
+1. BIDIRECTIONAL DIJKSTRA
+   - Search forward from source AND backward from target (on reversed edges)
+   - Always expand the side with the smaller frontier key
+   - Track best = min over meeting edges of d_f[u] + w(u,v) + d_b[v]
+   - Stop when top_forward + top_backward >= best
+   - Each search covers a ball of radius ~d/2: in a road network that is
+     about half the area of one radius-d ball
+
+2. A* SEARCH
+   - Dijkstra with priority g(v) + h(v), where h(v) estimates dist(v, target)
+   - h must be ADMISSIBLE (never overestimates), e.g. straight-line distance
+     when edge weights are road lengths
+   - The search is pulled toward the target instead of growing in a circle
+   - h = 0 reduces A* to plain Dijkstra
+
+Example:
+    coords = {0: (0, 0), 1: (1, 0), 2: (2, 0), 3: (0, 5)}
+    h = euclidean_heuristic(coords, target=2)
+    astar_solution(graph, 0, 2, h) → (2, [0, 1, 2]) without settling 3
+
+Time: O((V + E) log V) worst case, usually far less
+Space: O(V)
+"""
+
+
+def euclidean_heuristic(coords: Dict[int, Tuple[float, float]], target: int) -> Callable[[int], float]:
+    """
+    Straight-line distance to target - admissible when every edge weight is
+    at least the Euclidean length between its endpoints
+    """
+    tx, ty = coords[target]
+
+    def h(node: int) -> float:
+        x, y = coords[node]
+        return math.hypot(x - tx, y - ty)
+
+    return h
+
+
+def _reverse_graph(graph) -> Dict[int, List[Tuple[int, int]]]:
+    """Reverse every (neighbor, weight) edge of a weighted adjacency list"""
+    reverse = defaultdict(list)
+    for u, neighbors in graph.items():
+        for v, weight in neighbors:
+            reverse[v].append((u, weight))
+    return reverse
+
+
+def _build_path(parent: Dict[int, int], node: int) -> List[int]:
+    """Follow parent pointers back to the root and return the path root → node"""
+    path = [node]
+    while parent[node] is not None:
+        node = parent[node]
+        path.append(node)
+    path.reverse()
+    return path
+
+
+def astar(graph: Dict[int, List[Tuple[int, int]]], start: int, end: int,
+          heuristic: Callable[[int], float]) -> Tuple[float, List[int]]:
+    """
+    Shortest path from start to end using A* search
+
+    Example:
+        graph = {0: [(1, 1), (3, 5)], 1: [(2, 1)], 2: [], 3: []}
+        astar(graph, 0, 2, lambda v: 0) → (2, [0, 1, 2])
+
+    Args:
+        graph: Adjacency list with (neighbor, weight) tuples
+        start: Source vertex
+        end: Target vertex
+        heuristic: h(v) - admissible estimate of dist(v, end)
+
+    Returns:
+        (distance, path) - (inf, []) if end is unreachable
+
+    Time: O((V + E) log V) worst case
+    Space: O(V)
+    """
+    # TODO: Same as Dijkstra, but heap key = g + heuristic(vertex)
+    # TODO: Stop as soon as end is popped
+    # TODO: Rebuild the path from parent pointers
+    pass
+
+
+# TEACHER'S SOLUTION:
+def astar_solution(graph: Dict[int, List[Tuple[int, int]]], start: int, end: int,
+                   heuristic: Callable[[int], float],
+                   stats: Optional[Dict[str, int]] = None) -> Tuple[float, List[int]]:
+    """A* search - Dijkstra guided toward the target by an admissible heuristic"""
+    g = {start: 0}
+    parent = {start: None}
+    heap = [(heuristic(start), 0, start)]  # (f = g + h, g, vertex)
+    settled = 0
+
+    while heap:
+        _, current_g, node = heapq.heappop(heap)
+
+        # Skip stale entries (a shorter g was found after this push)
+        if current_g > g[node]:
+            continue
+        settled += 1
+
+        if node == end:
+            if stats is not None:
+                stats['settled'] = settled
+            return current_g, _build_path(parent, end)
+
+        for neighbor, weight in graph.get(node, ()):
+            candidate = current_g + weight
+            if candidate < g.get(neighbor, float('inf')):
+                g[neighbor] = candidate
+                parent[neighbor] = node
+                heapq.heappush(heap, (candidate + heuristic(neighbor), candidate, neighbor))
+
+    if stats is not None:
+        stats['settled'] = settled
+    return float('inf'), []
+
+
+def bidirectional_dijkstra(graph: Dict[int, List[Tuple[int, int]]], start: int, end: int,
+                           reverse_graph: Dict[int, List[Tuple[int, int]]] = None) -> Tuple[float, List[int]]:
+    """
+    Shortest path from start to end searching from both ends at once
+
+    Example:
+        graph = {0: [(1, 1), (3, 5)], 1: [(2, 1)], 2: [], 3: []}
+        bidirectional_dijkstra(graph, 0, 2) → (2, [0, 1, 2])
+
+    Args:
+        graph: Adjacency list with (neighbor, weight) tuples
+        start: Source vertex
+        end: Target vertex
+        reverse_graph: Graph with every edge reversed (built if omitted;
+                       pass graph itself for undirected graphs)
+
+    Returns:
+        (distance, path) - (inf, []) if end is unreachable
+
+    Time: O((V + E) log V) worst case
+    Space: O(V)
+    """
+    # TODO: Run a forward heap from start and a backward heap from end
+    # TODO: Expand the side whose top key is smaller
+    # TODO: On every relaxation, update best = d_f[u] + w + d_b[v] if both sides reached v
+    # TODO: Stop when top_forward + top_backward >= best
+    pass
+
+
+# TEACHER'S SOLUTION:
+def bidirectional_dijkstra_solution(graph: Dict[int, List[Tuple[int, int]]], start: int, end: int,
+                                    reverse_graph: Dict[int, List[Tuple[int, int]]] = None,
+                                    stats: Optional[Dict[str, int]] = None) -> Tuple[float, List[int]]:
+    """Bidirectional Dijkstra with the top_f + top_b >= best stopping rule"""
+    if start == end:
+        if stats is not None:
+            stats['settled'] = 0
+        return 0, [start]
+
+    if reverse_graph is None:
+        reverse_graph = _reverse_graph(graph)
+
+    # Index 0 = forward search, 1 = backward search
+    graphs = (graph, reverse_graph)
+    dist = ({start: 0}, {end: 0})
+    parent = ({start: None}, {end: None})
+    heaps = ([(0, start)], [(0, end)])
+    done = (set(), set())
+
+    best = float('inf')
+    meeting = None
+    settled = 0
+
+    while heaps[0] and heaps[1]:
+        # Every remaining path costs at least top_f + top_b
+        if heaps[0][0][0] + heaps[1][0][0] >= best:
+            break
+
+        side = 0 if heaps[0][0][0] <= heaps[1][0][0] else 1
+        current_dist, node = heapq.heappop(heaps[side])
+        if node in done[side]:
+            continue
+        done[side].add(node)
+        settled += 1
+
+        this_dist, other_dist = dist[side], dist[1 - side]
+        for neighbor, weight in graphs[side].get(node, ()):
+            candidate = current_dist + weight
+            if candidate < this_dist.get(neighbor, float('inf')):
+                this_dist[neighbor] = candidate
+                parent[side][neighbor] = node
+                heapq.heappush(heaps[side], (candidate, neighbor))
+
+            # Meeting point: neighbor already reached from the other side
+            if neighbor in other_dist and candidate + other_dist[neighbor] < best:
+                best = candidate + other_dist[neighbor]
+                meeting = (node, neighbor) if side == 0 else (neighbor, node)
+
+    if stats is not None:
+        stats['settled'] = settled
+    if meeting is None:
+        return float('inf'), []
+
+    # Stitch start → u (forward tree), edge u → v, v → end (backward tree)
+    u, v = meeting
+    path = _build_path(parent[0], u)
+    node = v
+    while node is not None:
+        path.append(node)
+        node = parent[1][node]
+    return best, path
+
+
+def shortest_path_query(graph: Dict[int, List[Tuple[int, int]]], start: int, end: int,
+                        method: str = 'bidirectional',
+                        heuristic: Callable[[int], float] = None,
+                        reverse_graph: Dict[int, List[Tuple[int, int]]] = None,
+                        stats: Optional[Dict[str, int]] = None) -> Tuple[float, List[int]]:
+    """
+    Point-to-point shortest path with early termination
+
+    Args:
+        method: 'dijkstra' (unidirectional, stops at end), 'bidirectional' or 'astar'
+        heuristic: required for 'astar'
+        reverse_graph: optional prebuilt reverse graph for 'bidirectional'
+        stats: optional dict, receives the number of settled nodes
+
+    Returns:
+        (distance, path) - (inf, []) if end is unreachable
+    """
+    if method == 'bidirectional':
+        return bidirectional_dijkstra_solution(graph, start, end, reverse_graph, stats)
+    if method == 'astar':
+        if heuristic is None:
+            raise ValueError("method='astar' needs a heuristic")
+        return astar_solution(graph, start, end, heuristic, stats)
+    if method == 'dijkstra':
+        return astar_solution(graph, start, end, lambda node: 0, stats)
+    raise ValueError(f"unknown method: {method!r}")
+
+
+# =============================================================================
+# PART 7: BENCHMARKS - HEAPS AND BELLMAN-FORD MODES
+# =============================================================================
+
+def benchmark_dijkstra_heaps(n: int = 2000, avg_degree: int = 50, seed: int = 0) -> Dict[str, Dict[str, float]]:
+    """
+    Compare peak heap size and runtime of lazy-deletion vs indexed-heap Dijkstra
+
+    Uses a random directed graph with n vertices and about n * avg_degree
+    edges. Higher avg_degree → more relaxations per vertex → the lazy heap
+    collects more stale entries.
+
+    Returns:
+        {'lazy': {'seconds', 'peak_heap'}, 'indexed': {...}}
+    """
+    rng = random.Random(seed)
+    graph = {u: [(rng.randrange(n), rng.randint(1, 1000)) for _ in range(avg_degree)] for u in range(n)}
+
+    results = {}
+    for name, indexed in (('lazy', False), ('indexed', True)):
+        stats = {}
+        began = time.perf_counter()
+        distances = dijkstra_solution(graph, 0, use_indexed_heap=indexed, stats=stats)
+        results[name] = {'seconds': time.perf_counter() - began, 'peak_heap': stats['peak_heap']}
+        results[name]['checksum'] = sum(d for d in distances.values() if d != float('inf'))
+
+    assert results['lazy']['checksum'] == results['indexed']['checksum']
+
+    print(f"Dijkstra heaps: V={n}, E={n * avg_degree}")
+    for name, row in results.items():
+        print(f"  {name:8s} {row['seconds'] * 1000:8.1f} ms   peak heap {row['peak_heap']}")
+    return results
+
+
+def benchmark_bellman_ford(n: int = 20000, avg_degree: int = 10, seed: int = 0) -> Dict[str, float]:
+    """
+    Time bellmanFord_solution in classic, spfa and numpy modes
+
+    Weights are 1..100 shifted by a random vertex potential, so the graph has
+    negative edges but no negative cycle - the arbitrage-scan shape.
+
+    Returns:
+        {mode: seconds}
+    """
+    rng = random.Random(seed)
+    potential = [rng.randint(0, 50) for _ in range(n)]
+    edges = []
+    for u in range(n):
+        for _ in range(avg_degree):
+            v = rng.randrange(n)
+            edges.append([u, v, rng.randint(1, 100) + potential[u] - potential[v]])
+
+    results, reference = {}, None
+    for mode in ('classic', 'spfa', 'numpy'):
+        began = time.perf_counter()
+        distances = bellmanFord_solution(n, edges, 0, mode=mode)
+        results[mode] = time.perf_counter() - began
+        reference = reference or distances
+        assert distances == reference
+
+    print(f"Bellman-Ford: V={n}, E={len(edges)}")
+    for mode, seconds in results.items():
+        print(f"  {mode:8s} {seconds * 1000:8.1f} ms")
+    return results
+
+
+# =============================================================================
+# PART 8: CONTRACTION HIERARCHIES
+# =============================================================================
+
+"""
+CONCEPT: Contraction Hierarchies (CH)
+======================================
+
+When the graph never changes but we ask millions of shortest-path queries,
+pay once for preprocessing and make every query tiny.
+
+PREPROCESSING - contract vertices one at a time, least important first:
+1. Pick v with the smallest priority
+   priority = edge difference (shortcuts added - edges removed)
+              + number of already-contracted neighbors (spreads work evenly)
+2. For every remaining in-neighbor u and out-neighbor w of v:
+   - Is u→v→w the ONLY shortest u→w path? Run a small "witness" Dijkstra
+     from u that avoids v and is capped at cost d(u,v) + d(v,w)
+   - No witness found → add SHORTCUT u→w with weight d(u,v) + d(v,w)
+3. Remove v; its rank is the order in which it was contracted
+
+Example: path 0 -(1)- 1 -(1)- 2, contract 1 first
+    → shortcut 0→2 (weight 2), 1 gets the lowest rank
+
+QUERY - bidirectional Dijkstra that only climbs:
+- Forward search from s uses edges to HIGHER-ranked vertices
+- Backward search from t uses reversed edges to HIGHER-ranked vertices
+- Answer = min over vertices x reached by both of d_f[x] + d_b[x]
+Every shortest path has a version "up, then down" through shortcuts, so
+the two upward searches always meet at its highest-ranked vertex.
+
+Both upward graphs are stored as CSRGraph, so a hierarchy is written with
+the CSR file format (PART 5 of module 1) and loaded back through mmap.
+
+Preprocessing: roughly O(V * witness search), done once
+Query: settles a few hundred vertices even on continental road networks
+"""
+
+
+class ContractionHierarchy:
+    """
+    Contraction hierarchy over vertices 0..n-1
+
+    Example:
+        ch = ContractionHierarchy.build(graph, n)
+        ch.query(0, 3) → same value as dijkstra_solution(graph, 0)[3]
+        ch.save("roads")            # roads.up.csrg + roads.down.csrg
+        ch = ContractionHierarchy.load("roads")
+    """
+
+    WITNESS_SETTLE_LIMIT = 500
+
+    def __init__(self, n: int, upward: CSRGraph, downward: CSRGraph, rank: List[int] = None):
+        """upward: u→w with rank[w] > rank[u]; downward: reversed edges, also pointing up"""
+        self.n = n
+        self.upward = upward
+        self.downward = downward
+        self.rank = rank
+
+    @classmethod
+    def build(cls, graph, n: int) -> "ContractionHierarchy":
+        """
+        Contract every vertex of a directed graph
+
+        Args:
+            graph: Adjacency list with (neighbor, weight) tuples, or plain
+                   neighbor ids for an unweighted graph (weight 1)
+            n: Number of vertices (0 to n-1)
+
+        Time: roughly O(V * witness search)
+        Space: O(V + E + shortcuts)
+        """
+        out_edges = [dict() for _ in range(n)]
+        in_edges = [dict() for _ in range(n)]
+        for u in range(n):
+            for item in graph.get(u, ()):
+                v, weight = item if isinstance(item, tuple) else (item, 1)
+                # Keep the cheapest parallel edge, drop self-loops
+                if u != v and weight < out_edges[u].get(v, float('inf')):
+                    out_edges[u][v] = weight
+                    in_edges[v][u] = weight
+
+        contracted = [False] * n
+        contracted_neighbors = [0] * n
+        rank = [0] * n
+        up_edges, down_edges = [], []
+
+        def witness_distances(source, skip, limit):
+            """Local Dijkstra from source avoiding skip, capped by cost and settle count"""
+            dist = {source: 0}
+            heap = [(0, source)]
+            settled = 0
+            while heap and settled < cls.WITNESS_SETTLE_LIMIT:
+                d, node = heapq.heappop(heap)
+                if d > dist[node]:
+                    continue
+                if d > limit:
+                    break
+                settled += 1
+                for neighbor, weight in out_edges[node].items():
+                    if neighbor == skip:
+                        continue
+                    candidate = d + weight
+                    if candidate < dist.get(neighbor, float('inf')):
+                        dist[neighbor] = candidate
+                        heapq.heappush(heap, (candidate, neighbor))
+            return dist
+
+        def shortcuts_for(v):
+            """Shortcuts (u, w, weight) needed if v were contracted now"""
+            needed = []
+            if not in_edges[v] or not out_edges[v]:
+                return needed
+            max_out = max(out_edges[v].values())
+            for u, weight_uv in in_edges[v].items():
+                dist = witness_distances(u, v, weight_uv + max_out)
+                for w, weight_vw in out_edges[v].items():
+                    if w == u:
+                        continue
+                    via_v = weight_uv + weight_vw
+                    if dist.get(w, float('inf')) > via_v:
+                        needed.append((u, w, via_v))
+            return needed
+
+        def priority(v):
+            edge_difference = len(shortcuts_for(v)) - len(in_edges[v]) - len(out_edges[v])
+            return edge_difference + contracted_neighbors[v]
+
+        heap = [(priority(v), v) for v in range(n)]
+        heapq.heapify(heap)
+        order = 0
+
+        while heap:
+            _, v = heapq.heappop(heap)
+            if contracted[v]:
+                continue
+
+            # Lazy update: priorities go stale as neighbors are contracted
+            current = priority(v)
+            if heap and current > heap[0][0]:
+                heapq.heappush(heap, (current, v))
+                continue
+
+            for u, w, weight in shortcuts_for(v):
+                if weight < out_edges[u].get(w, float('inf')):
+                    out_edges[u][w] = weight
+                    in_edges[w][u] = weight
+
+            # Every edge still touching v leads to a later (higher-ranked) vertex
+            for w, weight in out_edges[v].items():
+                up_edges.append((v, w, weight))
+                del in_edges[w][v]
+                contracted_neighbors[w] += 1
+            for u, weight in in_edges[v].items():
+                down_edges.append((v, u, weight))
+                del out_edges[u][v]
+                contracted_neighbors[u] += 1
+            out_edges[v].clear()
+            in_edges[v].clear()
+
+            contracted[v] = True
+            rank[v] = order
+            order += 1
+
+        upward = CSRGraph.from_edges(n, up_edges, directed=True, weighted=True)
+        downward = CSRGraph.from_edges(n, down_edges, directed=True, weighted=True)
+        return cls(n, upward, downward, rank)
+
+    def query(self, source: int, target: int, stats: Optional[Dict[str, int]] = None) -> float:
+        """
+        Shortest distance from source to target, inf if unreachable
+
+        Time: O(settled * log settled) - settled is tiny compared to V
+        """
+        if source == target:
+            return 0
+
+        graphs = (self.upward, self.downward)
+        dist = ({source: 0}, {target: 0})
+        heaps = ([(0, source)], [(0, target)])
+        best = float('inf')
+        settled = 0
+
+        while heaps[0] or heaps[1]:
+            # Pick the side with the smaller key; a side whose key reached best is done
+            side = 0 if heaps[0] and (not heaps[1] or heaps[0][0][0] <= heaps[1][0][0]) else 1
+            current_dist, node = heapq.heappop(heaps[side])
+            if current_dist >= best:
+                heaps[side].clear()
+                continue
+            if current_dist > dist[side][node]:
+                continue
+            settled += 1
+
+            other = dist[1 - side]
+            if node in other and current_dist + other[node] < best:
+                best = current_dist + other[node]
+
+            this_dist = dist[side]
+            for neighbor, weight in graphs[side][node]:
+                candidate = current_dist + weight
+                if candidate < this_dist.get(neighbor, float('inf')):
+                    this_dist[neighbor] = candidate
+                    heapq.heappush(heaps[side], (candidate, neighbor))
+
+        if stats is not None:
+            stats['settled'] = settled
+        return best
+
+    def save(self, prefix: str):
+        """Write prefix.up.csrg and prefix.down.csrg"""
+        self.upward.save(prefix + '.up.csrg')
+        self.downward.save(prefix + '.down.csrg')
+
+    @classmethod
+    def load(cls, prefix: str) -> "ContractionHierarchy":
+        """Map a saved hierarchy back in (zero-copy)"""
+        upward = CSRGraph.load(prefix + '.up.csrg')
+        downward = CSRGraph.load(prefix + '.down.csrg')
+        return cls(upward.n, upward, downward)
+
+    def close(self):
+        self.upward.close()
+        self.downward.close()
+
+
+def build_contraction_hierarchy(graph: Dict[int, List[Tuple[int, int]]], n: int) -> ContractionHierarchy:
+    """
+    Preprocess a static graph for fast point-to-point queries
+
+    Args:
+        graph: Adjacency list with (neighbor, weight) tuples
+        n: Number of vertices (0 to n-1)
+
+    Returns:
+        ContractionHierarchy - ch.query(s, t) gives the shortest distance
+    """
+    # TODO: Order vertices by edge difference
+    # TODO: Contract each vertex, adding shortcuts where no witness path exists
+    # TODO: Split the final edges into upward and downward graphs
+    pass
+
+
+# TEACHER'S SOLUTION:
+def build_contraction_hierarchy_solution(graph: Dict[int, List[Tuple[int, int]]], n: int) -> ContractionHierarchy:
+    """Contraction hierarchy preprocessing"""
+    return ContractionHierarchy.build(graph, n)
+
+
+# =============================================================================
+# PART 9: TESTING
 # =============================================================================
 
 def test_shortest_path():
@@ -528,6 +1433,166 @@ def test_shortest_path():
     assert result == 200
     print("✓ Cheapest flights test passed")
 
+    # Test CSR graph
+    print("\nTEST 6: Shortest Paths on CSRGraph")
+    csr = CSRGraph.from_edges(4, [[0, 1], [0, 2], [1, 3], [2, 3]], directed=True)
+    assert bfs_shortest_path_solution(csr, 0, 3) == 2
+    weighted = CSRGraph.from_edges(
+        4, [[0, 1, 4], [0, 2, 2], [1, 3, 1], [2, 1, 1], [2, 3, 5]], directed=True, weighted=True
+    )
+    result = dijkstra_solution(weighted, 0)
+    print(f"Dijkstra on CSR: {result}")
+    assert result == {0: 0, 1: 3, 2: 2, 3: 4}
+    print("✓ CSR shortest path test passed")
+
+    # Test memory-mapped graph file
+    print("\nTEST 7: Shortest Paths on a Memory-Mapped Graph")
+    import os
+    import tempfile
+    path = os.path.join(tempfile.mkdtemp(), "flights.csrg")
+    CSRGraph.from_edges(3, flights, directed=True, weighted=True).save(path)
+    with CSRGraph.load(path) as mapped:
+        assert dijkstra_solution(mapped, 0) == {0: 0, 1: 100, 2: 200}
+        assert findCheapestPrice_solution(3, mapped, 0, 2, 1) == 200
+        assert findCheapestPrice_solution(3, mapped, 0, 2, 0) == 500
+    os.remove(path)
+    print("✓ Memory-mapped shortest path test passed")
+
+    # Test point-to-point search
+    print("\nTEST 8: Bidirectional Dijkstra and A*")
+    graph = {
+        0: [(1, 4), (2, 2)],
+        1: [(3, 1)],
+        2: [(1, 1), (3, 5)],
+        3: []
+    }
+    for method in ('dijkstra', 'bidirectional'):
+        assert shortest_path_query(graph, 0, 3, method=method) == (4, [0, 2, 1, 3])
+    assert shortest_path_query(graph, 3, 0) == (float('inf'), [])
+
+    # 20x20 grid with unit edges: A* with straight-line distance settles fewer nodes
+    size = 20
+    coords = {r * size + c: (r, c) for r in range(size) for c in range(size)}
+    grid = defaultdict(list)
+    for r in range(size):
+        for c in range(size):
+            for dr, dc in ((0, 1), (1, 0)):
+                if r + dr < size and c + dc < size:
+                    u, v = r * size + c, (r + dr) * size + c + dc
+                    grid[u].append((v, 1))
+                    grid[v].append((u, 1))
+    source, target = 10 * size + 4, 10 * size + 16
+    expected = expected_grid = dijkstra_solution(grid, source)[target]
+    plain, bidir, guided = {}, {}, {}
+    h = euclidean_heuristic(coords, target)
+    assert shortest_path_query(grid, source, target, 'dijkstra', stats=plain)[0] == expected
+    assert shortest_path_query(grid, source, target, 'bidirectional', reverse_graph=grid, stats=bidir)[0] == expected
+    dist, path = shortest_path_query(grid, source, target, 'astar', heuristic=h, stats=guided)
+    assert dist == expected and len(path) == expected + 1
+    print(f"Settled nodes - dijkstra: {plain['settled']}, "
+          f"bidirectional: {bidir['settled']}, A*: {guided['settled']}")
+    assert guided['settled'] < plain['settled'] and bidir['settled'] < plain['settled']
+    print("✓ Point-to-point search test passed")
+
+    # Test indexed heap
+    print("\nTEST 9: Dijkstra with Indexed Heap")
+    heap = IndexedMinHeap(5)
+    for item, key in [(0, 5), (1, 3), (2, 7), (3, 1)]:
+        heap.insert(item, key)
+    heap.decrease_key(2, 0)
+    assert heap.push_or_decrease(4, 2) and not heap.push_or_decrease(1, 4)
+    order = []
+    while heap.size() > 0:
+        order.append(heap.extract_min()[1])
+    assert order == [2, 3, 4, 1, 0] and not heap.contains(2)
+    for start in grid:
+        assert dijkstra_solution(grid, start, use_indexed_heap=True) == dijkstra_solution(grid, start)
+    assert networkDelayTime_solution(times, 4, 2, use_indexed_heap=True) == 2
+    assert networkDelayTime_solution([[1, 2, 1]], 2, 2, use_indexed_heap=True) == -1
+    results = benchmark_dijkstra_heaps(n=300, avg_degree=20)
+    assert results['indexed']['peak_heap'] <= 300
+    print("✓ Indexed heap test passed")
+
+    # Test contraction hierarchies against plain Dijkstra
+    print("\nTEST 10: Contraction Hierarchies (randomized)")
+    rng = random.Random(7)
+    for trial in range(40):
+        n = rng.randint(1, 25)
+        graph = {u: [] for u in range(n)}
+        for _ in range(rng.randint(0, 4 * n)):
+            graph[rng.randrange(n)].append((rng.randrange(n), rng.randint(0, 20)))
+        ch = build_contraction_hierarchy_solution(graph, n)
+        for s in range(n):
+            expected = dijkstra_solution(graph, s)
+            for t in range(n):
+                assert ch.query(s, t) == expected[t], (trial, s, t)
+    unweighted = {0: [1, 2], 1: [3], 2: [3], 3: []}
+    ch = ContractionHierarchy.build(unweighted, 4)
+    assert ch.query(0, 3) == bfs_shortest_path_solution(unweighted, 0, 3)
+
+    ch = build_contraction_hierarchy_solution(grid, size * size)
+    prefix = os.path.join(tempfile.mkdtemp(), "grid")
+    ch.save(prefix)
+    loaded = ContractionHierarchy.load(prefix)
+    query_stats = {}
+    assert loaded.query(source, target, stats=query_stats) == expected_grid
+    print(f"Grid query settled {query_stats['settled']} nodes (Dijkstra: {plain['settled']})")
+    loaded.close()
+    print("✓ Contraction hierarchy test passed")
+
+    # Test Bellman-Ford modes against the classic relaxation
+    print("\nTEST 11: Bellman-Ford Modes (randomized)")
+    edges = [[0, 1, 4], [0, 2, 2], [1, 2, -3], [1, 3, 2], [2, 3, 4]]
+    for mode in ('spfa', 'numpy'):
+        assert bellmanFord_solution(4, edges, 0, mode=mode) == {0: 0, 1: 4, 2: 1, 3: 5}
+    for trial in range(60):
+        n = rng.randint(1, 20)
+        potential = [rng.randint(0, 10) for _ in range(n)]
+        edges = [[u, v, rng.randint(0, 15) + potential[u] - potential[v]]
+                 for u, v in ((rng.randrange(n), rng.randrange(n)) for _ in range(rng.randint(0, 4 * n)))]
+        expected = bellmanFord_solution(n, edges, 0)
+        assert bellmanFord_solution(n, edges, 0, mode='spfa') == expected, trial
+        assert bellmanFord_solution(n, edges, 0, mode='numpy') == expected, trial
+        dst, k = rng.randrange(n), rng.randint(0, n)
+        expected_price = findCheapestPrice_solution(n, edges, 0, dst, k)
+        for mode in ('frontier', 'numpy'):
+            assert findCheapestPrice_solution(n, edges, 0, dst, k, mode=mode) == expected_price, (trial, mode)
+
+    # Arbitrage: USD→EUR→GBP→USD multiplies to > 1 → negative -log(rate) cycle
+    rates = [(0, 1, 0.9), (1, 2, 0.9), (2, 0, 1.3), (0, 3, 1.0)]
+    arbitrage = [[u, v, -math.log(rate)] for u, v, rate in rates]
+    for mode in ('classic', 'spfa', 'numpy'):
+        assert bellmanFord_solution(4, arbitrage, 0, mode=mode) is None, mode
+    fair = [[u, v, -math.log(rate)] for u, v, rate in [(0, 1, 0.9), (1, 0, 1.1), (0, 2, 2.0)]]
+    assert bellmanFord_solution(3, fair, 0, mode='spfa') is not None
+
+    csr = CSRGraph.from_edges(3, flights, directed=True, weighted=True)
+    assert bellmanFord_solution(3, csr, 0, mode='spfa') == {0: 0, 1: 100, 2: 200}
+    assert findCheapestPrice_solution(3, csr, 0, 2, 0, mode='frontier') == 500
+    assert findCheapestPrice_solution(3, csr, 0, 2, 1, mode='numpy') == 200
+
+    # Bad input fails fast with one clear error in every mode
+    unweighted = CSRGraph.from_edges(3, [[0, 1], [1, 2]], directed=True)
+    for mode in ('classic', 'spfa', 'numpy', 'nonsense'):
+        try:
+            bellmanFord_solution(3, unweighted, 0, mode=mode)
+            assert False, mode
+        except ValueError:
+            pass
+    for mode in ('classic', 'frontier', 'numpy', 'nonsense'):
+        try:
+            findCheapestPrice_solution(3, unweighted, 0, 2, 1, mode=mode)
+            assert False, mode
+        except ValueError:
+            pass
+    try:
+        bellmanFord_solution(4, edges, 0, mode='nonsense')
+        assert False, "unknown mode must be rejected"
+    except ValueError:
+        pass
+    benchmark_bellman_ford(n=2000, avg_degree=10)
+    print("✓ Bellman-Ford modes test passed")
+
     print("\n" + "=" * 60)
 
 
@@ -535,3 +1600,5 @@ if __name__ == "__main__":
     print("Welcome to Module 7: Shortest Path Algorithms!")
     print("Master Dijkstra, Bellman-Ford, and variants!")
     print("\nComplete the TODOs, then run test_shortest_path()")
+    print("Run benchmark_dijkstra_heaps() to compare lazy vs indexed heaps")
+    print("Run benchmark_bellman_ford() to compare Bellman-Ford modes")
@@ -0,0 +1,662 @@
+"""
+Module 8: Minimum Spanning Tree (MST) - Interactive Practice
+=============================================================
+
+Connect every vertex at the lowest total cost!
+
+In this module, we'll cover:
+1. What a minimum spanning tree is (and the cut property behind it)
+2. Kruskal's algorithm: sort edges + Union-Find
+3. Kruskal on graphs larger than RAM (sorted runs streamed from disk)
+4. Prim's algorithm with a lazy heap and with an indexed heap
+5. Applications: LC 1135, LC 1584
+6. Benchmark: Kruskal vs Prim on sparse and dense inputs
+
+MST is essential for: network design, clustering, approximation algorithms!
+"""
+
+import heapq
+import os
+import random
+import struct
+import tempfile
+import time
+from operator import itemgetter
+from typing import Dict, Iterable, List, Optional, Tuple
+
+try:
+    import numpy as np
+except ImportError:  # kruskal_solution falls back to sorted()
+    np = None
+
+from module6_union_find import UnionFindSolution
+from module7_shortest_path import IndexedMinHeap
+
+# =============================================================================
+# PART 1: MST CONCEPT
+# =============================================================================
+
+"""
+CONCEPT: Minimum Spanning Tree
+===============================
+
+Given a connected, undirected, weighted graph:
+- Spanning tree: a subset of edges that connects ALL vertices, no cycles
+  (exactly V-1 edges)
+- Minimum spanning tree: the spanning tree with the smallest total weight
+
+Example:
+    0 --1-- 1
+    |     / |
+    4   2   5
+    | /     |
+    2 --3-- 3
+
+Edges: (0,1,1), (1,2,2), (0,2,4), (2,3,3), (1,3,5)
+MST:   (0,1,1), (1,2,2), (2,3,3)  → total = 6
+
+Cut property (why greedy works):
+- Split the vertices into any two groups
+- The lightest edge crossing between the groups is in SOME MST
+Both Kruskal and Prim just keep picking such "lightest crossing" edges.
+
+If the graph is disconnected there is no spanning tree; both algorithms
+below then return a minimum spanning FOREST (one tree per component).
+"""
+
+# =============================================================================
+# PART 2: KRUSKAL'S ALGORITHM
+# =============================================================================
+
+"""
+CONCEPT: Kruskal's Algorithm
+=============================
+
+Global greedy: look at edges from lightest to heaviest, keep an edge
+unless it would close a cycle.
+
+Algorithm:
+1. Sort all edges by weight
+2. Union-Find with every vertex in its own set
+3. For each edge (u, v, w) in sorted order:
+   - find(u) != find(v) → different trees, take the edge, union(u, v)
+   - otherwise → the edge would form a cycle, skip it
+4. Stop after V-1 edges
+
+Bulk sort: with NumPy the edge list becomes one (E, 3) array and the
+sort is a single argsort on the weight column - no per-edge key calls.
+
+Time: O(E log E) for the sort + O(E α(V)) for Union-Find
+Space: O(V) for Union-Find (+ the edge array)
+"""
+
+
+def kruskal_from_sorted(n: int, sorted_edges: Iterable) -> Tuple[float, List[Tuple[int, int, float]]]:
+    """
+    Kruskal's main loop over edges already in non-decreasing weight order
+
+    sorted_edges can be any iterable (a list, a generator streaming from
+    disk, ...). Only the Union-Find and the chosen edges are kept in memory.
+
+    Returns:
+        (total weight, [(u, v, w), ...] chosen edges)
+    """
+    uf = UnionFindSolution(n)
+    total = 0
+    tree = []
+
+    for u, v, w in sorted_edges:
+        if uf.find(u) == uf.find(v):
+            continue  # Would form a cycle
+        uf.union(u, v)
+        total += w
+        tree.append((u, v, w))
+        if len(tree) == n - 1:
+            break  # Spanning tree complete - ignore the rest of the stream
+
+    return total, tree
+
+
+def kruskal(n: int, edges: List[List[int]]) -> Tuple[int, List[Tuple[int, int, int]]]:
+    """
+    Minimum spanning tree with Kruskal's algorithm
+
+    Example:
+        n = 4, edges = [[0,1,1],[1,2,2],[0,2,4],[2,3,3],[1,3,5]]
+        Returns: (6, [(0,1,1), (1,2,2), (2,3,3)])
+
+    Args:
+        n: Number of vertices
+        edges: List of [u, v, weight] undirected edges
+
+    Returns:
+        (total weight, list of chosen (u, v, w) edges)
+
+    Time: O(E log E)
+    Space: O(V + E)
+    """
+    # TODO: Sort edges by weight
+    # TODO: UnionFindSolution(n)
+    # TODO: Take each edge whose endpoints have different roots, union them
+    # TODO: Stop after n-1 edges
+    pass
+
+
+# TEACHER'S SOLUTION:
+def kruskal_solution(n: int, edges: List[List[int]]) -> Tuple[int, List[Tuple[int, int, int]]]:
+    """Kruskal: bulk sort by weight, then Union-Find"""
+    if np is not None and len(edges):
+        table = np.asarray(edges).reshape(-1, 3)
+        order = np.argsort(table[:, 2], kind='stable')
+        # Endpoints stay ints even when the weight column is float
+        sources = table[order, 0].astype(np.int64).tolist()
+        targets = table[order, 1].astype(np.int64).tolist()
+        return kruskal_from_sorted(n, zip(sources, targets, table[order, 2].tolist()))
+
+    return kruskal_from_sorted(n, sorted(edges, key=itemgetter(2)))
+
+
+# =============================================================================
+# PART 3: KRUSKAL FOR GRAPHS LARGER THAN RAM
+# =============================================================================
+
+"""
+CONCEPT: External-Memory Kruskal
+=================================
+
+Kruskal only needs two things in memory:
+- the Union-Find: O(V)
+- the edges, ONE AT A TIME, in weight order
+
+So when E does not fit in RAM, sort the edges on disk (external merge sort)
+and stream them:
+
+1. Spill: read edges in chunks that fit in RAM, sort each chunk by weight,
+   write it to disk as a sorted "run" (fixed 24-byte records: u, v, w)
+2. Merge: open every run and heapq.merge them by weight
+   → one globally sorted stream, read in blocks
+3. Feed the stream to the normal Kruskal loop - it stops reading as soon
+   as V-1 edges are chosen
+
+Memory: O(V + chunk_size + runs * block)
+I/O: every edge is written once and read at most once
+"""
+
+_EDGE_RECORD = struct.Struct('<qqd')  # u, v, weight
+
+
+def spill_sorted_runs(edges: Iterable, directory: str, chunk_size: int = 1_000_000) -> List[str]:
+    """
+    Write edges to disk as weight-sorted runs of at most chunk_size edges
+
+    Args:
+        edges: iterable of (u, v, w) - may itself be streamed from a file
+        directory: where to create the run files
+        chunk_size: edges sorted in memory at once
+
+    Returns:
+        List of run file paths
+    """
+    paths = []
+    chunk = []
+
+    def flush():
+        chunk.sort(key=itemgetter(2))
+        path = os.path.join(directory, f"run{len(paths):05d}.edges")
+        with open(path, 'wb') as f:
+            f.write(b''.join(_EDGE_RECORD.pack(u, v, w) for u, v, w in chunk))
+        paths.append(path)
+        chunk.clear()
+
+    for edge in edges:
+        chunk.append(edge)
+        if len(chunk) == chunk_size:
+            flush()
+    if chunk:
+        flush()
+
+    return paths
+
+
+def read_edge_run(path: str, block: int = 65536):
+    """Yield (u, v, w) from a run file, reading block records at a time"""
+    with open(path, 'rb') as f:
+        while True:
+            data = f.read(block * _EDGE_RECORD.size)
+            if not data:
+                return
+            yield from _EDGE_RECORD.iter_unpack(data)
+
+
+def kruskal_external(n: int, edges: Iterable, directory: Optional[str] = None,
+                     chunk_size: int = 1_000_000) -> Tuple[float, List[Tuple[int, int, float]]]:
+    """
+    MST when the edge list does not fit in memory
+
+    Example:
+        kruskal_external(4, edges_from_file(...), chunk_size=10**6)
+
+    Args:
+        n: Number of vertices (Union-Find stays in RAM)
+        edges: iterable of (u, v, w), e.g. a generator over a huge file
+        directory: scratch directory for sorted runs (temporary if None)
+        chunk_size: edges per in-memory sort
+
+    Returns:
+        (total weight, chosen edges) - same as kruskal_solution
+
+    Time: O(E log E) comparisons, O(E) sequential disk I/O
+    Space: O(V + chunk_size) memory
+    """
+    # TODO: spill_sorted_runs into the scratch directory
+    # TODO: heapq.merge the runs by weight (key=itemgetter(2))
+    # TODO: kruskal_from_sorted(n, merged stream)
+    pass
+
+
+# TEACHER'S SOLUTION:
+def kruskal_external_solution(n: int, edges: Iterable, directory: Optional[str] = None,
+                              chunk_size: int = 1_000_000) -> Tuple[float, List[Tuple[int, int, float]]]:
+    """External merge sort of the edges, then stream them through Kruskal"""
+    with tempfile.TemporaryDirectory(dir=directory) as scratch:
+        runs = spill_sorted_runs(edges, scratch, chunk_size)
+        merged = heapq.merge(*(read_edge_run(path) for path in runs), key=itemgetter(2))
+        total, tree = kruskal_from_sorted(n, merged)
+        merged.close()  # Release the run files before the directory is removed
+    return total, tree
+
+
+# =============================================================================
+# PART 4: PRIM'S ALGORITHM
+# =============================================================================
+
+"""
+CONCEPT: Prim's Algorithm
+==========================
+
+Local greedy: grow ONE tree from a start vertex, always adding the
+lightest edge that leaves the tree.
+
+Algorithm:
+1. Start with vertex 0 in the tree
+2. Push its edges into a min-heap
+3. Pop the lightest edge (w, v):
+   - v already in the tree → skip (stale entry)
+   - else add v and the edge, push v's edges
+4. Repeat until the heap is empty (restart from any unvisited vertex
+   to get a forest on disconnected graphs)
+
+Looks like Dijkstra - but the key is the EDGE weight, not the distance.
+
+Lazy heap vs indexed heap (same trade-off as module 7's Dijkstra):
+- Lazy: push a new entry on every improvement → heap holds up to E
+  entries, stale ones are skipped on pop. O(E log E)
+- Indexed: one slot per vertex, decrease_key when a lighter edge to v
+  shows up → heap never exceeds V. O(E log V)
+  On dense graphs (E ≈ V²) the indexed heap saves a lot of memory.
+
+Time: O(E log V)
+Space: O(V) indexed, O(E) lazy
+"""
+
+
+def _prim_lazy(graph, n: int, stats: Optional[Dict[str, int]] = None):
+    """Prim with heapq entries (weight, vertex, parent) and lazy deletion"""
+    in_tree = bytearray(n)
+    total = 0
+    tree = []
+    peak = 0
+
+    for root in range(n):
+        if in_tree[root]:
+            continue
+        in_tree[root] = 1
+        heap = [(w, v, root) for v, w in graph.get(root, ())]
+        heapq.heapify(heap)
+
+        while heap:
+            peak = max(peak, len(heap))
+            w, v, parent = heapq.heappop(heap)
+            if in_tree[v]:
+                continue  # Stale entry - v was reached by a lighter edge
+
+            in_tree[v] = 1
+            total += w
+            tree.append((parent, v, w))
+            for neighbor, weight in graph.get(v, ()):
+                if not in_tree[neighbor]:
+                    heapq.heappush(heap, (weight, neighbor, v))
+
+    if stats is not None:
+        stats['peak_heap'] = peak
+    return total, tree
+
+
+def _prim_indexed(graph, n: int, stats: Optional[Dict[str, int]] = None):
+    """Prim with IndexedMinHeap: one slot per vertex, decrease_key on lighter edges"""
+    in_tree = bytearray(n)
+    best = [None] * n  # best[v] = (weight, parent) of the lightest edge into the tree
+    total = 0
+    tree = []
+    peak = 0
+    heap = IndexedMinHeap(n)
+
+    for root in range(n):
+        if in_tree[root]:
+            continue
+        heap.insert(root, 0)
+
+        while heap.size():
+            peak = max(peak, heap.size())
+            _, v = heap.extract_min()
+            in_tree[v] = 1
+            if best[v] is not None:
+                # Heap keys are floats; take the exact weight from best[]
+                weight, parent = best[v]
+                total += weight
+                tree.append((parent, v, weight))
+
+            for neighbor, weight in graph.get(v, ()):
+                if not in_tree[neighbor] and (best[neighbor] is None or weight < best[neighbor][0]):
+                    best[neighbor] = (weight, v)
+                    heap.push_or_decrease(neighbor, weight)
+
+    if stats is not None:
+        stats['peak_heap'] = peak
+    return total, tree
+
+
+def prim(graph: Dict[int, List[Tuple[int, int]]], n: int) -> Tuple[int, List[Tuple[int, int, int]]]:
+    """
+    Minimum spanning tree with Prim's algorithm
+
+    Example:
+        graph = {0: [(1,1),(2,4)], 1: [(0,1),(2,2),(3,5)],
+                 2: [(0,4),(1,2),(3,3)], 3: [(2,3),(1,5)]}
+        n = 4
+        Returns: (6, [(0,1,1), (1,2,2), (2,3,3)])
+
+    Args:
+        graph: Undirected weighted adjacency list {u: [(v, w), ...]}
+               (or a weighted CSRGraph)
+        n: Number of vertices
+
+    Returns:
+        (total weight, list of tree edges (parent, v, w))
+
+    Time: O(E log V)
+    Space: O(V + E)
+    """
+    # TODO: in_tree flags, heap of (weight, vertex, parent)
+    # TODO: Pop lightest edge, skip if vertex already in tree
+    # TODO: Add vertex + edge, push its edges to vertices not in the tree
+    pass
+
+
+# TEACHER'S SOLUTION:
+def prim_solution(graph: Dict[int, List[Tuple[int, int]]], n: int,
+                  use_indexed_heap: bool = False,
+                  stats: Optional[Dict[str, int]] = None) -> Tuple[int, List[Tuple[int, int, int]]]:
+    """Prim's algorithm using a lazy min-heap (or an indexed heap)"""
+    if use_indexed_heap:
+        return _prim_indexed(graph, n, stats)
+    return _prim_lazy(graph, n, stats)
+
+
+# =============================================================================
+# PART 5: CONNECTING CITIES WITH MINIMUM COST (LC 1135)
+# =============================================================================
+
+"""
+CONCEPT: Connecting Cities
+===========================
+
+Problem: n cities (1-indexed), connections [x, y, cost]. Return the
+minimum cost to connect all cities, or -1 if impossible.
+
+This is exactly MST + a connectivity check:
+- Kruskal picks n-1 edges → connected, answer = total
+- Fewer than n-1 edges → some city is unreachable → -1
+
+Time: O(E log E)
+Space: O(V)
+"""
+
+
+def minimumCost(n: int, connections: List[List[int]]) -> int:
+    """
+    Minimum cost to connect all cities
+
+    Example:
+        n = 3, connections = [[1,2,5],[1,3,6],[2,3,1]]
+        Returns: 6
+
+    Args:
+        n: Number of cities (labelled 1..n)
+        connections: List of [x, y, cost]
+
+    Returns:
+        int - minimum total cost, or -1 if cities cannot all be connected
+
+    Time: O(E log E)
+    Space: O(V)
+    """
+    # TODO: Shift labels to 0-indexed
+    # TODO: Run Kruskal, check that n-1 edges were chosen
+    pass
+
+
+# TEACHER'S SOLUTION:
+def minimumCost_solution(n: int, connections: List[List[int]]) -> int:
+    """Kruskal MST with a connectivity check"""
+    total, tree = kruskal_solution(n, [[x - 1, y - 1, cost] for x, y, cost in connections])
+    return total if len(tree) == n - 1 else -1
+
+
+# =============================================================================
+# PART 6: MIN COST TO CONNECT ALL POINTS (LC 1584)
+# =============================================================================
+
+"""
+CONCEPT: MST on a Complete Graph
+=================================
+
+Problem: points [x, y]; connecting two points costs their Manhattan
+distance. Return the minimum cost to connect all points.
+
+Every pair is an edge → E = V²/2. Kruskal must sort all of them.
+Prim with an indexed heap never holds more than V entries, and the
+edges never need to be materialized as a list.
+
+Example:
+    points = [[0,0],[2,2],[3,10],[5,2],[7,0]]
+    Returns: 20
+
+Time: O(V² log V)
+Space: O(V²) for the adjacency (O(V) with the dense O(V²) Prim variant)
+"""
+
+
+def minCostConnectPoints(points: List[List[int]]) -> int:
+    """
+    Minimum cost to connect all points (Manhattan distance)
+
+    Example:
+        points = [[0,0],[2,2],[3,10],[5,2],[7,0]]
+        Returns: 20
+
+    Args:
+        points: List of [x, y]
+
+    Returns:
+        int - minimum total cost
+
+    Time: O(V² log V)
+    Space: O(V²)
+    """
+    # TODO: Build the complete graph with Manhattan weights
+    # TODO: Run Prim (indexed heap keeps the heap at most V entries)
+    pass
+
+
+# TEACHER'S SOLUTION:
+def minCostConnectPoints_solution(points: List[List[int]]) -> int:
+    """Prim with an indexed heap on the complete graph"""
+    n = len(points)
+    graph = {
+        u: [(v, abs(x1 - x2) + abs(y1 - y2)) for v, (x2, y2) in enumerate(points) if v != u]
+        for u, (x1, y1) in enumerate(points)
+    }
+    return prim_solution(graph, n, use_indexed_heap=True)[0]
+
+
+# =============================================================================
+# PART 7: BENCHMARK - KRUSKAL VS PRIM
+# =============================================================================
+
+def _random_connected_graph(n: int, m: int, rng: random.Random) -> List[List[int]]:
+    """n vertices, a random spanning path plus extra random edges (m total)"""
+    order = list(range(n))
+    rng.shuffle(order)
+    edges = [[order[i], order[i + 1], rng.randint(1, 10**6)] for i in range(n - 1)]
+    while len(edges) < m:
+        u, v = rng.randrange(n), rng.randrange(n)
+        if u != v:
+            edges.append([u, v, rng.randint(1, 10**6)])
+    return edges
+
+
+def benchmark_mst(n: int = 2000, sparse_degree: int = 4, dense_fraction: float = 0.25,
+                  seed: int = 0) -> Dict[str, Dict[str, float]]:
+    """
+    Time Kruskal (in-memory and external) and Prim (lazy and indexed)
+
+    sparse: about n * sparse_degree edges
+    dense:  about dense_fraction * n² / 2 edges
+
+    Returns:
+        {'sparse': {variant: seconds}, 'dense': {...}}
+    """
+    rng = random.Random(seed)
+    inputs = {
+        'sparse': _random_connected_graph(n, n * sparse_degree, rng),
+        'dense': _random_connected_graph(n, int(dense_fraction * n * n / 2), rng),
+    }
+
+    results = {}
+    for shape, edges in inputs.items():
+        graph = {u: [] for u in range(n)}
+        for u, v, w in edges:
+            graph[u].append((v, w))
+            graph[v].append((u, w))
+
+        variants = {
+            'kruskal': lambda: kruskal_solution(n, edges),
+            'kruskal_external': lambda: kruskal_external_solution(n, edges, chunk_size=max(1, len(edges) // 8)),
+            'prim_lazy': lambda: prim_solution(graph, n),
+            'prim_indexed': lambda: prim_solution(graph, n, use_indexed_heap=True),
+        }
+        results[shape] = {}
+        totals = set()
+        for name, run in variants.items():
+            began = time.perf_counter()
+            total, _ = run()
+            results[shape][name] = time.perf_counter() - began
+            totals.add(total)
+        assert len(totals) == 1, totals
+
+        print(f"MST {shape}: V={n}, E={len(edges)}")
+        for name, seconds in results[shape].items():
+            print(f"  {name:17s} {seconds * 1000:8.1f} ms")
+
+    return results
+
+
+# =============================================================================
+# PART 8: TESTING
+# =============================================================================
+
+def test_minimum_spanning_tree():
+    """Test all MST variants against each other"""
+    print("=" * 60)
+    print("MINIMUM SPANNING TREE TEST SUITE")
+    print("=" * 60)
+
+    # Test Kruskal
+    print("\nTEST 1: Kruskal's Algorithm")
+    edges = [[0, 1, 1], [1, 2, 2], [0, 2, 4], [2, 3, 3], [1, 3, 5]]
+    total, tree = kruskal_solution(4, edges)
+    print(f"Edges: {edges}")
+    print(f"MST: {tree}, total = {total}")
+    assert total == 6 and sorted(tree) == [(0, 1, 1), (1, 2, 2), (2, 3, 3)]
+    print("✓ Kruskal test passed")
+
+    # Test Prim
+    print("\nTEST 2: Prim's Algorithm (lazy and indexed heap)")
+    graph = {u: [] for u in range(4)}
+    for u, v, w in edges:
+        graph[u].append((v, w))
+        graph[v].append((u, w))
+    for indexed in (False, True):
+        total, tree = prim_solution(graph, 4, use_indexed_heap=indexed)
+        print(f"indexed={indexed}: MST {tree}, total = {total}")
+        assert total == 6 and len(tree) == 3
+    print("✓ Prim test passed")
+
+    # Test external Kruskal
+    print("\nTEST 3: External-Memory Kruskal")
+    total, tree = kruskal_external_solution(4, edges, chunk_size=2)
+    assert total == 6 and len(tree) == 3
+    print("✓ External Kruskal test passed")
+
+    # Test LeetCode problems
+    print("\nTEST 4: Connecting Cities / Connect All Points")
+    assert minimumCost_solution(3, [[1, 2, 5], [1, 3, 6], [2, 3, 1]]) == 6
+    assert minimumCost_solution(4, [[1, 2, 3], [3, 4, 4]]) == -1
+    assert minCostConnectPoints_solution([[0, 0], [2, 2], [3, 10], [5, 2], [7, 0]]) == 20
+    assert minCostConnectPoints_solution([[3, 12], [-2, 5], [-4, 1]]) == 18
+    print("✓ LeetCode MST tests passed")
+
+    # Randomized agreement (including disconnected graphs → forests)
+    print("\nTEST 5: All Variants Agree (randomized)")
+    from module1_graph_basics import CSRGraph
+    rng = random.Random(11)
+    for trial in range(80):
+        n = rng.randint(1, 30)
+        edges = [[rng.randrange(n), rng.randrange(n), rng.randint(1, 20)] for _ in range(rng.randint(0, 3 * n))]
+        graph = {u: [] for u in range(n)}
+        for u, v, w in edges:
+            graph[u].append((v, w))
+            graph[v].append((u, w))
+        expected, tree = kruskal_solution(n, edges)
+        assert kruskal_from_sorted(n, sorted(edges, key=itemgetter(2)))[0] == expected
+        assert kruskal_external_solution(n, edges, chunk_size=rng.randint(1, 10))[0] == expected
+        assert prim_solution(graph, n)[0] == expected, trial
+        assert prim_solution(graph, n, use_indexed_heap=True)[0] == expected, trial
+        csr = CSRGraph.from_edges(n, edges, weighted=True)
+        assert prim_solution(csr, n, use_indexed_heap=True)[0] == expected
+    float_edges = [[0, 1, 0.5], [1, 2, 0.25], [0, 2, 1.5]]
+    assert kruskal_solution(3, float_edges) == (0.75, [(1, 2, 0.25), (0, 1, 0.5)])
+    print("✓ Randomized agreement test passed")
+
+    # Benchmark
+    print("\nTEST 6: Benchmark (sparse vs dense)")
+    results = benchmark_mst(n=300)
+    assert set(results) == {'sparse', 'dense'}
+    lazy, indexed = {}, {}
+    points = [[rng.randint(0, 1000), rng.randint(0, 1000)] for _ in range(200)]
+    dense = {u: [(v, abs(x1 - x2) + abs(y1 - y2)) for v, (x2, y2) in enumerate(points) if v != u]
+             for u, (x1, y1) in enumerate(points)}
+    assert prim_solution(dense, 200, stats=lazy)[0] == prim_solution(dense, 200, True, stats=indexed)[0]
+    print(f"Peak heap on 200 points - lazy: {lazy['peak_heap']}, indexed: {indexed['peak_heap']}")
+    assert indexed['peak_heap'] <= 200 < lazy['peak_heap']
+    print("✓ Benchmark test passed")
+
+    print("\n" + "=" * 60)
+
+
+if __name__ == "__main__":
+    print("Welcome to Module 8: Minimum Spanning Tree!")
+    print("Master Kruskal and Prim - greedy algorithms that are provably optimal!")
+    print("\nComplete the TODOs, then run test_minimum_spanning_tree()")
+    print("Run benchmark_mst() to compare Kruskal and Prim variants")